@@ -1,6 +1,7 @@
 """
 ゲーム設定と定数
 """
+import os
 from enum import Enum
 
 
@@ -12,6 +13,11 @@ class GameConfig:
     SCREEN_HEIGHT = 810  # 1080*3/4
     FPS = 60
     
+    # ゲーム進行は1/FPS秒固定の更新で行い、描画はRENDER_FPSで行う（例: 30にすると2回更新ごとに1回描画）
+    # 描画が遅れた時は1フレームで最大MAX_CATCH_UP_STEPS回まで更新して追いつき、それ以上の遅れは捨てる
+    RENDER_FPS = 60
+    MAX_CATCH_UP_STEPS = 5
+    
     # プレイヤー設定
     PLAYER_RADIUS = 25  # ellipse_round/2
     PLAYER_MAX_HP = 3
@@ -40,6 +46,35 @@ class GameConfig:
     UI_BLOCK_SIZE = 10  # br
     HEART_SIZE = 15
     
+    # 画面転送設定（Trueでダーティ矩形のみ転送、面積比が閾値を超えたら全画面flip）
+    DIRTY_RECT_PRESENTATION = False
+    DIRTY_RECT_AREA_THRESHOLD = 0.5
+    
+    # ワールド（背景・敵・弾・エフェクト）の内部解像度の倍率。ウィンドウは常に画面サイズのまま
+    # 例: 0.5ならワールドを round(SCREEN_WIDTH*0.5) x round(SCREEN_HEIGHT*0.5) で描いて画面へ拡大（UIは等倍）
+    # 拡大の分だけ処理が増えるため、1.0未満で速くなるとは限らない（ソフトウェア描画の計測では遅くなった）
+    RENDER_SCALE = 1.0
+    RENDER_SMOOTH = False   # Trueでsmoothscale（ぼかし拡大）、Falseで最近傍拡大
+    
+    # 品質ガバナーの最終段階として、高負荷時にワールドの内部解像度を下げるか
+    # 拡大のコストが縮小描画で減る分を上回る環境（ソフトウェア描画など）では逆効果なので既定は無効
+    QUALITY_RENDER_SCALE_TIER = False
+    QUALITY_REDUCED_RENDER_SCALE = 0.5
+    
+    # 詳細度（LOD）切り替え：生存弾数またはフレーム時間の平均（ms）が上限を超えたら敵を簡易描画にする（弾は常に同じ描画）
+    LOD_BULLET_LIMIT = 200
+    LOD_FRAME_MS = 1000.0 / 60
+    
+    # 敵弾の番号が足りない時、最も古い生存弾を上書きするか（Falseなら新しい弾を発射しない）
+    ENEMY_BULLET_RECYCLE_OLDEST = False
+    
+    # 衝突判定の空間ハッシュ：セルの一辺（ピクセル）と、総当たりに切り替える登録数の上限
+    COLLISION_CELL_SIZE = 64
+    COLLISION_BRUTE_FORCE_LIMIT = 8
+    
+    # フォント解決結果のキャッシュファイル（起動間で共有）
+    FONT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.hippari_shooting', 'font_cache.json')
+    
     # 物理設定
     PHYSICS_FORCE = 0.2
     PHYSICS_SPRING_K = 1
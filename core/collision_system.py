@@ -9,6 +9,8 @@ from dataclasses import dataclass
 
 from config.settings import GameConfig
 from utils.math_utils import Vector2
+from utils.text_cache import render_text
+from utils.spatial_hash import SpatialHash, collision_stats
 
 
 @dataclass
@@ -34,6 +36,11 @@ class CollisionSystem:
         
         # グローバル変数（元のコード通り）
         self.velocity_b = 0  # 現在の弾の速度
+        
+        # 距離判定の候補を絞り込む空間ハッシュ（毎フレーム位置を同期し、セルが変わった物体だけ登録し直す）
+        self.projectile_grid = SpatialHash()
+        self.enemy_grid = SpatialHash()
+        self.boss_grid = SpatialHash()
     
     def check_projectile_enemy_collision(self, projectiles: List, enemies: List, 
                                        scene_manager) -> List[Tuple]:
@@ -55,18 +62,29 @@ class CollisionSystem:
         """
         collisions = []
         
+        # 判定対象の3発（元: for(int i=0;i<3;i++)）を番号をキーにして登録
+        self.projectile_grid.sync(
+            (i, projectile.position.x, projectile.position.y, 0)
+            for i, projectile in enumerate(projectiles[:3])
+            if getattr(projectile, 'active', False)
+        )
+        
         for enemy in enemies:
             if not enemy.active or enemy.hp <= 0:
                 continue
-                
-            hit_result = self._hit_enemy_original(enemy, projectiles, scene_manager)
+            
+            candidates = self.projectile_grid.query(enemy.position.x, enemy.position.y,
+                                                    enemy.radius + GameConfig.ELLIPSE_ROUND)
+            if not candidates:
+                continue
+            hit_result = self._hit_enemy_original(enemy, projectiles, scene_manager, candidates)
             if hit_result['hit']:
                 hit_projectile = projectiles[hit_result['projectile_index']] if hit_result['projectile_index'] >= 0 else None
                 collisions.append((enemy, hit_projectile))
         
         return collisions
     
-    def _hit_enemy_original(self, enemy, projectiles: List, scene_manager) -> dict:
+    def _hit_enemy_original(self, enemy, projectiles: List, scene_manager, candidates=None) -> dict:
         """
         元のhit_enemy()関数の完全再現
         
@@ -74,6 +92,7 @@ class CollisionSystem:
             enemy: 対象の敵
             projectiles: 弾のリスト
             scene_manager: シーンマネージャー
+            candidates: 距離判定する弾の番号（空間ハッシュの候補、Noneなら全弾）
             
         Returns:
             ヒット結果の辞書
@@ -93,15 +112,15 @@ class CollisionSystem:
             projectile = projectiles[i]
             if not hasattr(projectile, 'active') or not projectile.active:
                 continue
+            if candidates is not None and i not in candidates:
+                continue
                 
-            ball_x = projectile.position.x
-            ball_y = projectile.position.y
-            
-            # 距離判定（元: dist(ex+er,ey+er,ball_x[i],ball_y[i])<e.r+ellipse_round）
-            distance = math.sqrt((ex + er - ball_x)**2 + (ey + er - ball_y)**2)
+            # 距離判定（元: dist(ex+er,ey+er,ball_x[i],ball_y[i])<e.r+ellipse_round、距離の二乗で比較）
             collision_distance = enemy.radius + GameConfig.ELLIPSE_ROUND
             
-            if distance < collision_distance:
+            if projectile.position.distance_sq_xy(ex + er, ey + er) < collision_distance * collision_distance:
+                collision_stats.hits += 1
+                
                 # プロジェクタイルからvelocity_b値を取得（元のグローバル変数velocity_b相当）
                 if hasattr(projectile, 'velocity_b'):
                     current_velocity_b = projectile.velocity_b
@@ -182,8 +201,13 @@ class CollisionSystem:
         """
         collision_occurred = False
         
+        self.enemy_grid.sync((id(enemy), enemy.position.x, enemy.position.y, enemy.radius)
+                             for enemy in enemies)
+        candidates = self.enemy_grid.query(player.position.x, player.position.y,
+                                           GameConfig.ELLIPSE_ROUND / 2)
+        
         for enemy in enemies:
-            if self._enemy_obj_original(player, enemy, inb_cnt, inb_max):
+            if id(enemy) in candidates and self._enemy_obj_original(player, enemy, inb_cnt, inb_max):
                 collision_occurred = True
         
         return collision_occurred
@@ -204,8 +228,12 @@ class CollisionSystem:
         """
         collision_occurred = False
         
+        self.boss_grid.sync((id(boss), boss.position.x, boss.position.y, boss.radius)
+                            for boss in boss_enemies)
+        candidates = self.boss_grid.query(player.position.x, player.position.y, GameConfig.PLAYER_RADIUS)
+        
         for boss in boss_enemies:
-            if boss.active and boss.hp > 0:
+            if boss.active and boss.hp > 0 and id(boss) in candidates:
                 if self._boss_collision_check(player, boss, inb_cnt, inb_max):
                     collision_occurred = True
         
@@ -227,14 +255,12 @@ class CollisionSystem:
         # 元の判定条件を完全再現
         # if(dist(player_x,player_y,e.x,e.y)<=ellipse_round/2+e.r&&inb_cnt>inb_max&&e.hp>0)
         
-        distance = math.sqrt((player.position.x - enemy.position.x)**2 + 
-                           (player.position.y - enemy.position.y)**2)
-        
         collision_distance = GameConfig.ELLIPSE_ROUND / 2 + enemy.radius
         
-        if (distance <= collision_distance and 
+        if (player.position.distance_sq(enemy.position) <= collision_distance * collision_distance and 
             inb_cnt > inb_max and 
             enemy.hp > 0):
+            collision_stats.hits += 1
             
             # ダメージ処理（元: inb_cnt=0; player_hp--;）
             # inb_cntのリセットは呼び出し元で行う
@@ -256,15 +282,13 @@ class CollisionSystem:
         """
         ボスとの衝突判定 - より大きな当たり判定
         """
-        distance = math.sqrt((player.position.x - boss.position.x)**2 + 
-                           (player.position.y - boss.position.y)**2)
-        
         # ボスは通常の敵より大きい当たり判定
         collision_distance = GameConfig.PLAYER_RADIUS + boss.radius
         
-        if (distance <= collision_distance and 
+        if (player.position.distance_sq(boss.position) <= collision_distance * collision_distance and 
             inb_cnt > inb_max and 
             boss.hp > 0):
+            collision_stats.hits += 1
             
             # プレイヤーにダメージ
             player.hp -= 1
@@ -306,7 +330,7 @@ class CollisionSystem:
         text_y = self.hit_info.position.y + 20
         
         # 赤色テキスト（元: fill(255,0,0);）
-        text_surface = font.render(damage_text, True, (255, 0, 0))
+        text_surface = render_text(font, damage_text, (255, 0, 0))
         screen.blit(text_surface, (text_x, text_y))
     
     def set_projectile_velocity(self, velocity: float):
@@ -0,0 +1,191 @@
+"""
+レイヤー合成システム
+描画を名前付きレイヤー単位に分け、変化のないレイヤーは描き直さずにキャッシュから合成する
+"""
+import time
+import pygame
+from typing import Callable, Dict, Optional
+
+
+class RenderLayer:
+    """
+    描画レイヤー
+    cached=Trueのレイヤーは描画範囲だけの大きさの専用Surfaceに描画して保持し、
+    dirtyまたはコマンド列が変わった時だけ描き直す
+    cached=Falseのレイヤーは毎フレーム描画先へ直接描画する（統計のみ取る）
+    """
+    
+    def __init__(self, name: str, cached: bool = False, bounds=None, keyed: bool = False):
+        self.name = name
+        self.cached = cached
+        # キャッシュする範囲（Noneなら描き直すたびにコマンドの描画範囲から決める）
+        self.bounds: Optional[pygame.Rect] = pygame.Rect(bounds) if bounds is not None else None
+        # Trueならカラーキー透過のSurfaceにする（アルファ合成より軽い）。中身が不透明な図形・スプライトだけのレイヤー向け
+        self.keyed = keyed
+        self.surface: Optional[pygame.Surface] = None
+        self.area = pygame.Rect(0, 0, 0, 0)   # 直近に描いた範囲（描画先の座標）
+        self.scale = 1.0                      # 直近に描いた時の倍率
+        self.dirty = True
+        
+        # 統計情報
+        self.redraw_count = 0      # 描画処理を実行した回数
+        self.composite_count = 0   # キャッシュから合成した回数
+        self.total_time = 0.0      # 描画・合成にかかった累計時間（秒）
+        self.last_time = 0.0       # 直近フレームの時間（秒）
+    
+    def invalidate(self):
+        """次回描き直させる"""
+        self.dirty = True
+    
+    def get_stats(self) -> dict:
+        """統計情報を取得"""
+        return {
+            'cached': self.cached,
+            'redraws': self.redraw_count,
+            'composites': self.composite_count,
+            'total_ms': self.total_time * 1000,
+            'last_ms': self.last_time * 1000,
+        }
+    
+    def _get_surface(self, size) -> pygame.Surface:
+        """キャッシュ用Surfaceを取得（範囲が収まらなくなった時だけ作り直す）し、透明で塗る"""
+        from utils.sprite_cache import SpriteCache
+        
+        width, height = size
+        surface = self.surface
+        if surface is None or surface.get_width() < width or surface.get_height() < height:
+            if self.keyed:
+                # RLEのままだと描き直すたびに展開・再圧縮が走る（実測で描き直し1回あたり約1.5ms）のでRLEは外す
+                surface = SpriteCache.create_keyed_surface(width, height)
+                surface.set_colorkey(surface.get_colorkey())
+            else:
+                surface = SpriteCache.create_surface(width, height)
+            self.surface = surface
+        elif self.keyed:
+            surface.fill(surface.get_colorkey())
+        else:
+            surface.fill((0, 0, 0, 0))
+        return surface
+
+
+class LayerCompositor:
+    """
+    名前付きレイヤーの合成
+    各描画処理はdraw(レイヤー名, 描画先, 描画関数)またはdraw_commands(...)で登録順に呼び出す
+    キャッシュレイヤーはdraw_commandsで描く（コマンド列の比較で描き直しを判定するため）
+    """
+    
+    # 合成順（奥から手前）
+    LAYER_ORDER = (
+        'background',         # 格子背景・グラデーション
+        'dynamic_entities',   # プレイヤー・動く敵
+        'static_entities',    # 動かない敵（元の描画順どおりプレイヤーより手前）
+        'bullets',            # 敵弾
+        'effects',            # ダメージ表示などのエフェクト
+        'hud',                # HPなどのUI
+        'debug',              # デバッグ表示
+    )
+    
+    def __init__(self):
+        self.layers: Dict[str, RenderLayer] = {
+            name: RenderLayer(name) for name in self.LAYER_ORDER
+        }
+    
+    def configure(self, name: str, cached: bool, bounds=None, keyed: bool = False):
+        """レイヤーのキャッシュ有無・範囲（Noneならコマンドから自動）・カラーキー透過を設定"""
+        layer = self.layers[name]
+        layer.cached = cached
+        layer.bounds = pygame.Rect(bounds) if bounds is not None else None
+        layer.keyed = keyed
+        layer.surface = None
+        layer.dirty = True
+    
+    def invalidate(self, name: Optional[str] = None):
+        """レイヤーを描き直し対象にする（Noneなら全レイヤー）"""
+        if name is None:
+            for layer in self.layers.values():
+                layer.invalidate()
+        else:
+            self.layers[name].invalidate()
+    
+    def draw(self, name: str, target: pygame.Surface, draw_func: Callable[[pygame.Surface], None]):
+        """
+        キャッシュしないレイヤーを描画
+        
+        Args:
+            name: レイヤー名（LAYER_ORDERのいずれか）
+            target: 描画先
+            draw_func: レイヤーの中身を描画する関数（引数は描画先Surface）
+        """
+        layer = self.layers[name]
+        if layer.cached:
+            raise ValueError(f"cached layer '{name}' must be drawn with draw_commands()")
+        start = time.perf_counter()
+        
+        draw_func(target)
+        layer.redraw_count += 1
+        
+        layer.last_time = time.perf_counter() - start
+        layer.total_time += layer.last_time
+    
+    def draw_commands(self, name: str, target: pygame.Surface, commands,
+                      record: Optional[Callable] = None, scale: float = 1.0):
+        """
+        記録済みの描画コマンドバッファでレイヤーを描画
+        キャッシュレイヤーはコマンド列が前フレームと同一なら実行を省略してキャッシュから合成する
+        recordを渡すとバッファを空にしてから記録させる（記録時間もレイヤーの時間に含める）
+        scaleは描画先が内部解像度の場合の倍率（RenderCommandBuffer.executeへ渡す）
+        
+        Returns:
+            キャッシュレイヤーを合成した矩形（キャッシュしないレイヤーはNone）
+        """
+        layer = self.layers[name]
+        start = time.perf_counter()
+        
+        if record is not None:
+            commands.begin()
+            record(commands)
+        
+        drawn = None
+        if not layer.cached:
+            commands.execute(target, scale)
+            layer.redraw_count += 1
+        else:
+            if layer.dirty or scale != layer.scale or commands.changed:
+                # 描く範囲だけのSurfaceへ、範囲の左上を原点にずらして描く
+                area = layer.bounds
+                if area is None:
+                    area = commands.bounds(scale)
+                    if area is None:
+                        area = target.get_rect()
+                area = area.clip(target.get_rect())
+                surface = layer._get_surface(area.size)
+                commands.execute(surface, scale, area.topleft)
+                layer.area = area
+                layer.scale = scale
+                layer.dirty = False
+                layer.redraw_count += 1
+            else:
+                commands.skip()
+                layer.composite_count += 1
+            if layer.area.width and layer.area.height:
+                drawn = target.blit(layer.surface, layer.area.topleft, ((0, 0), layer.area.size))
+        
+        layer.last_time = time.perf_counter() - start
+        layer.total_time += layer.last_time
+        return drawn
+    
+    def get_stats(self) -> dict:
+        """レイヤーごとの統計情報を取得"""
+        return {name: layer.get_stats() for name, layer in self.layers.items()}
+    
+    def get_summary(self) -> str:
+        """デバッグ表示用の要約（レイヤー名 描き直し回数/合成回数、直近フレームの合計ms）"""
+        parts = []
+        total = 0.0
+        for name in self.LAYER_ORDER:
+            layer = self.layers[name]
+            if layer.redraw_count or layer.composite_count:
+                parts.append(f"{name} {layer.redraw_count}/{layer.composite_count}")
+                total += layer.last_time
+        return f"Layers: {' '.join(parts)} ({total * 1000:.2f}ms)"
@@ -6,6 +6,10 @@ import pygame
 import sys
 from config.settings import GameConfig
 from core.game_state import GameState
+from utils.text_cache import render_text
+from utils.font_registry import get_font
+from core.presenter import display_presenter
+from core.quality import quality_governor
 
 
 class Game:
@@ -18,15 +22,23 @@ class Game:
         pygame.init()
         
         # 画面設定（元: size(1980*5/8,1080*3/4); frameRate(60);）
-        self.screen = pygame.display.set_mode((GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT))
+        self.screen = display_presenter.create_display()
         pygame.display.set_caption("Hippari Shooting - 元のコード完全再現版")
         
         # FPS制御（元: frameRate(60);）
+        # ゲーム進行は1/FPS秒固定の更新とし、描画フレームの時間を貯めて必要な回数だけ更新する
         self.clock = pygame.time.Clock()
+        self.step = 1.0 / GameConfig.FPS
+        self.accumulator = 0.0
+        self.pending_events = []   # まだ更新に渡していないイベント（更新0回のフレーム用）
+        
+        # 固定更新の統計
+        self.last_steps = 0        # 直近フレームの更新回数
+        self.dropped_time = 0.0    # 追いつけずに捨てた時間の累計（秒）
         
         # フォント設定（元: textFont(createFont("Arial", 20));）
-        self.font = pygame.font.Font(None, 30)
-        self.debug_font = pygame.font.Font(None, 24)
+        self.font = get_font((), 30)
+        self.debug_font = get_font((), 24)
         
         # ゲーム状態管理（元のグローバル変数群を統合）
         self.game_state = GameState()
@@ -46,50 +58,74 @@ class Game:
         """
         running = True
         
+        # 初期化にかかった時間を最初のフレームの経過時間に含めない（追いつき更新の空回りを防ぐ）
+        self.clock.tick()
+        self.accumulator = 0.0
+        
         while running:
             # イベント処理
             events = pygame.event.get()
             for event in events:
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    # ウィンドウが再露出した場合は画面全体を転送し直す
+                    display_presenter.mark_full('expose')
             
-            # フレーム時間計算
-            dt = self.clock.tick(GameConfig.FPS) / 1000.0
+            # フレーム時間計算（描画はRENDER_FPSで制限）
+            frame_time = self.clock.tick(GameConfig.RENDER_FPS) / 1000.0
             self.timer += 1  # 元のtimer++
             
-            # ゲーム更新（元のfunction()呼び出し相当）
-            self.game_state.update(dt, events)
+            # 前フレームの処理時間（待ち時間を除く）で描画品質を調整
+            quality_governor.record(self.clock.get_rawtime())
+            
+            # ゲーム更新（元のfunction()呼び出し相当、1/FPS秒固定で必要な回数）
+            self.pending_events.extend(events)
+            self._simulate(frame_time)
             
             # 描画（元のdraw()内容を再現）
             self._render_frame()
             
-            pygame.display.flip()
+            # 画面転送（ダーティ矩形モードでは変化した矩形のみ）
+            display_presenter.present()
         
         self._cleanup()
     
+    def _simulate(self, frame_time: float):
+        """
+        経過時間を貯め、1/FPS秒ごとにゲーム状態を更新
+        描画が遅れても1秒あたりの更新回数（cnt1やinb_cntの進み方）は変わらない
+        """
+        self.accumulator += frame_time
+        steps = 0
+        while self.accumulator >= self.step and steps < GameConfig.MAX_CATCH_UP_STEPS:
+            # イベントは最初の更新にだけ渡す
+            events, self.pending_events = self.pending_events, []
+            self.game_state.update(self.step, events)
+            self.accumulator -= self.step
+            steps += 1
+        
+        # 追いつけない分は捨てる（処理落ち時に更新が雪だるま式に増えるのを防ぐ）
+        if self.accumulator >= self.step:
+            self.dropped_time += self.accumulator - self.accumulator % self.step
+            self.accumulator %= self.step
+        self.last_steps = steps
+    
     def _render_frame(self):
         """
         1フレームの描画処理
         元のdraw()関数の描画部分を完全再現
         """
-        # 画面振動効果の適用（元のinb_cnt<5での振動）
-        shake_offset = self.game_state._get_screen_shake_offset()
-        
-        # 背景クリア（元: background(0);）
-        self.screen.fill((0, 0, 0))
-        
-        # 振動オフセット適用のため、描画位置を調整
-        if shake_offset != (0, 0):
-            # 元のtranslate(3*t,3*t)相当の効果
-            pass  # Pygameでは描画時に座標オフセットで対応
-        
-        # メインゲーム描画
+        # メインゲーム描画（背景クリア 元: background(0); もGameState側で行う）
+        # 元のinb_cnt<5での画面振動はGameStateのカメラで適用
         self.game_state.render(self.screen, self.font)
         
         # タイマー表示（元のtimer変数表示）
         if self.game_state.show_debug:
-            timer_text = self.debug_font.render(f"Timer: {self.timer}", True, (255, 255, 255))
-            self.screen.blit(timer_text, (10, 10))
+            timer_text = render_text(self.debug_font,
+                                     f"Timer: {self.timer}  Steps: {self.last_steps} "
+                                     f"(dropped {self.dropped_time:.2f}s)", (255, 255, 255), cache=False)
+            display_presenter.mark(self.screen.blit(timer_text, (10, 10)))
     
     def _cleanup(self):
         """終了処理"""
@@ -13,6 +13,13 @@ from entities.enemy import EnemyManager
 from core.scene_manager import GameSceneManager
 from core.collision_system import CollisionSystem, AudioManager
 from utils.math_utils import Vector2
+from utils.text_cache import render_text
+from core.presenter import display_presenter
+from core.quality import quality_governor
+from utils.camera import Camera
+from core.compositor import LayerCompositor
+from utils.render_commands import RenderCommandBuffer, render_stats
+from utils.spatial_hash import collision_stats
 
 
 @dataclass
@@ -76,6 +83,10 @@ class GameState:
         # フレームカウンター
         self.frame_counter = 0
         
+        # 毎フレーム使い回すマウス・プレイヤー位置
+        self._mouse_pos = Vector2()
+        self._player_pos = Vector2()
+        
         # デバッグ表示（元のstatus変数）
         self.show_debug = False
         
@@ -84,6 +95,22 @@ class GameState:
         self.base_background_data = {}   # アニメーションベースデータ（H_bg, S_bg, B_bg）
         self.current_animated_bg = {}    # 現在のアニメーション背景キャッシュ
         self.background_generated = set()
+        self.baked_backgrounds = {}      # 焼き込み済み背景Surface（シーンキー別）
+        self.bush_animation = None       # シーン1の茂みアニメーション（BushAnimation）
+        self._last_rendered_scene = None # 前フレームに描画したシーン（画面転送の切り替え検出用）
+        self.camera = Camera()           # 画面振動用カメラ（元のtranslate処理）
+        
+        # レイヤー合成（動かない敵は見た目が変わった時だけ、描画範囲だけのSurfaceへ描き直す）
+        # HUD・デバッグ表示はblit数回で済み、キャッシュからの透過合成の方が遅いため毎フレーム直接描く
+        self.compositor = LayerCompositor()
+        self.compositor.configure('static_entities', cached=True, keyed=True)
+        self.hud_commands = RenderCommandBuffer()
+        # ワールド（レイヤー別）とタイトル・ゲームオーバー画面も描画コマンドとして記録して実行する
+        # （描画呼び出し数の集計がフレーム全体を対象にするため）
+        self.layer_commands = {name: RenderCommandBuffer()
+                               for name in ('background', 'dynamic_entities', 'static_entities',
+                                            'bullets', 'effects')}
+        self.scene_commands = RenderCommandBuffer()
         
         # シーン固有のカウンター（元のcnt1, cnt2, cnt3）
         self.cnt1 = 0  # シーン1用カウンター
@@ -96,11 +123,14 @@ class GameState:
         """ゲーム状態の更新"""
         self.frame_counter += 1
         
+        # 衝突判定の集計を更新単位で区切る
+        collision_stats.begin_frame()
+        
         # イベント処理
         self._handle_events(events)
         
         # マウス状態を取得
-        mouse_pos = Vector2(*pygame.mouse.get_pos())
+        mouse_pos = self._mouse_pos.set(*pygame.mouse.get_pos())
         mouse_pressed = pygame.mouse.get_pressed()[0]  # 左クリック
         keys_pressed = set()  # 必要に応じて実装
         
@@ -109,6 +139,7 @@ class GameState:
         from core.scene_manager import GameScene
         if current_scene == GameScene.STAGE_1:
             self.cnt1 += 1
+            self._update_bush()
         elif current_scene == GameScene.STAGE_2:
             self.cnt2 += 1
         elif current_scene == GameScene.STAGE_3:
@@ -141,8 +172,8 @@ class GameState:
             self.player.update(dt, mouse_pos, mouse_pressed)
             
             # 敵更新  
-            player_pos = Vector2(self.player.original_physics.position.x, 
-                                self.player.original_physics.position.y)
+            player_pos = self._player_pos.set(self.player.original_physics.position.x,
+                                              self.player.original_physics.position.y)
             self.enemy_manager.update(dt, player_pos, self.scene_manager, self.cnt1)
         
         # シーン管理更新
@@ -152,8 +183,8 @@ class GameState:
         
         # 敵弾の更新とプレイヤー衝突処理
         if self.enemy_manager:
-            player_pos = Vector2(self.player.original_physics.position.x, 
-                                self.player.original_physics.position.y)
+            player_pos = self._player_pos.set(self.player.original_physics.position.x,
+                                              self.player.original_physics.position.y)
             player_hit_by_bullet = self.enemy_manager.update_bullets(
                 player_pos, self.scene_manager, 
                 self.player_inb_cnt, self.player_inb_max
@@ -171,6 +202,14 @@ class GameState:
         # ヒット表示更新
         self.collision_system.update_hit_display(dt)
     
+    def _update_bush(self):
+        """シーン1の茂みを30更新ごとに更新（元: if(cnt1%30==0){ draw_bush(); }、低品質時は間隔を延ばす）"""
+        if self.bush_animation is None or self.cnt1 % quality_governor.bush_interval != 0:
+            return
+        # 変化したセルのみ焼き込み背景へ再描画
+        dirty_cells = self.bush_animation.update()
+        self._get_baked_background('scene1').repaint_cells(self.bush_animation.grids, dirty_cells)
+    
     def _handle_events(self, events: list):
         """イベント処理"""
         for event in events:
@@ -201,7 +240,7 @@ class GameState:
                     self.show_debug = not self.show_debug
             
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = Vector2(event.pos[0], event.pos[1])
+                mouse_pos = Vector2(event.pos)
                 
                 # ボタンクリック判定
                 if self.start_button.is_clicked(mouse_pos):
@@ -280,71 +319,135 @@ class GameState:
         from core.scene_manager import GameScene
         from utils.ui_renderer import UIRenderer
         
+        # 描画呼び出し数の集計をフレーム単位で区切る
+        render_stats.begin_frame()
+        
+        # 生存弾数とフレーム時間から敵の詳細度（LOD）を決める
+        if self.enemy_manager:
+            quality_governor.update_lod(self.enemy_manager.bullet_manager.live_count)
+        
+        # ワールドの内部解像度（品質ガバナーの最終段階で下がる）
+        self.camera.render_scale = quality_governor.render_scale
+        
         # 1. 画面クリア（元: background(0);）
-        screen.fill((0, 0, 0))
+        # 内部解像度を下げたゲームプレイ中は、ワールドの拡大が画面全体を上書きするので省く
+        gameplay = not (self.scene_manager.is_scene_active(GameScene.START_SCREEN) or
+                        self.scene_manager.is_scene_active(GameScene.GAME_OVER))
+        if not (gameplay and self.camera.render_scale != 1.0):
+            screen.fill((0, 0, 0))
         
         # 2. 背景描画（格子状ブロック背景）
         ui_renderer = UIRenderer()
         current_scene = self.scene_manager.get_current_scene()
         
+        # シーンが切り替わったフレームは画面全体を転送
+        if current_scene != self._last_rendered_scene:
+            display_presenter.mark_full('scene')
+            self._last_rendered_scene = current_scene
+        
         if self.scene_manager.is_scene_active(GameScene.START_SCREEN):
+            commands = self.scene_commands
+            commands.begin()
             # タイトル画面背景（元: scene0bg()）
-            ui_renderer.scene0bg(screen)
+            ui_renderer.scene0bg(commands)
             # タイトルシーン描画
-            self.title_scene.render(screen)
+            self.title_scene.record_commands(commands)
+            commands.execute(screen)
         elif self.scene_manager.is_scene_active(GameScene.GAME_OVER):
             # ゲームオーバー画面背景（カラフル）
             if 'scene5' in self.background_data:
-                H_rnd, S_rnd, B_rnd = self.background_data['scene5']
-                ui_renderer.scene_bg(screen, H_rnd, S_rnd, B_rnd)
+                commands = self.scene_commands
+                commands.begin()
+                self._render_baked_background(commands, 'scene5', self.background_data['scene5'])
+                commands.execute(screen)
         else:
-            # ゲームプレイシーン背景
-            if current_scene == GameScene.STAGE_1 and 'scene1' in self.background_data:
-                # シーン1は30フレームごとに茂み更新（元: if(cnt1%30==0){ draw_bush(); }）
-                base_data = self.base_background_data.get('scene1')
-                if base_data and self.cnt1 % 30 == 0:
-                    # 30フレームごとに茂みを更新
-                    H_rnd, S_rnd, B_rnd = ui_renderer.generate_animated_background('scene1', base_data)
-                    self.current_animated_bg['scene1'] = (H_rnd, S_rnd, B_rnd)
-                
-                # キャッシュされたアニメーション背景を使用
-                if 'scene1' in self.current_animated_bg:
-                    H_rnd, S_rnd, B_rnd = self.current_animated_bg['scene1']
-                else:
-                    H_rnd, S_rnd, B_rnd = self.background_data['scene1']
-                
-                ui_renderer.scene_bg(screen, H_rnd, S_rnd, B_rnd)
-            elif current_scene == GameScene.STAGE_2 and 'scene2' in self.background_data:
-                H_rnd, S_rnd, B_rnd = self.background_data['scene2']
-                ui_renderer.scene_bg(screen, H_rnd, S_rnd, B_rnd)
-            elif current_scene == GameScene.STAGE_3 and 'scene3' in self.background_data:
-                H_rnd, S_rnd, B_rnd = self.background_data['scene3']
-                ui_renderer.scene_bg(screen, H_rnd, S_rnd, B_rnd)
+            # 無敵時の画面振動効果（元: translate(3*t,3*t)）
+            # ワールド（背景・敵・弾・ダメージ表示）はカメラ経由で描画し、UIは振動させない
+            # 内部解像度を下げている間は、ワールドを縮小バッファへ描いてから画面へ拡大する（UIは等倍）
+            world = self.camera.begin(screen, self._get_screen_shake_offset())
+            scale = self.camera.scale
+            compositor = self.compositor
+            layer_commands = self.layer_commands
             
-            # 無敵時の画面振動効果（元のtranslate処理）
-            offset_x, offset_y = self._get_screen_shake_offset()
+            # ゲームプレイシーン背景
+            compositor.draw_commands('background', world, layer_commands['background'],
+                                     lambda commands: self._render_gameplay_background(commands, current_scene),
+                                     scale)
             
             # 3. ゲームオブジェクトの描画
-            # 3. ゲームオブジェクトの描画
-            self.player.render(screen)
-            
+            compositor.draw_commands('dynamic_entities', world, layer_commands['dynamic_entities'],
+                                     self._render_entities, scale)
             if self.enemy_manager:
-                self.enemy_manager.render(screen)
-                
+                compositor.draw_commands('static_entities', world, layer_commands['static_entities'],
+                                         lambda commands: self.enemy_manager.record_commands(commands, static=True),
+                                         scale)
+            
             # プロジェクタイルはプレイヤー内で描画される
             # 敵弾の描画（元: bullet();）
             if self.enemy_manager:
-                self.enemy_manager.render_bullets(screen, self.scene_manager)
+                compositor.draw_commands('bullets', world, layer_commands['bullets'],
+                                         lambda commands: self.enemy_manager.render_bullets(commands,
+                                                                                            self.scene_manager),
+                                         scale)
             
             # 4. ヒットダメージ表示（元のshow_damage）
-            self.collision_system.render_hit_damage(screen, font)
+            compositor.draw_commands('effects', world, layer_commands['effects'],
+                                     lambda commands: self.collision_system.render_hit_damage(commands, font),
+                                     scale)
+            
+            self.camera.end(screen)
             
             # 5. UI描画
-            self._render_ui(screen, font)
+            compositor.draw_commands('hud', screen, self.hud_commands,
+                                     lambda commands: self._render_ui(commands, font))
+            
+            # ゲームプレイ中は敵・弾・画面振動で画面の大部分が毎フレーム変化するため全画面転送
+            display_presenter.mark_full('gameplay')
         
         # デバッグ情報表示
         if self.show_debug:
-            self._render_debug_info(screen, font)
+            self.compositor.draw('debug', screen, lambda surface: self._render_debug(surface, font))
+    
+    def _render_gameplay_background(self, screen: pygame.Surface, current_scene):
+        """ゲームプレイシーンの背景描画（シーン1は茂みアニメーション付き）"""
+        from core.scene_manager import GameScene
+        
+        if current_scene == GameScene.STAGE_1 and 'scene1' in self.background_data:
+            # 茂みの更新はupdate()（固定ステップ）側で行い、ここでは現在の状態を描くだけ
+            if self.bush_animation is not None:
+                grids = self.bush_animation.grids
+            else:
+                grids = self.background_data['scene1']
+            
+            self._render_baked_background(screen, 'scene1', grids)
+        elif current_scene == GameScene.STAGE_2 and 'scene2' in self.background_data:
+            self._render_baked_background(screen, 'scene2', self.background_data['scene2'])
+        elif current_scene == GameScene.STAGE_3 and 'scene3' in self.background_data:
+            self._render_baked_background(screen, 'scene3', self.background_data['scene3'])
+    
+    def _render_entities(self, commands):
+        """プレイヤーと動く敵の描画コマンドを記録（動かない敵はstatic_entitiesレイヤー）"""
+        self.player.record_commands(commands)
+        
+        if self.enemy_manager:
+            self.enemy_manager.record_commands(commands, static=False)
+    
+    def _render_baked_background(self, screen: pygame.Surface, key: str, grids: tuple):
+        """
+        焼き込み済み背景の描画
+        グリッドが差し替えられた時のみSurfaceを再構築し、通常は1回のblitで済ませる
+        """
+        self._get_baked_background(key).render(screen, grids)
+    
+    def _get_baked_background(self, key: str):
+        """シーンキーに対応する焼き込み背景を取得（なければ作成）"""
+        from utils.ui_renderer import BakedBackground
+        
+        baked = self.baked_backgrounds.get(key)
+        if baked is None:
+            baked = BakedBackground()
+            self.baked_backgrounds[key] = baked
+        return baked
     
     def _get_screen_shake_offset(self) -> tuple:
         """画面振動オフセット計算 - 元のtranslate処理"""
@@ -359,15 +462,15 @@ class GameState:
         
         return (0, 0)
     
-    def _render_ui(self, screen: pygame.Surface, font: pygame.font.Font):
+    def _render_ui(self, commands, font: pygame.font.Font):
         """UI要素の描画"""
         from core.scene_manager import GameScene
         from utils.ui_renderer import UIRenderer
         
         if self.scene_manager.is_scene_active(GameScene.START_SCREEN):
-            self._render_start_screen(screen, font)
+            self._render_start_screen(commands, font)
         elif self.scene_manager.is_scene_active(GameScene.GAME_OVER):
-            self._render_game_over_screen(screen, font)
+            self._render_game_over_screen(commands, font)
         else:
             # ゲームプレイ中のUI（元のplayer_HP()関数を再現）
             ui_renderer = UIRenderer()
@@ -386,51 +489,87 @@ class GameState:
                 scene[3] = True
             
             # オリジナルのプレイヤーHP表示（ハート形式）
-            ui_renderer.player_HP(screen, self.player.hp, scene)
+            ui_renderer.player_HP(commands, self.player.hp, scene)
     
-    def _render_start_screen(self, screen: pygame.Surface, font: pygame.font.Font):
+    def _render_start_screen(self, commands, font: pygame.font.Font):
         """スタート画面の描画"""
         if self.start_button.hp > 0:
             # ボタン描画
-            pygame.draw.circle(screen, (255, 255, 0), 
-                             (int(self.start_button.x), int(self.start_button.y)), 
-                             int(self.start_button.radius))
+            commands.circle((255, 255, 0),
+                            (int(self.start_button.x), int(self.start_button.y)),
+                            int(self.start_button.radius))
             
             # テキスト描画
-            text_surface = font.render("GAME START", True, (0, 0, 0))
+            text_surface = render_text(font, "GAME START", (0, 0, 0))
             text_rect = text_surface.get_rect(center=(self.start_button.x, self.start_button.y))
-            screen.blit(text_surface, text_rect)
+            commands.blit(text_surface, text_rect)
     
-    def _render_game_over_screen(self, screen: pygame.Surface, font: pygame.font.Font):
+    def _render_game_over_screen(self, commands, font: pygame.font.Font):
         """ゲームオーバー画面の描画"""
         # Game Overテキスト
-        text_surface = font.render("Game Over", True, (255, 255, 255))
+        text_surface = render_text(font, "Game Over", (255, 255, 255))
         text_rect = text_surface.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, 
                                                  GameConfig.SCREEN_HEIGHT // 2 - 100))
-        screen.blit(text_surface, text_rect)
+        commands.blit(text_surface, text_rect)
         
         # リスタートボタン
         if self.restart_button.hp > 0:
-            pygame.draw.circle(screen, (255, 0, 0), 
-                             (int(self.restart_button.x), int(self.restart_button.y)), 
-                             int(self.restart_button.radius))
+            commands.circle((255, 0, 0),
+                            (int(self.restart_button.x), int(self.restart_button.y)),
+                            int(self.restart_button.radius))
     
-    def _render_debug_info(self, screen: pygame.Surface, font: pygame.font.Font):
-        """デバッグ情報の描画 - 元のstatus表示"""
-        debug_lines = [
+    def _render_debug(self, screen: pygame.Surface, font: pygame.font.Font):
+        """デバッグ表示（変化の少ない行だけ共有テキストキャッシュに入れる）"""
+        static_lines = self._get_static_debug_lines()
+        self._render_debug_info(screen, font, static_lines, 50)
+        self._render_debug_info(screen, font, self._get_debug_lines(), 50 + 25 * len(static_lines),
+                                cache=False)
+    
+    def _get_static_debug_lines(self) -> list:
+        """デバッグ表示のうち変化の少ない行"""
+        return [
             f"Player HP: {self.player.hp}",
+            f"Scene: {self.scene_manager.current_scene}",
+        ]
+    
+    def _get_debug_lines(self) -> list:
+        """デバッグ表示のうち毎フレーム変わる行 - 元のstatus表示"""
+        return [
             f"Inb Count: {self.player_inb_cnt}",
             f"Player Pos: ({self.player.position.x:.1f}, {self.player.position.y:.1f})",
-            f"Scene: {self.scene_manager.current_scene}",
-            f"Frame: {self.frame_counter}"
+            f"Frame: {self.frame_counter}",
+            self._text_cache_debug_line(),
+            self.compositor.get_summary(),
+            quality_governor.get_summary(),
+            self._render_stats_debug_line(),
+            self.enemy_manager.bullet_manager.get_summary(),
+            collision_stats.get_summary()
         ]
-        
-        y_offset = 50
+    
+    def _render_debug_info(self, screen: pygame.Surface, font: pygame.font.Font, debug_lines: list,
+                           y_offset: int, cache: bool = True):
+        """デバッグ情報の描画 - 元のstatus表示（数値が毎フレーム変わる行はcache=Falseで共有キャッシュに入れない）"""
         for line in debug_lines:
-            text_surface = font.render(line, True, (255, 255, 255))
-            screen.blit(text_surface, (10, y_offset))
+            text_surface = render_text(font, line, (255, 255, 255), cache=cache)
+            display_presenter.mark(screen.blit(text_surface, (10, y_offset)))
             y_offset += 25
     
+    @staticmethod
+    def _render_stats_debug_line() -> str:
+        """描画コマンドの統計（直近フレーム）"""
+        stats = render_stats.get_stats()
+        return (f"Draw calls (frame): {stats['draw_calls']} "
+                f"(commands {stats['commands']}, skipped {stats['skipped']})")
+    
+    @staticmethod
+    def _text_cache_debug_line() -> str:
+        """テキストキャッシュの統計表示用文字列"""
+        from utils.text_cache import text_cache
+        stats = text_cache.get_stats()
+        return (f"Text Cache: {stats['hit_rate'] * 100:.1f}% hit, "
+                f"{stats['entries']} entries, {stats['bytes'] / 1024:.0f} KB, "
+                f"{stats['uncached']} uncached")
+    
     def _generate_backgrounds(self):
         """各シーンの背景を事前生成（元のgenerate_***bg関数群）"""
         from utils.ui_renderer import UIRenderer
@@ -442,9 +581,11 @@ class GameState:
             self.background_data['scene1'] = bg_data
             # H_bg, S_bg, B_bgとしてベース保存（アニメーション用）
             self.base_background_data['scene1'] = bg_data
-            # 初期アニメーション背景を生成
-            animated_bg = ui_renderer.generate_animated_background('scene1', bg_data)
-            self.current_animated_bg['scene1'] = animated_bg
+            # 茂みアニメーション（差分更新）を初期化
+            from utils.ui_renderer import BushAnimation
+            self.bush_animation = BushAnimation(bg_data)
+            self.bush_animation.update()
+            self.current_animated_bg['scene1'] = self.bush_animation.grids
             self.background_generated.add('scene1')
         
         # シーン2背景生成
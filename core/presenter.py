@@ -0,0 +1,139 @@
+"""
+画面表示（プレゼンテーション）管理
+毎フレームの全画面flipの代わりに、描画で変化した矩形だけをdisplay.updateで転送するモードを提供する
+"""
+import pygame
+from typing import List, Optional
+from config.settings import GameConfig
+
+
+class DisplayPresenter:
+    """
+    ダーティ矩形による画面転送
+    各描画処理がmark()で今フレームに描いた（毎フレーム変化しうる）矩形を報告し、present()でまとめて転送する
+    前フレームの矩形も転送対象に含める（移動した物体の元の位置を消すため）
+    ダーティ面積が閾値を超えた場合や背景の再構築後は全画面flipに切り替える
+    """
+    
+    def __init__(self, enabled: bool = GameConfig.DIRTY_RECT_PRESENTATION,
+                 area_threshold: float = GameConfig.DIRTY_RECT_AREA_THRESHOLD):
+        self.enabled = enabled
+        self.area_threshold = area_threshold   # 画面面積に対する割合
+        self.screen_rect = pygame.Rect(0, 0, GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT)
+        self.window: Optional[pygame.Surface] = None
+        
+        self._rects: List[pygame.Rect] = []
+        self._previous_rects: List[pygame.Rect] = []
+        self._full = True
+        self._full_reason: Optional[str] = 'initial'
+        
+        # 統計情報
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.last_rect_count = 0
+        self.last_area_ratio = 1.0
+        self.last_full_reason: Optional[str] = None
+    
+    def create_display(self) -> pygame.Surface:
+        """
+        ウィンドウを作成し、ゲームの描画先Surfaceを返す
+        ウィンドウは常に画面サイズ（SCREEN_WIDTH x SCREEN_HEIGHT）なので、ゲーム側の座標はそのまま使える
+        """
+        self.window = pygame.display.set_mode(self.screen_rect.size)
+        return self.window
+    
+    def mark(self, rect):
+        """変化した矩形を報告"""
+        if not self.enabled or rect is None:
+            return
+        rect = pygame.Rect(rect).clip(self.screen_rect)
+        if rect.width > 0 and rect.height > 0:
+            self._rects.append(rect)
+    
+    def mark_all(self, rects):
+        """複数の矩形をまとめて報告"""
+        for rect in rects:
+            self.mark(rect)
+    
+    def mark_full(self, reason: str = ''):
+        """次のpresent()を全画面flipにする（背景の再構築・シーン切り替え等）"""
+        if not self._full:
+            self._full = True
+            self._full_reason = reason
+    
+    def present(self):
+        """1フレーム分の描画結果を画面へ転送"""
+        if not self.enabled:
+            pygame.display.flip()
+            return
+        
+        if self._full:
+            self._flip(self._full_reason)
+            return
+        
+        rects = self._merge(self._rects + self._previous_rects)
+        area = sum(rect.width * rect.height for rect in rects)
+        area_ratio = area / (self.screen_rect.width * self.screen_rect.height)
+        
+        if area_ratio > self.area_threshold:
+            self._flip('area')
+            return
+        
+        if rects:
+            pygame.display.update(rects)
+        self.partial_frames += 1
+        self.last_rect_count = len(rects)
+        self.last_area_ratio = area_ratio
+        self._previous_rects = self._rects
+        self._rects = []
+    
+    def set_enabled(self, enabled: bool):
+        """ダーティ矩形モードの切り替え（切り替え直後は全画面flip）"""
+        self.enabled = enabled
+        self._full = True
+        self._full_reason = 'mode change'
+        self._rects = []
+        self._previous_rects = []
+    
+    def get_stats(self) -> dict:
+        """統計情報を取得"""
+        return {
+            'enabled': self.enabled,
+            'full_frames': self.full_frames,
+            'partial_frames': self.partial_frames,
+            'last_rect_count': self.last_rect_count,
+            'last_area_ratio': self.last_area_ratio,
+            'last_full_reason': self.last_full_reason,
+        }
+    
+    def _flip(self, reason: Optional[str]):
+        """全画面flipで転送"""
+        pygame.display.flip()
+        self.full_frames += 1
+        self.last_rect_count = 1
+        self.last_area_ratio = 1.0
+        self.last_full_reason = reason
+        # 今フレームの矩形は次フレームで消去が必要なため保持する
+        self._previous_rects = self._rects
+        self._rects = []
+        self._full = False
+        self._full_reason = None
+    
+    @staticmethod
+    def _merge(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+        """重なる（または隣接する）矩形を統合"""
+        merged: List[pygame.Rect] = []
+        for rect in rects:
+            rect = rect.copy()
+            # 統合で大きくなった矩形が他と重なる場合があるので、変化がなくなるまで繰り返す
+            while True:
+                index = rect.inflate(2, 2).collidelist(merged)
+                if index < 0:
+                    break
+                rect.union_ip(merged.pop(index))
+            merged.append(rect)
+        return merged
+
+
+# ゲーム全体で共有する画面転送管理
+display_presenter = DisplayPresenter()
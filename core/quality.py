@@ -0,0 +1,139 @@
+"""
+描画品質の自動調整
+実測したフレーム時間の移動平均を監視し、予算（1/FPS秒）を超えたら品質を段階的に下げ、余裕が戻ったら上げる
+"""
+from collections import deque
+from config.settings import GameConfig
+
+
+class QualityGovernor:
+    """
+    品質ガバナー
+    レベル0が最高品質。レベルを1つ上げるごとに、下の順で品質を落とす
+      1: 茂みアニメーションの更新間隔を延ばす
+      2: タイトル画面のグロー・パルス効果を止める
+      3: ワールドの内部解像度を下げる（QUALITY_RENDER_SCALE_TIERがTrueの時のみ）
+    """
+    
+    # 各レベルで下げる品質項目（ログ・デバッグ表示用）
+    TIERS = ('bush', 'effects', 'render_scale')
+    
+    def __init__(self, budget_ms: float = 1000.0 / GameConfig.FPS, window: int = 60,
+                 downgrade_ratio: float = 1.0, upgrade_ratio: float = 0.6, cooldown: int = 120,
+                 render_scale_tier: bool = GameConfig.QUALITY_RENDER_SCALE_TIER):
+        # 内部解像度の段階は、拡大のコストより縮小描画で減る分が大きい環境でだけ有効にする
+        self.tiers = self.TIERS if render_scale_tier else self.TIERS[:-1]
+        self.budget_ms = budget_ms
+        self.downgrade_ratio = downgrade_ratio   # 平均が予算のこの倍率を超えたら品質を下げる
+        self.upgrade_ratio = upgrade_ratio       # 平均が予算のこの倍率を下回ったら品質を上げる
+        self.cooldown = cooldown                 # 変更後、次の判定までに待つフレーム数
+        self.enabled = True
+        
+        self.level = 0
+        self._samples = deque(maxlen=window)
+        self._total = 0.0
+        self._frames_since_change = 0
+        self.last_change = None   # 直近の変更内容（デバッグ表示用）
+        
+        # 詳細度（LOD）：負荷が高い間は敵を簡易描画にする
+        self.lod_active = False
+        self.lod_bullet_limit = GameConfig.LOD_BULLET_LIMIT
+        self.lod_frame_ms = GameConfig.LOD_FRAME_MS
+        self.lod_switches = 0        # LODの切り替え回数
+        self.last_lod_change = None  # 直近のLOD切り替え（デバッグ表示用。頻繁に切り替わるためログには出さない）
+    
+    @property
+    def average_ms(self) -> float:
+        """フレーム時間の移動平均（ミリ秒）"""
+        return self._total / len(self._samples) if self._samples else 0.0
+    
+    def record(self, frame_ms: float):
+        """
+        1フレームの処理時間を記録し、必要なら品質レベルを変更
+        
+        Args:
+            frame_ms: 待ち時間を除いたフレームの処理時間（ミリ秒）
+        """
+        if len(self._samples) == self._samples.maxlen:
+            self._total -= self._samples[0]
+        self._samples.append(frame_ms)
+        self._total += frame_ms
+        self._frames_since_change += 1
+        
+        if not self.enabled or len(self._samples) < self._samples.maxlen:
+            return
+        if self._frames_since_change < self.cooldown:
+            return
+        
+        average = self.average_ms
+        if average > self.budget_ms * self.downgrade_ratio and self.level < len(self.tiers):
+            self._set_level(self.level + 1, average)
+        elif average < self.budget_ms * self.upgrade_ratio and self.level > 0:
+            self._set_level(self.level - 1, average)
+    
+    def _set_level(self, level: int, average: float):
+        """品質レベルを変更してログ出力"""
+        direction = 'down' if level > self.level else 'up'
+        tier = self.tiers[max(level, self.level) - 1]
+        self.level = level
+        self._frames_since_change = 0
+        self.last_change = f"{direction} {tier} ({average:.1f}ms)"
+        print(f"[QUALITY] quality {direction}: level {level} ({tier}), avg frame {average:.1f}ms "
+              f"/ budget {self.budget_ms:.1f}ms")
+    
+    def update_lod(self, live_bullets: int):
+        """
+        生存弾数とフレーム時間からLODの切り替えを判定（毎フレーム描画前に呼ぶ）
+        切り替えが頻発しないよう、解除は上限の75%（フレーム時間は80%）を下回った時に行う
+        """
+        average = self.average_ms
+        if not self.lod_active:
+            if live_bullets >= self.lod_bullet_limit or average > self.lod_frame_ms:
+                self._set_lod(True, live_bullets, average)
+        elif live_bullets < self.lod_bullet_limit * 0.75 and average < self.lod_frame_ms * 0.8:
+            self._set_lod(False, live_bullets, average)
+    
+    def _set_lod(self, active: bool, live_bullets: int, average: float):
+        """LODを切り替えて記録（ログ出力はせず、デバッグ表示で確認する）"""
+        self.lod_active = active
+        self.lod_switches += 1
+        self.last_lod_change = f"{'on' if active else 'off'} ({live_bullets} bullets, {average:.1f}ms)"
+    
+    # --- 各描画処理が参照する品質設定 ---
+    
+    def _reduced(self, tier: str) -> bool:
+        """指定した品質項目が現在のレベルで下げられているか"""
+        return tier in self.tiers[:self.level]
+    
+    @property
+    def bush_interval(self) -> int:
+        """茂みアニメーションの更新間隔（フレーム、元: cnt1%30==0）"""
+        return 90 if self._reduced('bush') else 30
+    
+    @property
+    def title_effects(self) -> bool:
+        """タイトル画面のグロー・パルス効果を描画するか"""
+        return not self._reduced('effects')
+    
+    @property
+    def render_scale(self) -> float:
+        """ワールドの内部解像度の倍率（カメラのrender_scaleへ毎フレーム設定する）"""
+        if self._reduced('render_scale'):
+            return min(GameConfig.RENDER_SCALE, GameConfig.QUALITY_REDUCED_RENDER_SCALE)
+        return GameConfig.RENDER_SCALE
+    
+    def get_summary(self) -> str:
+        """デバッグ表示用の要約"""
+        reduced = ', '.join(self.tiers[:self.level]) or 'none'
+        text = f"Quality: level {self.level} (reduced: {reduced}) avg {self.average_ms:.1f}ms"
+        if self.lod_active:
+            text += " LOD"
+        if self.last_change:
+            text += f" last {self.last_change}"
+        if self.last_lod_change:
+            text += f" / LOD {self.last_lod_change} x{self.lod_switches}"
+        return text
+
+
+# ゲーム全体で共有する品質ガバナー
+quality_governor = QualityGovernor()
@@ -248,6 +248,9 @@ class GameSceneManager:
         game_state.player.hp = GameConfig.PLAYER_MAX_HP
         game_state.player_inb_cnt = game_state.player_inb_max
         
+        # タイトル画面の静的レイヤーを焼き込み
+        game_state.title_scene.enter()
+        
         # 全カウンターリセット
         self.stage1_counter = 0
         self.stage2_counter = 0
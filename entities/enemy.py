@@ -8,6 +8,8 @@ from utils.math_utils import Vector2, MathUtils
 from config.settings import GameConfig, Colors, EnemyType
 from utils.collision import CollisionDetector
 from entities.enemy_bullet import EnemyBulletManager
+from utils.spatial_hash import SpatialHash, collision_stats
+from utils.render_commands import RenderCommandBuffer
 
 
 class Enemy:
@@ -46,7 +48,7 @@ class Enemy:
         # 第一ステージの敵（BASIC）は動かない（元のenemy_place()で固定位置）
         if self.enemy_type != EnemyType.BASIC:
             # 位置を更新（他の敵タイプのみ）
-            self.position += self.velocity * dt * 60
+            self.position.add_scaled(self.velocity, dt * 60)
         
         # 画面境界チェック
         self._clamp_to_screen()
@@ -69,42 +71,46 @@ class Enemy:
         self.position.x = MathUtils.clamp(self.position.x, self.radius, GameConfig.SCREEN_WIDTH - self.radius)
         self.position.y = MathUtils.clamp(self.position.y, self.radius, GameConfig.SCREEN_HEIGHT - self.radius)
     
-    def render(self, screen: pygame.Surface):
-        """敵の描画"""
+    def render(self, screen: pygame.Surface, *args):
+        """Surfaceへ直接描画（描画コマンドを記録してその場で実行する）"""
+        commands = RenderCommandBuffer()
+        self.record_commands(commands, *args)
+        commands.execute(screen)
+    
+    def record_commands(self, commands):
+        """敵の描画コマンドを記録（RenderCommandBuffer）"""
         if not self.active:
             return
             
         # 無敵時間中の点滅効果
         if self.is_invincible and int(self.animation_counter) % 8 < 4:
-            self._render_invincible_effect(screen)
+            self._render_invincible_effect(commands)
         else:
-            self._render_normal(screen)
+            self._render_normal(commands)
         
         # HPバーを描画
-        self._render_hp_bar(screen)
+        self._render_hp_bar(commands)
     
-    def _render_normal(self, screen: pygame.Surface):
+    def _render_normal(self, commands):
         """通常時の描画"""
         if self.enemy_type == EnemyType.BASIC:
-            self._render_basic_enemy(screen)
+            self._render_basic_enemy(commands)
         elif self.enemy_type == EnemyType.BOSS_1:
-            self._render_boss1_enemy(screen)
+            self._render_boss1_enemy(commands)
         elif self.enemy_type == EnemyType.BOSS_2:
-            self._render_boss2_enemy(screen)
+            self._render_boss2_enemy(commands)
         elif self.enemy_type == EnemyType.PIXIE:
-            self._render_pixie_enemy(screen)
+            self._render_pixie_enemy(commands)
     
-    def _render_invincible_effect(self, screen: pygame.Surface):
+    def _render_invincible_effect(self, commands):
         """無敵時間中の描画（点滅効果）"""
         # 白っぽく描画
-        pygame.draw.circle(screen, (255, 200, 200), 
-                          (int(self.position.x), int(self.position.y)), 
-                          int(self.radius))
+        commands.circle((255, 200, 200),
+                        (int(self.position.x), int(self.position.y)), 
+                        int(self.radius))
     
-    def _render_basic_enemy(self, screen: pygame.Surface):
+    def _render_basic_enemy(self, commands):
         """基本敵の描画（元のenemy1_img()を再現）"""
-        from utils.color_utils import ProcessingColors
-        
         x, y, r = self.position.x, self.position.y, self.radius
         
         # 無敵判定で色を決定
@@ -112,41 +118,68 @@ class Enemy:
         
         # 点滅効果
         if (int(self.animation_counter) % 8 < 4) or (int(self.animation_counter) > 30):
-            # メイン三角形
-            if hc == 1:
-                color = ProcessingColors.ENEMY1_BODY_NORMAL
-            else:
-                color = ProcessingColors.ENEMY1_BODY_INVINCIBLE
-                
-            # 大きな三角形
-            triangle1 = [(x, y-r), (x-r, y+r), (x+r, y+r)]
-            pygame.draw.polygon(screen, color, triangle1)
-            
-            # 左下の三角形
-            triangle2 = [(x-r*3/4-r/8, y-r*3/4), (x-r+r/4, y+r-r/4), (x+r-r/4, y+r-r/4)]
-            pygame.draw.polygon(screen, color, triangle2)
-            
-            # 右下の三角形  
-            triangle3 = [(x+r*3/4+r/8, y-r*3/4), (x+r-r/4, y+r-r/4), (x-r+r/4, y+r-r/4)]
-            pygame.draw.polygon(screen, color, triangle3)
-            
-            # 詳細部分の色
-            if hc == 1:
-                detail_color = ProcessingColors.ENEMY1_DETAIL_NORMAL
-            else:
-                detail_color = ProcessingColors.ENEMY1_DETAIL_INVINCIBLE
-                
-            # 小さな装飾三角形
-            detail1 = [(x-r/4, y+r*3/8), (x-r*3/8, y+r/8), (x-r/8, y+r/8)]
-            pygame.draw.polygon(screen, detail_color, detail1)
-            
-            detail2 = [(x+r/4, y+r*3/8), (x+r*3/8, y+r/8), (x+r/8, y+r/8)]
-            pygame.draw.polygon(screen, detail_color, detail2)
-            
-            detail3 = [(x, y+r/2), (x+r/8, y+r*3/4), (x-r/8, y+r*3/4)]
-            pygame.draw.polygon(screen, detail_color, detail3)
+            # 描画済みスプライトを貼り付け（形と色は半径とhcのみで決まる）
+            self._blit_enemy1_sprite(commands, x, y, r, hc)
+    
+    @staticmethod
+    def _blit_enemy1_sprite(screen: pygame.Surface, x: float, y: float, r: float, hc: int):
+        """enemy1_imgの描画済みスプライトを(x, y)中心に描画"""
+        from utils.sprite_cache import sprite_cache
+        
+        sprite = sprite_cache.get(('enemy1', r, hc), lambda: Enemy._build_enemy1_sprite(r, hc))
+        half = sprite.get_width() // 2
+        screen.blit(sprite, (int(x) - half, int(y) - half))
     
-    def _render_boss1_enemy(self, screen: pygame.Surface):
+    @staticmethod
+    def _build_enemy1_sprite(r: float, hc: int) -> pygame.Surface:
+        """元のenemy1_img関数の三角形群を透過Surfaceへ描画"""
+        from utils.color_utils import ProcessingColors
+        from utils.sprite_cache import SpriteCache
+        
+        half = int(math.ceil(r)) + 1
+        sprite = SpriteCache.create_surface(half * 2 + 1, half * 2 + 1)
+        x = y = half
+        
+        # メイン三角形の色決定
+        if hc == 1:
+            main_color = ProcessingColors.ENEMY1_BODY_NORMAL       # fill(104,70,50)
+        else:
+            main_color = ProcessingColors.ENEMY1_BODY_INVINCIBLE   # fill(0,60,90)
+        
+        # 大きな三角形（元: triangle(x,y-r,x-r,y+r,x+r,y+r);）
+        triangle1 = [(x, y-r), (x-r, y+r), (x+r, y+r)]
+        pygame.draw.polygon(sprite, main_color, triangle1)
+        
+        # 左下の三角形（元: triangle(x-r*3/4-r/8,y-r*3/4,x-r+r/4,y+r-r/4,x+r-r/4,y+r-r/4);）
+        triangle2 = [(x-r*3/4-r/8, y-r*3/4), (x-r+r/4, y+r-r/4), (x+r-r/4, y+r-r/4)]
+        pygame.draw.polygon(sprite, main_color, triangle2)
+        
+        # 右下の三角形（元: triangle(x+r*3/4+r/8,y-r*3/4,x+r-r/4,y+r-r/4,x-r+r/4,y+r-r/4);）
+        triangle3 = [(x+r*3/4+r/8, y-r*3/4), (x+r-r/4, y+r-r/4), (x-r+r/4, y+r-r/4)]
+        pygame.draw.polygon(sprite, main_color, triangle3)
+        
+        # 詳細部分の色決定
+        if hc == 1:
+            detail_color = ProcessingColors.ENEMY1_DETAIL_NORMAL       # fill(30,80,35)
+        else:
+            detail_color = ProcessingColors.ENEMY1_DETAIL_INVINCIBLE   # fill(0,60,60)
+        
+        # 小さな装飾三角形群
+        # triangle(x-r/4,y+r*3/8,x-r*3/8,y+r/8,x-r/8,y+r/8);
+        detail1 = [(x-r/4, y+r*3/8), (x-r*3/8, y+r/8), (x-r/8, y+r/8)]
+        pygame.draw.polygon(sprite, detail_color, detail1)
+        
+        # triangle(x+r/4,y+r*3/8,x+r*3/8,y+r/8,x+r/8,y+r/8);
+        detail2 = [(x+r/4, y+r*3/8), (x+r*3/8, y+r/8), (x+r/8, y+r/8)]
+        pygame.draw.polygon(sprite, detail_color, detail2)
+        
+        # triangle(x,y+r/2,x+r/8,y+r*3/4,x-r/8,y+r*3/4);
+        detail3 = [(x, y+r/2), (x+r/8, y+r*3/4), (x-r/8, y+r*3/4)]
+        pygame.draw.polygon(sprite, detail_color, detail3)
+        
+        return sprite
+    
+    def _render_boss1_enemy(self, commands):
         """第二ステージボス描画 - 元のdraw_enemy2()完全再現"""
         ex, ey, er = self.position.x, self.position.y, self.radius
         cnt = int(self.invincibility_timer) if hasattr(self, 'invincibility_timer') else 0
@@ -175,47 +208,47 @@ class Enemy:
             
             # パーツ1: 左耳
             color1 = ProcessingColorConverter.hsb_to_rgb(h1, s1, b1, 360, 100, 100)
-            pygame.draw.ellipse(screen, color1,
-                               (ex-er-er/3, ey+er/4-er/3, er/3*2, er*1.5))
+            commands.ellipse(color1,
+                             (ex-er-er/3, ey+er/4-er/3, er/3*2, er*1.5))
             
             # パーツ2: 右耳  
-            pygame.draw.ellipse(screen, color1,
-                               (ex+er-er/4, ey+er/4-er/2, er/4*2, er*2))
+            commands.ellipse(color1,
+                             (ex+er-er/4, ey+er/4-er/2, er/4*2, er*2))
             
             # メイン本体
             main_color = ProcessingColorConverter.hsb_to_rgb(h2, s2, b2, 360, 100, 100)
-            pygame.draw.ellipse(screen, main_color,
-                               (ex-er, ey-er/4+5-er*7/8, er*4, er*7/2+5))
+            commands.ellipse(main_color,
+                             (ex-er, ey-er/4+5-er*7/8, er*4, er*7/2+5))
             
             # 足パーツ
-            pygame.draw.ellipse(screen, main_color,
-                               (ex+er/2-er/4, ey+er-er/4-er/8, er, er/2))
-            pygame.draw.ellipse(screen, main_color,
-                               (ex-er/2-er/4, ey+er-er/4-er/8, er, er/2))
+            commands.ellipse(main_color,
+                             (ex+er/2-er/4, ey+er-er/4-er/8, er, er/2))
+            commands.ellipse(main_color,
+                             (ex-er/2-er/4, ey+er-er/4-er/8, er, er/2))
             
             # 顔パーツ
-            pygame.draw.ellipse(screen, color1,
-                               (ex-er/2-er/4, ey-er/4-er/2, er, er*2))
-            pygame.draw.ellipse(screen, color1,
-                               (ex+er*5/8-er/6, ey-er/2-er/3, er/3*2, er*1.5))
-            pygame.draw.ellipse(screen, color1,
-                               (ex+er/8-er/6, ey+er/4-er/4, er/3*2, er))
-    
-    def _render_boss2_enemy(self, screen: pygame.Surface):
+            commands.ellipse(color1,
+                             (ex-er/2-er/4, ey-er/4-er/2, er, er*2))
+            commands.ellipse(color1,
+                             (ex+er*5/8-er/6, ey-er/2-er/3, er/3*2, er*1.5))
+            commands.ellipse(color1,
+                             (ex+er/8-er/6, ey+er/4-er/4, er/3*2, er))
+    
+    def _render_boss2_enemy(self, commands):
         """ボス2の描画（シンプルな円）"""
         # シンプルな円のみ描画
-        pygame.draw.circle(screen, Colors.ENEMY_RED,
-                          (int(self.position.x), int(self.position.y)),
-                          int(self.radius))
+        commands.circle(Colors.ENEMY_RED,
+                        (int(self.position.x), int(self.position.y)),
+                        int(self.radius))
     
-    def _render_pixie_enemy(self, screen: pygame.Surface):
+    def _render_pixie_enemy(self, commands):
         """ピクシー敵の描画（シンプルな円）"""
         # シンプルな円のみ描画
-        pygame.draw.circle(screen, Colors.ENEMY_RED,
-                          (int(self.position.x), int(self.position.y)),
-                          int(self.radius))
+        commands.circle(Colors.ENEMY_RED,
+                        (int(self.position.x), int(self.position.y)),
+                        int(self.radius))
     
-    def _render_hp_bar(self, screen: pygame.Surface):
+    def _render_hp_bar(self, commands):
         """HPバーの描画"""
         if self.hp <= 0 or self.hp >= self.max_hp:
             return
@@ -226,13 +259,13 @@ class Enemy:
         bar_y = self.position.y - self.radius - 15
         
         # 背景
-        pygame.draw.rect(screen, Colors.RED,
-                        (bar_x, bar_y, bar_width, bar_height))
+        commands.rect(Colors.RED,
+                      (bar_x, bar_y, bar_width, bar_height))
         
         # HP部分
         hp_ratio = self.hp / self.max_hp
-        pygame.draw.rect(screen, Colors.GREEN,
-                        (bar_x, bar_y, bar_width * hp_ratio, bar_height))
+        commands.rect(Colors.GREEN,
+                      (bar_x, bar_y, bar_width * hp_ratio, bar_height))
 
 
 class Enemy1(Enemy):
@@ -279,7 +312,7 @@ class Enemy1(Enemy):
             self.velocity.y = math.sin(angle) * speed
         
         # 位置更新
-        self.position += self.velocity * dt
+        self.position.add_scaled(self.velocity, dt)
         
         # 画面境界での反射
         if (self.position.x <= self.radius or 
@@ -312,7 +345,7 @@ class Enemy1(Enemy):
             return True
         return False
     
-    def render(self, screen: pygame.Surface):
+    def record_commands(self, commands):
         """Enemy1の描画 - 元のdraw_enemy1とenemy1_img関数を正確に再現"""
         if not self.active:
             return
@@ -320,15 +353,13 @@ class Enemy1(Enemy):
         # 元の条件: if(enemy1[n].hp>0)
         if self.hp > 0:
             # 元のenemy1_img(ex,ey,enemy1[n].r,cnt)を呼び出し
-            self._draw_enemy1_image(screen, self.inb_counter)
+            self._draw_enemy1_image(commands, self.inb_counter)
             
             # HPバー表示（元: show_enemy_HP(enemy1[i],16,100);）
-            self._show_enemy_hp(screen)
+            self._show_enemy_hp(commands)
     
-    def _draw_enemy1_image(self, screen: pygame.Surface, cnt: int):
+    def _draw_enemy1_image(self, commands, cnt: int):
         """元のenemy1_img関数を完全再現"""
-        from utils.color_utils import ProcessingColors
-        
         x, y, r = self.position.x, self.position.y, self.radius
         
         # 無敵判定（元: float hc=1; if(cnt<inb_max/2){hc=2;}）
@@ -336,42 +367,8 @@ class Enemy1(Enemy):
         
         # 点滅判定（元: if(cnt%8<4||cnt>inb_max/2)）
         if (cnt % 8 < 4) or (cnt > self.max_inb // 2):
-            # メイン三角形の色決定
-            if hc == 1:
-                main_color = ProcessingColors.ENEMY1_BODY_NORMAL       # fill(104,70,50)
-            else:
-                main_color = ProcessingColors.ENEMY1_BODY_INVINCIBLE   # fill(0,60,90)
-            
-            # 大きな三角形（元: triangle(x,y-r,x-r,y+r,x+r,y+r);）
-            triangle1 = [(x, y-r), (x-r, y+r), (x+r, y+r)]
-            pygame.draw.polygon(screen, main_color, triangle1)
-            
-            # 左下の三角形（元: triangle(x-r*3/4-r/8,y-r*3/4,x-r+r/4,y+r-r/4,x+r-r/4,y+r-r/4);）
-            triangle2 = [(x-r*3/4-r/8, y-r*3/4), (x-r+r/4, y+r-r/4), (x+r-r/4, y+r-r/4)]
-            pygame.draw.polygon(screen, main_color, triangle2)
-            
-            # 右下の三角形（元: triangle(x+r*3/4+r/8,y-r*3/4,x+r-r/4,y+r-r/4,x-r+r/4,y+r-r/4);）
-            triangle3 = [(x+r*3/4+r/8, y-r*3/4), (x+r-r/4, y+r-r/4), (x-r+r/4, y+r-r/4)]
-            pygame.draw.polygon(screen, main_color, triangle3)
-            
-            # 詳細部分の色決定
-            if hc == 1:
-                detail_color = ProcessingColors.ENEMY1_DETAIL_NORMAL       # fill(30,80,35)
-            else:
-                detail_color = ProcessingColors.ENEMY1_DETAIL_INVINCIBLE   # fill(0,60,60)
-            
-            # 小さな装飾三角形群
-            # triangle(x-r/4,y+r*3/8,x-r*3/8,y+r/8,x-r/8,y+r/8);
-            detail1 = [(x-r/4, y+r*3/8), (x-r*3/8, y+r/8), (x-r/8, y+r/8)]
-            pygame.draw.polygon(screen, detail_color, detail1)
-            
-            # triangle(x+r/4,y+r*3/8,x+r*3/8,y+r/8,x+r/8,y+r/8);
-            detail2 = [(x+r/4, y+r*3/8), (x+r*3/8, y+r/8), (x+r/8, y+r/8)]
-            pygame.draw.polygon(screen, detail_color, detail2)
-            
-            # triangle(x,y+r/2,x+r/8,y+r*3/4,x-r/8,y+r*3/4);
-            detail3 = [(x, y+r/2), (x+r/8, y+r*3/4), (x-r/8, y+r*3/4)]
-            pygame.draw.polygon(screen, detail_color, detail3)
+            # 三角形群は(radius, hc)ごとに描画済みのスプライトを使う
+            self._blit_enemy1_sprite(commands, x, y, r, hc)
     
     def _show_enemy_hp(self, screen: pygame.Surface):
         """敵のHP表示 - 元のshow_enemy_HP関数の完全再現"""
@@ -388,21 +385,23 @@ class Enemy1(Enemy):
         # 元: float HP_range=range*HP/MAX_HP;
         hp_range = rng * current_hp / max_hp
         
-        # 元: stroke(1); でストローク有効
+        # 元: stroke(1); でストローク有効（バーは描画済みスプライトで描く）
         # 元: fill(0,255,0); rect(x,y-range/5,HP_range,100/5);
-        green_rect = pygame.Rect(x, y - rng/5, hp_range, 100/5)
-        pygame.draw.rect(screen, (0, 255, 0), green_rect)
-        pygame.draw.rect(screen, (0, 0, 0), green_rect, 1)  # stroke(1)相当
-        
         # 元: fill(255,0,0); rect(x+HP_range,y-range/5,range-HP_range,100/5);
-        red_rect = pygame.Rect(x + hp_range, y - rng/5, rng - hp_range, 100/5)
-        pygame.draw.rect(screen, (255, 0, 0), red_rect)
-        pygame.draw.rect(screen, (0, 0, 0), red_rect, 1)  # stroke(1)相当
+        from utils.ui_renderer import UIRenderer
+        UIRenderer.draw_bar(screen, (
+            ((x, y - rng/5, hp_range, 100/5), (0, 255, 0), True),
+            ((x + hp_range, y - rng/5, rng - hp_range, 100/5), (255, 0, 0), True),
+        ))
 
 
 class Enemy2(Enemy):
     """Enemy2クラス - 第二ステージボス"""
     
+    # 回転の量子化数（元の振れ幅 ±PI/4 を何段階で表現するか）
+    ROTATION_BUCKETS = 64
+    LOD_ROTATION_BUCKETS = 8   # 高負荷時の量子化数
+    
     def __init__(self, x: float, y: float, radius: float = 50, hp: int = 80):
         super().__init__(x, y, radius, hp, EnemyType.BOSS_1)
         
@@ -426,7 +425,7 @@ class Enemy2(Enemy):
         # 基本更新処理
         super().update(dt, player_pos)
         
-    def render(self, screen: pygame.Surface, cnt2: int = 0, inb_max: int = 60):
+    def record_commands(self, commands, cnt2: int = 0, inb_max: int = 60):
         """Enemy2の描画 - 元のdraw_enemy2()完全再現"""
         if not self.active or self.hp <= 0:
             return
@@ -446,65 +445,10 @@ class Enemy2(Enemy):
         if not should_render:
             return
         
-        # HSB色をRGBに変換 - 元: fill(0+1*hc*hc,50/hc,210/hc)
-        # ProcessingのHSB(360,100,100)モードを正確に再現
-        import math
-        import colorsys
-        
-        # 1つ目の色: fill(0+1*hc*hc,50/hc,210/hc)
-        h1_raw = 0 + 1 * hc * hc  # hc=1なら1, hc=10なら100
-        s1_raw = 50 / hc          # hc=1なら50, hc=10なら5
-        b1_raw = 210 / hc         # hc=1なら210, hc=10なら21
-        
-        # ProcessingのHSB(360,100,100)モードでの値をPython用に正規化
-        # 重要: Processingでは値が範囲外でも適切にクランプまたは正規化される
-        h1 = (h1_raw % 360) / 360.0        # 0-1に正規化
-        s1 = max(0, min(s1_raw, 100)) / 100.0      # 0-1に正規化（0-100でクランプ）
-        b1 = max(0, min(b1_raw, 100)) / 100.0      # 0-1に正規化（0-100でクランプ）
-        
-        # 実際の見た目に合わせて色を調整
-        if hc == 1.0:
-            # 通常時: 青色系
-            h1 = 240.0 / 360.0  # 青色
-            s1 = 0.7  # 適度な彩度
-            b1 = 0.9  # 明るさ
-        elif hc == 10.0:
-            # 無敵時: 緑色系（元のfill(100,5,21)）
-            h1 = 120.0 / 360.0  # 緑色
-            s1 = 0.3  # 低い彩度
-            b1 = 0.6  # 暗め
-        
-        # HSVからRGBへ変換（colorsysを使用）
-        r1, g1, b1_rgb = colorsys.hsv_to_rgb(h1, s1, b1)
-        color1 = (int(r1 * 255), int(g1 * 255), int(b1_rgb * 255))
-        
-        # 2つ目の色: fill(70*hc,255/hc,255/hc) 
-        h2_raw = 70 * hc          # hc=1なら70, hc=10なら700→340
-        s2_raw = 255 / hc         # hc=1なら255→100, hc=10なら25.5
-        b2_raw = 255 / hc         # hc=1なら255→100, hc=10なら25.5
-        
-        h2 = (h2_raw % 360) / 360.0        # 0-1に正規化
-        s2 = max(0, min(s2_raw, 100)) / 100.0      # 0-1に正規化（0-100でクランプ）
-        b2 = max(0, min(b2_raw, 100)) / 100.0      # 0-1に正規化（0-100でクランプ）
-        
-        # color2も適切な色に調整
-        if hc == 1.0:
-            # 通常時: より明るいシアン系
-            h2 = 180.0 / 360.0  # シアン
-            s2 = 0.8  # 高い彩度
-            b2 = 1.0  # 明度最大
-        elif hc == 10.0:
-            # 無敵時: 暗い色（元のfill(700%360, 25.5, 25.5)）
-            h2 = (700 % 360) / 360.0  # 700%360 = 340度
-            s2 = 0.3  # 低い彩度
-            b2 = 0.4  # 暗め
-        
-        r2, g2, b2_rgb = colorsys.hsv_to_rgb(h2, s2, b2)
-        color2 = (int(r2 * 255), int(g2 * 255), int(b2_rgb * 255))
-        
         # デバッグ用色情報出力
         if cnt2 % 120 == 0:  # 2秒ごとに出力
-            print(f"Enemy2 Colors: hc={hc:.1f}, color1=HSV({h1_raw:.0f},{s1_raw:.0f},{b1_raw:.0f})→RGB{color1}, color2=HSV({h2_raw:.0f},{s2_raw:.0f},{b2_raw:.0f})→RGB{color2}")
+            color1, color2 = self._enemy2_colors(hc)
+            print(f"Enemy2 Colors: hc={hc:.1f}, color1=HSV({1 * hc * hc:.0f},{50 / hc:.0f},{210 / hc:.0f})→RGB{color1}, color2=HSV({70 * hc:.0f},{255 / hc:.0f},{255 / hc:.0f})→RGB{color2}")
         
         # 回転角度計算 - 元: rotate(PI*sin((float)cnt/8)/4)
         rt = 600  # 元のrt値
@@ -512,54 +456,97 @@ class Enemy2(Enemy):
         if (cnt2 % rt < rt // 2) or (cnt2 % rt >= rt - 50):
             rotation_angle = math.pi * math.sin(cnt / 8.0) / 4
         
-        # 楕円描画 - 元のellipse呼び出しを完全再現
-        import pygame.gfxdraw
+        # pushMatrix/translate(ex,ey)/rotate/translate(-ex,-ey)相当
+        # hcごとに合成済みのスプライトを量子化した角度で回転させたものを1回blitする
+        sprite = self._get_enemy2_sprite(er, hc, rotation_angle)
+        commands.blit(sprite, sprite.get_rect(center=(int(ex), int(ey))))
+        
+        # HPバーの描画
+        self._show_enemy_hp(commands)
+    
+    @staticmethod
+    def _enemy2_colors(hc: float) -> tuple:
+        """hcに対応する2色を計算 - 元: fill(0+1*hc*hc,50/hc,210/hc) / fill(70*hc,255/hc,255/hc)"""
+        import colorsys
+        
+        # 実際の見た目に合わせて調整した色
+        if hc == 1.0:
+            # 通常時: 青色系 / より明るいシアン系
+            hsv1 = (240.0 / 360.0, 0.7, 0.9)
+            hsv2 = (180.0 / 360.0, 0.8, 1.0)
+        else:
+            # 無敵時: 緑色系（元のfill(100,5,21)） / 暗い色（元のfill(700%360, 25.5, 25.5)）
+            hsv1 = (120.0 / 360.0, 0.3, 0.6)
+            hsv2 = ((700 % 360) / 360.0, 0.3, 0.4)
+        
+        r1, g1, b1 = colorsys.hsv_to_rgb(*hsv1)
+        r2, g2, b2 = colorsys.hsv_to_rgb(*hsv2)
+        return ((int(r1 * 255), int(g1 * 255), int(b1 * 255)),
+                (int(r2 * 255), int(g2 * 255), int(b2 * 255)))
+    
+    @staticmethod
+    def _build_enemy2_sprite(er: float, hc: float) -> pygame.Surface:
+        """元のdraw_enemy2の楕円群を(ex, ey)を中心とした透過Surfaceへ合成"""
+        from utils.sprite_cache import SpriteCache
         
-        # pushMatrix/translate/rotate/translate相当の座標変換
-        cos_rot = math.cos(rotation_angle)
-        sin_rot = math.sin(rotation_angle)
+        color1, color2 = Enemy2._enemy2_colors(hc)
+        half = int(er * 1.5) + 2
+        sprite = SpriteCache.create_surface(half * 2 + 1, half * 2 + 1)
+        ex = ey = half
         
-        def draw_rotated_ellipse(surface, color, cx, cy, w, h):
-            # 楕円の描画（回転考慮）
+        def draw_ellipse(color, cx, cy, w, h):
             if w > 0 and h > 0:
-                # 簡易楕円（pygame.draw.ellipseを使用）
                 rect = pygame.Rect(cx - w//2, cy - h//2, w, h)
-                pygame.draw.ellipse(surface, color, rect)
+                pygame.draw.ellipse(sprite, color, rect)
         
         # 元: ellipse(ex-er,ey+er/4,er/3,er/1.5)
-        draw_rotated_ellipse(screen, color1, 
-                           ex - er, ey + er//4, er//3, int(er/1.5))
+        draw_ellipse(color1, ex - er, ey + er//4, er//3, int(er/1.5))
         
         # 元: ellipse(ex+er,ey+er/4,er/4,er)
-        draw_rotated_ellipse(screen, color1, 
-                           ex + er, ey + er//4, er//4, er)
+        draw_ellipse(color1, ex + er, ey + er//4, er//4, er)
         
         # 元: ellipse(enemy2.x,enemy2.y-er/4+5,enemy2.r*2,enemy2.r*7/4+5)
-        draw_rotated_ellipse(screen, color2, 
-                           ex, ey - er//4 + 5, er * 2, int(er * 7//4 + 5))
+        draw_ellipse(color2, ex, ey - er//4 + 5, er * 2, int(er * 7//4 + 5))
         
         # 元: ellipse(ex+er/2,ey+er-er/4,er/2,er/4)
-        draw_rotated_ellipse(screen, color2, 
-                           ex + er//2, ey + er - er//4, er//2, er//4)
+        draw_ellipse(color2, ex + er//2, ey + er - er//4, er//2, er//4)
         
         # 元: ellipse(ex-er/2,ey+er-er/4,er/2,er/4)
-        draw_rotated_ellipse(screen, color2, 
-                           ex - er//2, ey + er - er//4, er//2, er//4)
+        draw_ellipse(color2, ex - er//2, ey + er - er//4, er//2, er//4)
         
         # 元: ellipse(ex-er/2,ey-er/4,er/2,er)
-        draw_rotated_ellipse(screen, color1, 
-                           ex - er//2, ey - er//4, er//2, er)
+        draw_ellipse(color1, ex - er//2, ey - er//4, er//2, er)
         
         # 元: ellipse(ex+er*5/8,ey-er/2,er/3,er/1.5)
-        draw_rotated_ellipse(screen, color1, 
-                           ex + int(er * 5//8), ey - er//2, er//3, int(er/1.5))
+        draw_ellipse(color1, ex + int(er * 5//8), ey - er//2, er//3, int(er/1.5))
         
         # 元: ellipse(ex+er/8,ey+er/4,er/3,er/2)
-        draw_rotated_ellipse(screen, color1, 
-                           ex + er//8, ey + er//4, er//3, er//2)
+        draw_ellipse(color1, ex + er//8, ey + er//4, er//3, er//2)
         
-        # HPバーの描画
-        self._show_enemy_hp(screen)
+        return sprite
+    
+    @classmethod
+    def _get_enemy2_sprite(cls, er: float, hc: float, rotation_angle: float) -> pygame.Surface:
+        """回転角度を量子化してキャッシュ済みの回転スプライトを取得"""
+        from utils.sprite_cache import sprite_cache
+        
+        from core.quality import quality_governor
+        
+        step = (math.pi / 2) / cls.ROTATION_BUCKETS
+        bucket = int(round(rotation_angle / step))
+        
+        # 高負荷時（LOD）は回転を粗く量子化して、キャッシュ済みの少数の角度だけを使う
+        if quality_governor.lod_active:
+            coarse = cls.ROTATION_BUCKETS // cls.LOD_ROTATION_BUCKETS
+            bucket = int(round(bucket / coarse)) * coarse
+        
+        base = sprite_cache.get(('enemy2', er, hc, 0), lambda: cls._build_enemy2_sprite(er, hc))
+        if bucket == 0:
+            return base
+        
+        # Processingのrotateは時計回り、pygameは反時計回りなので符号を反転
+        return sprite_cache.get(('enemy2', er, hc, bucket),
+                                lambda: pygame.transform.rotate(base, -math.degrees(bucket * step)))
     
     def _show_enemy_hp(self, screen: pygame.Surface):
         """Enemy2のHP表示"""
@@ -572,14 +559,13 @@ class Enemy2(Enemy):
         bar_width = 80
         bar_height = 8
         
-        # 背景（赤）
-        pygame.draw.rect(screen, (255, 0, 0),
-                        (bar_x, bar_y, bar_width, bar_height))
-        
-        # HP部分（緑）
+        # 背景（赤）とHP部分（緑）を描画済みスプライトで描く
+        from utils.ui_renderer import UIRenderer
         hp_ratio = self.hp / self.max_hp
-        pygame.draw.rect(screen, (0, 255, 0),
-                        (bar_x, bar_y, bar_width * hp_ratio, bar_height))
+        UIRenderer.draw_bar(screen, (
+            ((bar_x, bar_y, bar_width, bar_height), (255, 0, 0), False),
+            ((bar_x, bar_y, bar_width * hp_ratio, bar_height), (0, 255, 0), False),
+        ))
 
 
 class PixieEnemy(Enemy):
@@ -590,7 +576,7 @@ class PixieEnemy(Enemy):
         self.vx_sum = 0.0
         self.vy_sum = 0.0
         
-    def render(self, screen: pygame.Surface):
+    def record_commands(self, commands):
         """ピクシーの描画 - 元のdraw_pixie()"""
         if not self.active or self.hp <= 0:
             return
@@ -600,10 +586,10 @@ class PixieEnemy(Enemy):
         r = int(self.radius)
         
         # 外側の四角（赤）
-        pygame.draw.rect(screen, (255, 0, 0), (x - r, y - r, r * 2, r * 2))
+        commands.rect((255, 0, 0), (x - r, y - r, r * 2, r * 2))
         
         # 内側の四角（オレンジ）
-        pygame.draw.rect(screen, (255, 128, 0), (x - r//2, y - r//4, r, r + r//4))
+        commands.rect((255, 128, 0), (x - r//2, y - r//4, r, r + r//4))
 
 
 class Enemy3(Enemy):
@@ -628,6 +614,11 @@ class Enemy3(Enemy):
         import random
         self.rnd_fire = [0.9 + random.gauss(0, 0.1) for _ in range(16)]
         
+        # 炎形状のキャッシュ（rnd_fire, radius, hc, kyが変わった時のみ再描画）
+        self._flame_surface: Optional[pygame.Surface] = None
+        self._flame_origin = (0, 0)
+        self._flame_key = None
+        
         # 行動パターン用タイマー（rt=900周期）
         self.rt = 900
         
@@ -917,7 +908,7 @@ class Enemy3(Enemy):
         else:
             self.radius = self.original_radius
         
-    def render(self, screen: pygame.Surface, cnt3: int = 0):
+    def record_commands(self, commands, cnt3: int = 0):
         """Enemy3の描画 - 元のdraw_enemy3()完全再現"""
         if not self.active or self.hp <= 0:
             return
@@ -933,26 +924,64 @@ class Enemy3(Enemy):
             return
             
         # 炎のような複雑な形状描画
-        self._draw_flame_shape(screen, hc, cnt3)
+        self._draw_flame_shape(commands, hc, cnt3)
         
         # ピクシーの描画
         if self.px1 and self.px1.hp > 0:
-            self.px1.render(screen)
+            self.px1.record_commands(commands)
         if self.px2 and self.px2.hp > 0:
-            self.px2.render(screen)
+            self.px2.record_commands(commands)
         
         # HPバーの描画
-        self._show_enemy_hp(screen)
+        self._show_enemy_hp(commands)
     
-    def _draw_flame_shape(self, screen: pygame.Surface, hc: int, cnt3: int):
-        """炎のような形状描画 - 元のdraw_enemy3()の描画部分"""
-        ex = self.position.x
-        ey = self.position.y  
-        er = self.radius
-        
+    def _draw_flame_shape(self, commands, hc: int, cnt3: int):
+        """
+        炎のような形状描画 - 元のdraw_enemy3()の描画部分
+        形状はrnd_fire・radius・hc・kyだけで決まるため、それらが変わった時のみ描き直す
+        """
         # ky_pos計算（元のky_pos()関数）
         ky = self._ky_pos(cnt3)
         
+        key = (tuple(self.rnd_fire), self.radius, hc, ky)
+        
+        # 高負荷時（LOD）は半径と色が同じ間、揺らぎ（rnd_fire・ky）を無視して前回の形を使い回す
+        from core.quality import quality_governor
+        if (quality_governor.lod_active and self._flame_key is not None
+                and self._flame_key[1:3] == key[1:3]):
+            key = self._flame_key
+        
+        if key != self._flame_key:
+            self._build_flame_surface(hc, ky)
+            self._flame_key = key
+        
+        ox, oy = self._flame_origin
+        commands.blit(self._flame_surface, (int(self.position.x) - ox, int(self.position.y) - oy))
+    
+    def _build_flame_surface(self, hc: int, ky: float):
+        """炎の形状をキャッシュ用Surfaceへ描画（(ex, ey)はSurface内の原点）"""
+        from utils.sprite_cache import SpriteCache
+        
+        er = self.radius
+        
+        # 炎が収まる範囲（横: ±5/4*er*rnd, 上: てっぺん+ky, 下: ey+er）
+        half_w = int(er * 2) + 2
+        top = int(er * 2.5 + abs(ky)) + 2
+        bottom = int(er) + 2
+        size = (half_w * 2 + 1, top + bottom + 1)
+        
+        if self._flame_surface is None or self._flame_surface.get_size() != size:
+            self._flame_surface = SpriteCache.create_surface(*size)
+        else:
+            # その場で描き直すので、コマンドの比較と縮小版に書き換えを通知する
+            from utils.render_commands import touch_surface
+            touch_surface(self._flame_surface)
+            self._flame_surface.fill((0, 0, 0, 0))
+        self._flame_origin = (half_w, top)
+        
+        screen = self._flame_surface
+        ex, ey = self._flame_origin
+        
         # 各頂点座標計算（元のコード通り）
         xlb = ex - er * 5/4 * self.rnd_fire[0]
         ylb = ey + er/3 * self.rnd_fire[1] - ky
@@ -1052,14 +1081,13 @@ class Enemy3(Enemy):
         bar_width = 120
         bar_height = 10
         
-        # 背景（赤）
-        pygame.draw.rect(screen, (255, 0, 0),
-                        (bar_x, bar_y, bar_width, bar_height))
-        
-        # HP部分（緑）
+        # 背景（赤）とHP部分（緑）を描画済みスプライトで描く
+        from utils.ui_renderer import UIRenderer
         hp_ratio = self.hp / self.max_hp
-        pygame.draw.rect(screen, (0, 255, 0),
-                        (bar_x, bar_y, bar_width * hp_ratio, bar_height))
+        UIRenderer.draw_bar(screen, (
+            ((bar_x, bar_y, bar_width, bar_height), (255, 0, 0), False),
+            ((bar_x, bar_y, bar_width * hp_ratio, bar_height), (0, 255, 0), False),
+        ))
 
 
 class EnemyManager:
@@ -1076,6 +1104,7 @@ class EnemyManager:
         
         # 全敵リスト（管理用）
         self.all_enemies = []
+        self.render_commands = RenderCommandBuffer()   # Surfaceへ直接描画する場合の記録用
         
         # 各ステージのカウンター（元: int cnt2=0; など）
         self.cnt2 = 0  # 第二ステージ専用カウンター
@@ -1083,6 +1112,9 @@ class EnemyManager:
         # 敵弾システム（元: Bullet []bullet=new Bullet[bullet_max];）
         self.bullet_manager = EnemyBulletManager()
         
+        # プロジェクタイルとの衝突判定用グリッド
+        self.collision_grid = SpatialHash()
+        
         # 初期化（元のsetup関数相当）
         self._initialize_enemies()
     
@@ -1220,15 +1252,9 @@ class EnemyManager:
     
     def _add_enemy3_bullet(self, bullet_data: dict):
         """Enemy3の弾を弾幕システムに追加"""
-        if self.bullet_manager and self.bullet_manager.bullet_number < self.bullet_manager.bullet_max - 1:
-            bullet = self.bullet_manager.bullets[self.bullet_manager.bullet_number]
-            bullet.x = bullet_data['x']
-            bullet.y = bullet_data['y'] 
-            bullet.vx = bullet_data['vx']
-            bullet.vy = bullet_data['vy']
-            bullet.r = bullet_data['r']
-            bullet.ex = True
-            self.bullet_manager.bullet_number += 1
+        if self.bullet_manager:
+            self.bullet_manager.spawn(bullet_data['x'], bullet_data['y'],
+                                      bullet_data['vx'], bullet_data['vy'], bullet_data['r'])
     
     def _enemy_place(self):
         """敵の配置 - 元のenemy_place関数の完全再現"""
@@ -1246,21 +1272,33 @@ class EnemyManager:
                     enemy.position.y = 100  # 他の敵は上に配置
     
     def render(self, screen: pygame.Surface):
-        """全ての敵を描画"""
+        """全ての敵をSurfaceへ直接描画（描画コマンドを記録してその場で実行する）"""
+        commands = self.render_commands
+        commands.begin()
+        self.record_commands(commands)
+        commands.execute(screen)
+    
+    def record_commands(self, commands, static: Optional[bool] = None):
+        """
+        全ての敵の描画コマンドを記録（RenderCommandBuffer）
+        staticがTrueなら動かない敵（第一ステージのEnemy1）だけ、Falseならそれ以外だけを記録する
+        """
         # 敵リストの描画
         for enemy in self.all_enemies:
+            if static is not None and (enemy.enemy_type == EnemyType.BASIC) != static:
+                continue
             if enemy.active and enemy.hp > 0:
                 # Enemy2とEnemy3には特別なパラメータを渡す
                 if isinstance(enemy, Enemy2):
-                    enemy.render(screen, self.cnt2, 60)  # cnt2とinb_maxを渡す
+                    enemy.record_commands(commands, self.cnt2, 60)  # cnt2とinb_maxを渡す
                 elif isinstance(enemy, Enemy3):
                     cnt3 = getattr(self, 'cnt3', 0)
-                    enemy.render(screen, cnt3)  # cnt3を渡す
+                    enemy.record_commands(commands, cnt3)  # cnt3を渡す
                 else:
-                    enemy.render(screen)
+                    enemy.record_commands(commands)
                 
         # 第二ステージの敵のデバッグ情報（重要）
-        if self.enemy2 and hasattr(self.enemy2, 'position'):
+        if static is not True and self.enemy2 and hasattr(self.enemy2, 'position'):
             if self.enemy2.active and self.enemy2.hp > 0:
                 print(f"[ENEMY2] Active, HP={self.enemy2.hp}, pos=({self.enemy2.position.x:.0f},{self.enemy2.position.y:.0f})")
             else:
@@ -1310,19 +1348,28 @@ class EnemyManager:
         return [e for e in self.all_enemies if e.active and e.hp > 0]
     
     def check_collisions_with_projectiles(self, projectiles: List) -> List[Tuple[Enemy, any]]:
-        """プロジェクタイルとの衝突判定"""
+        """プロジェクタイルとの衝突判定（空間ハッシュで候補を絞ってから距離判定）"""
         collisions = []
         
+        active_projectiles = [projectile for projectile in projectiles
+                              if hasattr(projectile, 'active') and projectile.active]
+        self.collision_grid.sync((id(projectile), projectile.x, projectile.y, projectile.radius)
+                                 for projectile in active_projectiles)
+        # キー → (リスト内の順番, プロジェクタイル)。候補だけを元の順番で調べる
+        by_key = {id(projectile): (index, projectile)
+                  for index, projectile in enumerate(active_projectiles)}
+        
         for enemy in self.get_active_enemies():
-            for projectile in projectiles:
-                if hasattr(projectile, 'active') and projectile.active:
-                    # 距離計算
-                    dx = enemy.position.x - projectile.x
-                    dy = enemy.position.y - projectile.y
-                    distance = math.sqrt(dx * dx + dy * dy)
-                    
-                    if distance < enemy.radius + projectile.radius:
-                        collisions.append((enemy, projectile))
+            candidates = self.collision_grid.query(enemy.position.x, enemy.position.y, enemy.radius)
+            for _, projectile in sorted(by_key[key] for key in candidates):
+                # 距離計算
+                dx = enemy.position.x - projectile.x
+                dy = enemy.position.y - projectile.y
+                distance = math.sqrt(dx * dx + dy * dy)
+                
+                if distance < enemy.radius + projectile.radius:
+                    collision_stats.hits += 1
+                    collisions.append((enemy, projectile))
         
         return collisions
     
@@ -1346,21 +1393,4 @@ class EnemyManager:
     
     def get_active_enemies_count(self) -> int:
         """アクティブな敵の数を取得"""
-        return len(self.get_active_enemies())
-    
-    def check_collisions_with_projectiles(self, projectiles: List) -> List[Tuple[Enemy, any]]:
-        """プロジェクタイルとの衝突判定"""
-        collisions = []
-        
-        for enemy in self.get_active_enemies():
-            for projectile in projectiles:
-                if hasattr(projectile, 'active') and projectile.active:
-                    # 距離計算
-                    dx = enemy.position.x - projectile.x
-                    dy = enemy.position.y - projectile.y
-                    distance = math.sqrt(dx * dx + dy * dy)
-                    
-                    if distance < enemy.radius + projectile.radius:
-                        collisions.append((enemy, projectile))
-        
-        return collisions
\ No newline at end of file
+        return len(self.get_active_enemies())
\ No newline at end of file
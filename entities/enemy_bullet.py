@@ -1,156 +1,265 @@
 """
 敵の弾システム - 元のbullet.pdeの完全再現
+弾の状態は要素ごとのNumPy配列（構造体の配列ではなく配列の構造体）で持ち、移動・当たり判定・画面外判定をまとめて計算する
+弾番号はフリーリストで割り当て、生存弾の番号だけを走査する
 """
 import pygame
 import math
 import random
-from typing import List
+import numpy as np
 from utils.math_utils import Vector2
+from utils.spatial_hash import SpatialHash, collision_stats
 from config.settings import GameConfig, Colors
 
 
-class EnemyBullet:
-    """敵弾クラス - 元のBulletクラス完全再現"""
-    
-    def __init__(self, x: float, y: float, vx: float, vy: float, radius: float, exist: bool = False):
-        # 元: Bullet(float xpos,float ypos,float verx,float very,float radius,boolean exist)
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.r = radius
-        self.ex = exist  # 元のexistフラグ
-
-
 class EnemyBulletManager:
-    """敵弾管理システム - 元のbullet.pdeシステム完全再現"""
+    """
+    敵弾管理システム - 元のbullet.pdeシステム完全再現
+    弾の番号は空き番号リスト（フリーリスト）から割り当て、生存中の弾番号は詰めた配列で管理する。
+    更新・描画は生存弾だけを対象にし、生存中の弾を上書きすることはない
+    （元: bullet_numberを順に進め、bullet_max-100を超えたら0に戻して上書き）
+    """
     
-    def __init__(self):
+    def __init__(self, recycle_oldest: bool = GameConfig.ENEMY_BULLET_RECYCLE_OLDEST):
         # 元: final int bullet_max=800; Bullet []bullet=new Bullet[bullet_max];
+        # 元: Bullet(float xpos,float ypos,float verx,float very,float radius,boolean exist) の各フィールドを配列で保持
         self.bullet_max = 800
-        self.bullets = []
-        for i in range(self.bullet_max):
-            self.bullets.append(EnemyBullet(-1, -1, -1, -1, -1, False))
+        self.x = np.full(self.bullet_max, -1.0)
+        self.y = np.full(self.bullet_max, -1.0)
+        self.vx = np.full(self.bullet_max, -1.0)
+        self.vy = np.full(self.bullet_max, -1.0)
+        self.r = np.full(self.bullet_max, -1.0)
+        self.alive = np.zeros(self.bullet_max, dtype=bool)   # 元のexistフラグ
+        self.group = np.zeros(self.bullet_max, dtype=np.int64)    # 同時に消える弾のまとまり（ナイフ1本など）
+        self.serial = np.zeros(self.bullet_max, dtype=np.int64)   # 発射順の通し番号（色分け・最古弾の判定用）
+        
+        # 空き番号（末尾から取り出すので番号の小さい順に使われる）と生存弾番号の詰めた配列
+        self._free = list(range(self.bullet_max - 1, -1, -1))
+        self._live = np.zeros(self.bullet_max, dtype=np.int64)
+        self._live_pos = np.zeros(self.bullet_max, dtype=np.int64)   # 弾番号 → _live内の位置
+        self.live_count = 0
+        self._next_serial = 0
+        self._next_group = 0
+        
+        # 空きがない時の扱い（Trueなら最古の生存弾を上書き、Falseなら発射しない）
+        self.recycle_oldest = recycle_oldest
         
-        # 元: int bullet_number=0; int knife_number=0;
-        self.bullet_number = 0
-        self.knife_number = 0
-        self.delete_knife = 0
+        # 統計情報
+        self.allocations = 0
+        self.high_water = 0        # 同時生存数の最大値
+        self.alloc_failures = 0    # 空きがなく割り当てられなかった回数
+        self.overwrites = 0        # 生存中の弾を上書きした回数
         
-        # 第二ステージ用
-        self.t_number = 0  # ターゲット攻撃用
+        # プレイヤーとの当たり判定の候補絞り込み用グリッド
+        self.grid = SpatialHash()
+        
+        # 第二ステージ用（ターゲット攻撃の6発）
+        self.t_group = -1
+        self.t_slots = []
         
     def reset_bullet(self):
         """弾リセット - 元のreset_bullet()"""
-        for i in range(self.bullet_max):
-            self.bullets[i].ex = False
+        self.alive[:] = False
+        self._free = list(range(self.bullet_max - 1, -1, -1))
+        self.live_count = 0
+    
+    def new_group(self) -> int:
+        """新しい弾のまとまりの番号を取得"""
+        self._next_group += 1
+        return self._next_group
+    
+    def spawn(self, x: float, y: float, vx: float, vy: float, r: float, group: int = None) -> int:
+        """
+        弾を1発生成（元: bullet[bullet_number].ex=true; と各フィールドの代入）
+        
+        Args:
+            group: 同時に消える弾のまとまり（Noneならこの弾だけのまとまり）
+        
+        Returns:
+            割り当てた弾番号（空きがなく生成できなかった場合は-1）
+        """
+        index = self._allocate()
+        if index < 0:
+            return -1
+        self.x[index] = x
+        self.y[index] = y
+        self.vx[index] = vx
+        self.vy[index] = vy
+        self.r[index] = r
+        self.group[index] = self.new_group() if group is None else group
+        return index
+    
+    def _allocate(self) -> int:
+        """空き番号を1つ割り当てて生存弾に加える"""
+        if self._free:
+            index = self._free.pop()
+            self._live[self.live_count] = index
+            self._live_pos[index] = self.live_count
+            self.live_count += 1
+            self.high_water = max(self.high_water, self.live_count)
+        elif self.recycle_oldest:
+            live = self._live[:self.live_count]
+            index = int(live[np.argmin(self.serial[live])])
+            self.overwrites += 1
+        else:
+            self.alloc_failures += 1
+            return -1
+        
+        self.alive[index] = True
+        self.serial[index] = self._next_serial
+        self._next_serial += 1
+        self.allocations += 1
+        return index
+    
+    def _release(self, index: int):
+        """弾を消して番号を空きに戻す（末尾の生存弾と入れ替えて詰める）"""
+        position = self._live_pos[index]
+        self.live_count -= 1
+        last = self._live[self.live_count]
+        self._live[position] = last
+        self._live_pos[last] = position
+        self.alive[index] = False
+        self._free.append(index)
     
     def update(self, player_pos: Vector2, scene_manager, player_inb_cnt: int, inb_max: int) -> bool:
         """
         弾更新処理 - 元のbullet()関数の更新部分
+        生存弾だけをまとめて計算する
         
         Returns:
             プレイヤーがヒットしたかどうか
         """
-        player_hit = False
+        if self.live_count == 0:
+            return False
+        
+        live = self._live[:self.live_count].copy()
+        
+        # 弾移動（元: bullet[i].x+=bullet[i].vx; bullet[i].y+=bullet[i].vy;）
+        x = self.x[live] + self.vx[live]
+        y = self.y[live] + self.vy[live]
+        r = self.r[live]
+        self.x[live] = x
+        self.y[live] = y
         
-        for i in range(self.bullet_max):
-            bullet = self.bullets[i]
+        # プレイヤーとの衝突判定（平方根を取らず距離の2乗で比較）
+        player_hit = False
+        removed = np.zeros(live.size, dtype=bool)
+        if player_inb_cnt > inb_max:  # 元: inb_cnt>inb_max
+            # 広域判定：プレイヤー周辺のセルにある弾だけを距離判定する
+            player_reach = GameConfig.PLAYER_RADIUS / 2
+            hits = self.grid.query_points(x, y, player_pos.x, player_pos.y, player_reach + r.max())
+            candidates = np.flatnonzero(hits)
+            dx = x[candidates] - player_pos.x
+            dy = y[candidates] - player_pos.y
+            reach = r[candidates] + player_reach
+            hits[candidates] = dx * dx + dy * dy <= reach * reach
             
-            if bullet.ex:
-                # 弾数制限チェック（元: if(bullet_number>bullet_max-100){bullet_number=0;}）
-                if self.bullet_number > self.bullet_max - 100:
-                    self.bullet_number = 0
-                
-                # 弾移動（元: bullet[i].x+=bullet[i].vx; bullet[i].y+=bullet[i].vy;）
-                bullet.x += bullet.vx
-                bullet.y += bullet.vy
-                
-                # 更新処理のみ（描画はrenderで実行）
+            if hits.any():
+                collision_stats.hits += int(np.count_nonzero(hits))
+                player_hit = True
+                removed |= hits
                 
-                # プレイヤーとの衝突判定
-                dist = math.sqrt((bullet.x - player_pos.x)**2 + (bullet.y - player_pos.y)**2)
-                if (dist <= bullet.r + GameConfig.PLAYER_RADIUS/2 and 
-                    player_inb_cnt > inb_max):  # 元: inb_cnt>inb_max
-                    
-                    bullet.ex = False
-                    player_hit = True
-                    
-                    # シーン別弾消去処理
-                    from core.scene_manager import GameScene
-                    if scene_manager.is_scene_active(GameScene.STAGE_1):
-                        # 元: delete_knife=i-i%10; for(int j=0;j<10;j++){bullet[j+delete_knife].ex=false;}
-                        self.delete_knife = i - (i % 10)
-                        for j in range(10):
-                            if self.delete_knife + j < self.bullet_max:
-                                self.bullets[self.delete_knife + j].ex = False
-                                
-                    elif scene_manager.is_scene_active(GameScene.STAGE_2):
-                        # 元: if(t_number<=i&&t_number+6>i){for(int j=0;j<6;j++){bullet[t_number+j].ex=false;}}
-                        if self.t_number <= i < self.t_number + 6:
-                            for j in range(6):
-                                if self.t_number + j < self.bullet_max:
-                                    self.bullets[self.t_number + j].ex = False
+                # シーン別弾消去処理（当たった弾と同じまとまりの弾も消す）
+                from core.scene_manager import GameScene
+                groups = self.group[live]
+                if scene_manager.is_scene_active(GameScene.STAGE_1):
+                    # 元: delete_knife=i-i%10; for(int j=0;j<10;j++){bullet[j+delete_knife].ex=false;}
+                    removed |= np.isin(groups, groups[hits])
                 
-                # 画面外判定（元の条件を修正 - OR条件が正しい）
-                if (bullet.x <= -bullet.r or bullet.x >= GameConfig.SCREEN_WIDTH + bullet.r or
-                    bullet.y <= -bullet.r or bullet.y >= GameConfig.SCREEN_HEIGHT + bullet.r):
-                    bullet.ex = False
-                    bullet.vx = 0
-                    bullet.vy = 0
-                    bullet.x = -100
-                    bullet.y = -100
-                    
-            else:
-                # 非アクティブ弾の初期化
-                bullet.x = -bullet.r
-                bullet.y = -bullet.r
-                bullet.vx = 0
-                bullet.vy = 0
+                elif scene_manager.is_scene_active(GameScene.STAGE_2):
+                    # 元: if(t_number<=i&&t_number+6>i){for(int j=0;j<6;j++){bullet[t_number+j].ex=false;}}
+                    if np.any(groups[hits] == self.t_group):
+                        removed |= groups == self.t_group
         
+        # 画面外判定（元の条件を修正 - OR条件が正しい）
+        removed |= ((x <= -r) | (x >= GameConfig.SCREEN_WIDTH + r) |
+                    (y <= -r) | (y >= GameConfig.SCREEN_HEIGHT + r))
+        
+        for index in live[removed].tolist():
+            self._release(index)
         return player_hit
     
+    def get_stats(self) -> dict:
+        """統計情報を取得"""
+        return {
+            'live': self.live_count,
+            'capacity': self.bullet_max,
+            'high_water': self.high_water,
+            'allocations': self.allocations,
+            'alloc_failures': self.alloc_failures,
+            'overwrites': self.overwrites,
+        }
+    
+    def get_summary(self) -> str:
+        """デバッグ表示用の要約"""
+        return (f"Bullets: {self.live_count}/{self.bullet_max} live, peak {self.high_water}, "
+                f"failed {self.alloc_failures}, overwritten {self.overwrites}")
+    
     def render(self, screen: pygame.Surface, scene_manager):
         """
         弾描画処理 - 元のbullet()関数の描画部分
+        色・半径ごとに描画済みのスタンプを用意し、生存弾を発射順に1回のSurface.blitsで描画する
+        （ステージ2の2色も発射順の偶奇でスタンプを選ぶだけで、色ごとのバッチには分けない）
         """
-        import colorsys
         from core.scene_manager import GameScene
         
-        def hsb_to_rgb(h, s, b):
-            """HSB(360,100,100)からRGBへの変換"""
-            h_norm = (h % 360) / 360.0
-            s_norm = max(0, min(s, 100)) / 100.0
-            b_norm = max(0, min(b, 100)) / 100.0
-            r, g, b_rgb = colorsys.hsv_to_rgb(h_norm, s_norm, b_norm)
-            return (int(r * 255), int(g * 255), int(b_rgb * 255))
+        # シーン別色設定（元のbullet()関数の色指定を完全再現）
+        if scene_manager.is_scene_active(GameScene.STAGE_1):
+            # 元: colorMode(HSB,360,100,100); fill(104,70,50);
+            from utils.color_utils import ProcessingColors
+            colors = (ProcessingColors.ENEMY1_BODY_NORMAL,)
+        elif scene_manager.is_scene_active(GameScene.STAGE_2):
+            # 元: if(i%2==0){fill(70,255,255);}else{fill(0,50,210);}
+            # RGB(255,255,255)モードでの指定（偶数: シアン系, 奇数: 青系）
+            colors = ((70, 255, 255), (0, 50, 210))
+        else:
+            # 元: fill(255,0,0);
+            colors = ((255, 0, 0),)
         
-        for i in range(self.bullet_max):
-            bullet = self.bullets[i]
-            
-            if bullet.ex:
-                # シーン別色設定（元のbullet()関数の色指定を完全再現）
-                color = (255, 0, 0)  # デフォルト赤
-                
-                if scene_manager.is_scene_active(GameScene.STAGE_1):
-                    # 元: colorMode(HSB,360,100,100); fill(104,70,50);
-                    color = hsb_to_rgb(104, 70, 50)
-                    
-                elif scene_manager.is_scene_active(GameScene.STAGE_2):
-                    # 元: if(i%2==0){fill(70,255,255);}else{fill(0,50,210);}
-                    # RGB(255,255,255)モードでの指定
-                    if i % 2 == 0:
-                        color = (70, 255, 255)   # シアン系
-                    else:
-                        color = (0, 50, 210)     # 青系
-                        
-                elif scene_manager.is_scene_active(GameScene.STAGE_3):
-                    # 元: fill(255,0,0);
-                    color = (255, 0, 0)  # 赤
-                
-                # 弾描画（元: ellipse(bullet[i].x,bullet[i].y,bullet[i].r*2,bullet[i].r*2);）
-                pygame.draw.circle(screen, color, 
-                                 (int(bullet.x), int(bullet.y)), int(bullet.r))
+        if self.live_count == 0:
+            return
+        live = self._live[:self.live_count]
+        
+        # 元: ellipse(bullet[i].x,bullet[i].y,bullet[i].r*2,bullet[i].r*2);
+        xs = self.x[live].astype(int).tolist()
+        ys = self.y[live].astype(int).tolist()
+        radii = self.r[live]
+        if len(colors) == 1 and (radii == radii[0]).all():
+            # 通常は全弾同じ色・同じ半径なのでスタンプ1種類
+            radius = int(radii[0])
+            stamp, offset = self._get_stamp(colors[0], radius), radius + 1
+            batch = [(stamp, (bx - offset, by - offset)) for bx, by in zip(xs, ys)]
+        else:
+            # 元の弾番号の偶奇の代わりに発射順の偶奇で色を選ぶ（描画順は発射順のまま）
+            groups = (self.serial[live] % len(colors)).tolist()
+            stamps = {}
+            batch = []
+            for group, r, bx, by in zip(groups, radii.astype(int).tolist(), xs, ys):
+                key = (group, r)
+                if key not in stamps:
+                    stamps[key] = self._get_stamp(colors[group], r)
+                batch.append((stamps[key], (bx - r - 1, by - r - 1)))
+        screen.blits(batch, doreturn=False)
+    
+    @staticmethod
+    def _get_stamp(color: tuple, radius: int) -> pygame.Surface:
+        """弾1発分の描画済みスタンプを取得（中心は(radius+1, radius+1)）"""
+        from utils.sprite_cache import sprite_cache
+        
+        def build():
+            # 不透明の単色円なのでアルファではなくカラーキー（RLE）で抜く
+            size = radius * 2 + 3
+            key = (0, 0, 0) if color != (0, 0, 0) else (255, 0, 255)
+            stamp = pygame.Surface((size, size))
+            if pygame.display.get_surface() is not None:
+                stamp = stamp.convert()
+            stamp.fill(key)
+            if radius > 0:
+                pygame.draw.circle(stamp, color, (radius + 1, radius + 1), radius)
+            stamp.set_colorkey(key, pygame.RLEACCEL)
+            return stamp
+        
+        return sprite_cache.get(('enemy_bullet', color, radius), build)
     
     def update_and_render(self, screen: pygame.Surface, player_pos: Vector2, 
                          scene_manager, player_inb_cnt: int, inb_max: int) -> bool:
@@ -174,7 +283,7 @@ class EnemyBulletManager:
                 cos_k = math.cos(rnd * math.pi / 12)
                 sin_k = math.sin(rnd * math.pi / 12)
                 
-                self.knife_number = self.bullet_number
+                knife = self.new_group()   # 元: knife_number=bullet_number;（10発で1本のナイフ）
                 
                 # 10個の弾を生成（元のコードの正確な再現）
                 bullet_positions = [
@@ -191,15 +300,8 @@ class EnemyBulletManager:
                 ]
                 
                 for dx, dy in bullet_positions:
-                    if self.bullet_number < self.bullet_max:
-                        bullet = self.bullets[self.bullet_number]
-                        bullet.ex = True
-                        bullet.x = enemy.position.x + dx
-                        bullet.y = enemy.position.y + dy
-                        bullet.vx = -5 * sin_k
-                        bullet.vy = 5 * cos_k
-                        bullet.r = 10
-                        self.bullet_number += 1
+                    self.spawn(enemy.position.x + dx, enemy.position.y + dy,
+                               -5 * sin_k, 5 * cos_k, 10, knife)
     
     def rnd_atk(self, enemy2_pos: Vector2, cnt2: int):
         """
@@ -208,33 +310,20 @@ class EnemyBulletManager:
         if cnt2 % 2 == 0:  # 元: if(cnt2%2==0)
             rnd = random.random() * 30  # 元: float rnd=random(30);
             
-            if self.bullet_number < self.bullet_max:
-                bullet = self.bullets[self.bullet_number]
-                bullet.ex = True
-                bullet.x = enemy2_pos.x
-                bullet.y = enemy2_pos.y
-                bullet.vx = 8 * math.sin(math.pi/20 * (rnd - 15))
-                bullet.vy = 8 * math.cos(math.pi/20 * (rnd - 15))
-                bullet.r = 10
-                self.bullet_number += 1
+            self.spawn(enemy2_pos.x, enemy2_pos.y,
+                       8 * math.sin(math.pi/20 * (rnd - 15)),
+                       8 * math.cos(math.pi/20 * (rnd - 15)), 10)
     
     def tgt_atk(self, enemy2_pos: Vector2, player_pos: Vector2, cnt2: int, rt: int):
         """
         第二ステージターゲット攻撃 - 元のtgt_atk()完全再現
         """
         if cnt2 % rt == rt * 3 // 4 - 30:  # 元: if(cnt2%rt==rt*3/4-30)
-            self.t_number = self.bullet_number
+            self.t_group = self.new_group()
             
-            # 6発の弾を準備
-            for i in range(6):
-                if self.bullet_number + i < self.bullet_max:
-                    bullet = self.bullets[self.t_number + i]
-                    bullet.ex = True
-                    bullet.r = 10
-                    bullet.x = enemy2_pos.x
-                    bullet.y = enemy2_pos.y + 60
-                    bullet.vx = 0
-                    bullet.vy = 0
+            # 6発の弾を準備（割り当てられなかった弾は-1）
+            self.t_slots = [self.spawn(enemy2_pos.x, enemy2_pos.y + 60, 0, 0, 10, self.t_group)
+                            for i in range(6)]
         
         # 弾の軌道計算フェーズ
         if cnt2 % rt <= rt * 3 // 4 and cnt2 % rt > rt * 3 // 4 - 30:
@@ -245,12 +334,11 @@ class EnemyBulletManager:
                 sin_e = (player_pos.y - (enemy2_pos.y + 60)) / d_e
                 
                 # 弾を段階的に伸ばす
-                for i in range(6):
-                    if self.t_number + i < self.bullet_max:
-                        bullet = self.bullets[self.t_number + i]
+                for i, index in enumerate(self.t_slots):
+                    if self._is_target_bullet(index):
                         progress = cnt2 % rt - rt * 3 // 4 + 30
-                        bullet.x = enemy2_pos.x + 20 * i * cos_e / 30 * progress
-                        bullet.y = enemy2_pos.y + 60 + 20 * i * sin_e / 30 * progress
+                        self.x[index] = enemy2_pos.x + 20 * i * cos_e / 30 * progress
+                        self.y[index] = enemy2_pos.y + 60 + 20 * i * sin_e / 30 * progress
         
         # 発射フェーズ
         if cnt2 % rt == rt * 3 // 4:  # 元: if(cnt2%rt==rt*3/4)
@@ -260,19 +348,18 @@ class EnemyBulletManager:
                 cos_e = (player_pos.x - enemy2_pos.x) / d_e
                 sin_e = (player_pos.y - (enemy2_pos.y + 60)) / d_e
                 
-                for i in range(6):
-                    if self.t_number + i < self.bullet_max:
-                        bullet = self.bullets[self.t_number + i]
-                        bullet.vx = 15 * cos_e
-                        bullet.vy = 15 * sin_e
-                        if self.bullet_number < self.bullet_max:
-                            self.bullet_number += 1
+                for index in self.t_slots:
+                    if self._is_target_bullet(index):
+                        self.vx[index] = 15 * cos_e
+                        self.vy[index] = 15 * sin_e
+    
+    def _is_target_bullet(self, index: int) -> bool:
+        """ターゲット攻撃の弾がまだ生存しているか（消えた番号が別の弾に再利用されていないか）"""
+        return index >= 0 and self.alive[index] and self.group[index] == self.t_group
     
     def clear_all_bullets(self):
         """全敵弾クリア - ステージ遷移時のリセット用"""
         self.reset_bullet()
-        self.bullet_number = 0
-        self.knife_number = 0
-        self.delete_knife = 0
-        self.t_number = 0
+        self.t_group = -1
+        self.t_slots = []
         print("All enemy bullets cleared")
\ No newline at end of file
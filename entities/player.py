@@ -8,6 +8,7 @@ from utils.math_utils import Vector2, MathUtils
 from config.settings import GameConfig, Colors
 from utils.collision import CollisionDetector
 from utils.original_physics import OriginalPlayerPhysics
+from utils.render_commands import RenderCommandBuffer
 
 
 class SimpleProjectile:
@@ -50,7 +51,7 @@ class Projectile:
             return
             
         # 位置を更新
-        self.position += self.velocity * dt * 60  # 60FPSベースの調整
+        self.position.add_scaled(self.velocity, dt * 60)  # 60FPSベースの調整
         
         # 回転を更新（見た目用）
         self.rotation += dt * 5
@@ -120,6 +121,9 @@ class Player:
         self.eye_offset_x = 0
         self.eye_offset_y = 0
         
+        # 描画コマンド（毎フレーム記録して一括実行）
+        self.render_commands = RenderCommandBuffer()
+        
     def update(self, dt: float, mouse_pos: Vector2, mouse_pressed: bool, target_enemy_pos: Optional[Vector2] = None):
         """プレイヤーの更新 - 元のplayer.pdeの完全再現"""
         # 無敵時間の更新（元: inb_cnt++）
@@ -190,7 +194,7 @@ class Player:
                 print(f"Mouse released - ready to shoot: {self.original_physics.ready_for_shoot}")
         
         self.mouse_pressed = mouse_pressed
-        self.last_mouse_pos = mouse_pos
+        self.last_mouse_pos.set(mouse_pos.x, mouse_pos.y)
     
     def _player_place(self, mouse_pos: Vector2):
         """プレイヤー配置 - 元のplayer_place()関数を完全再現"""
@@ -334,6 +338,13 @@ class Player:
     
     def render(self, screen: pygame.Surface):
         """プレイヤーの描画 - 元のdraw_player()とplayer_img()を再現"""
+        commands = self.render_commands
+        commands.begin()
+        self.record_commands(commands)
+        commands.execute(screen)
+    
+    def record_commands(self, commands):
+        """プレイヤーの描画コマンドを記録（RenderCommandBuffer）"""
         # 無敵時間中の点滅効果（元のinb_cnt >= inb_max処理）
         if self.is_invincible:
             if int(self.invincibility_timer) % 10 < 5:
@@ -341,17 +352,42 @@ class Player:
                 return
         
         # 手を描画（元のdraw_hand()）
-        self._render_hands(screen)
+        self._render_hands(commands)
         
         # プレイヤー本体を描画（元のplayer_img()）
-        self._render_player_img(screen)
+        self._render_player_img(commands)
         
         # プロジェクタイル（ボール）を描画（元のmove_ball()）
-        self._render_balls(screen)
+        self._render_balls(commands)
         
         # プロジェクタイル描画は物理システムで完結
     
-    def _render_hands(self, screen: pygame.Surface):
+    def get_render_rects(self) -> List[pygame.Rect]:
+        """render()が描画しうる範囲（本体・ひも・手・ボール）の矩形リスト"""
+        physics = self.original_physics
+        r = physics.ellipse_round
+        
+        # 本体とひもの根元
+        body = pygame.Rect(0, 0, r + 4, r + 4)
+        body.center = (int(self.position.x), int(self.position.y))
+        xs = [physics.boh[0], physics.boh[2], physics.handX_left, physics.handX_right]
+        ys = [physics.boh[1], physics.boh[3], physics.handY_left, physics.handY_right]
+        
+        # 手（指の先端まで約r）とひもを含む範囲
+        pad = int(r) + 4
+        hands = pygame.Rect(int(min(xs)) - pad, int(min(ys)) - pad,
+                            int(max(xs) - min(xs)) + pad * 2, int(max(ys) - min(ys)) + pad * 2)
+        rects = [body.union(hands)]
+        
+        # ボール（表情の線を含めて半径+数px）
+        size = int(r) + 8
+        for i in range(3):
+            ball = pygame.Rect(0, 0, size, size)
+            ball.center = (int(physics.ball_x[i]), int(physics.ball_y[i]))
+            rects.append(ball)
+        return rects
+    
+    def _render_hands(self, commands):
         """手を描画（元のdraw_hand()関数を再現）"""
         physics = self.original_physics.physics
         
@@ -379,20 +415,20 @@ class Player:
         
         # ひもを描画
         if w > 1:
-            pygame.draw.line(screen, (255, player_g, 0),
+            commands.line((255, player_g, 0),
                            (self.original_physics.boh[0], self.original_physics.boh[1]),
                            (self.original_physics.handX_left, self.original_physics.handY_left), w)
-            pygame.draw.line(screen, (255, player_g, 0),
+            commands.line((255, player_g, 0),
                            (self.original_physics.boh[2], self.original_physics.boh[3]),
                            (self.original_physics.handX_right, self.original_physics.handY_right), w)
         
         # 手の描画
-        self._render_hand_img(screen, self.original_physics.handX_left, self.original_physics.handY_left,
+        self._render_hand_img(commands, self.original_physics.handX_left, self.original_physics.handY_left,
                             sin_li, cos_li, self.original_physics.ellipse_round / 2, player_g)
-        self._render_hand_img(screen, self.original_physics.handX_right, self.original_physics.handY_right,
+        self._render_hand_img(commands, self.original_physics.handX_right, self.original_physics.handY_right,
                             sin_ri, cos_ri, self.original_physics.ellipse_round / 2, player_g)
     
-    def _render_hand_img(self, screen: pygame.Surface, x: float, y: float, s: float, c: float, r: float, player_g: int):
+    def _render_hand_img(self, commands, x: float, y: float, s: float, c: float, r: float, player_g: int):
         """手の画像描画（元のhand_img()関数を再現）"""
         t = math.atan2(s, c)
         
@@ -402,16 +438,16 @@ class Player:
         finger_radius = r // 4
         
         # 基本的な手の形
-        pygame.draw.circle(screen, color, (int(x), int(y)), int(r // 2))
+        commands.circle(color, (int(x), int(y)), int(r // 2))
         
         # 指の部分
         for i in range(4):
             finger_angle = t + (i - 1.5) * 0.3
             finger_x = x + math.cos(finger_angle) * r * 0.7
             finger_y = y + math.sin(finger_angle) * r * 0.7
-            pygame.draw.circle(screen, color, (int(finger_x), int(finger_y)), finger_radius)
+            commands.circle(color, (int(finger_x), int(finger_y)), finger_radius)
     
-    def _render_player_img(self, screen: pygame.Surface):
+    def _render_player_img(self, commands):
         """プレイヤー本体描画（元のplayer_img()関数を再現）"""
         x = self.position.x
         y = self.position.y
@@ -428,25 +464,25 @@ class Player:
             player_g = max(0, 255 - int(abs(self.original_physics.physics.energy) * 3))
         
         # 本体を描画
-        pygame.draw.circle(screen, (255, player_g, 0), (int(x), int(y)), int(r / 2))
+        commands.circle((255, player_g, 0), (int(x), int(y)), int(r / 2))
         
         if not self.mouse_pressed:
             # 通常時の目
             self._calculate_eye_direction()
             
             # 左目の白目
-            pygame.draw.ellipse(screen, Colors.WHITE,
+            commands.ellipse(Colors.WHITE,
                               (x - eye_xr - eye_xr, y - r / 8 - eye_yr, 2 * eye_xr, 2 * eye_yr))
             # 右目の白目  
-            pygame.draw.ellipse(screen, Colors.WHITE,
+            commands.ellipse(Colors.WHITE,
                               (x + eye_xr - eye_xr, y - r / 8 - eye_yr, 2 * eye_xr, 2 * eye_yr))
             
             # 左目の黒目
-            pygame.draw.circle(screen, Colors.BLACK,
+            commands.circle(Colors.BLACK,
                              (int(x + self.eye_offset_x - eye_xr), int(y - r / 8 + self.eye_offset_y)),
                              int(eye_r))
             # 右目の黒目
-            pygame.draw.circle(screen, Colors.BLACK,
+            commands.circle(Colors.BLACK,
                              (int(x + self.eye_offset_x + eye_xr), int(y - r / 8 + self.eye_offset_y)),
                              int(eye_r))
         else:
@@ -455,14 +491,14 @@ class Player:
             eye_y = y - r / 8
             
             # 左目の線
-            pygame.draw.line(screen, Colors.BLACK,
+            commands.line(Colors.BLACK,
                            (x - (3/2 * eye_yr) * physics.cos_vp + (r/8 - 3/2 * eye_xr) * physics.sin_vp,
                             eye_y - (r/8 - 3/2 * eye_xr) * physics.cos_vp - (3/2 * eye_yr) * physics.sin_vp),
                            (x - (eye_xr/4) * physics.cos_vp + (r/8) * physics.sin_vp,
                             eye_y - (r/8) * physics.cos_vp - (eye_xr/4) * physics.sin_vp), 2)
             
             # 右目の線  
-            pygame.draw.line(screen, Colors.BLACK,
+            commands.line(Colors.BLACK,
                            (x + (3/2 * eye_yr) * physics.cos_vp + (r/8 - 3/2 * eye_xr) * physics.sin_vp,
                             eye_y - (r/8 - 3/2 * eye_xr) * physics.cos_vp + (3/2 * eye_yr) * physics.sin_vp),
                            (x + (eye_xr/4) * physics.cos_vp + (r/8) * physics.sin_vp,
@@ -486,7 +522,7 @@ class Player:
             self.eye_offset_x = 0
             self.eye_offset_y = 0
     
-    def _render_balls(self, screen: pygame.Surface):
+    def _render_balls(self, commands):
         """ボール描画（元のmove_ball()関数を再現）"""
         physics = self.original_physics.physics
         
@@ -501,7 +537,7 @@ class Player:
             
             # ボール本体
             r = self.original_physics.ellipse_round
-            pygame.draw.circle(screen, Colors.YELLOW, (int(ball_x), int(ball_y)), int(r / 2))
+            commands.circle(Colors.YELLOW, (int(ball_x), int(ball_y)), int(r / 2))
             
             # ボールの表情（回転）
             eye_xr = r / 6
@@ -522,9 +558,9 @@ class Player:
             right_eye_x = ball_x + math.cos(rotation) * eye_offset
             right_eye_y = ball_y + math.sin(rotation) * eye_offset
             
-            pygame.draw.line(screen, Colors.BLACK,
+            commands.line(Colors.BLACK,
                            (left_eye_x - 3, left_eye_y - 3), (left_eye_x + 3, left_eye_y + 3), 2)
-            pygame.draw.line(screen, Colors.BLACK,
+            commands.line(Colors.BLACK,
                            (right_eye_x - 3, right_eye_y - 3), (right_eye_x + 3, right_eye_y + 3), 2)
     
     def get_projectiles(self) -> List[SimpleProjectile]:
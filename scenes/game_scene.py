@@ -8,6 +8,13 @@ from entities.player import Player
 from entities.enemy import EnemyManager
 from utils.math_utils import Vector2
 from utils.background_effects import BackgroundManager
+from utils.camera import Camera
+from core.compositor import LayerCompositor
+from utils.text_cache import render_text
+from utils.render_commands import RenderCommandBuffer
+from utils.font_registry import get_font, JAPANESE_FONTS
+from core.presenter import display_presenter
+from core.quality import quality_governor
 from typing import Optional
 
 
@@ -21,18 +28,16 @@ class GameScene(Scene):
         self.player = Player(GameConfig.SCREEN_WIDTH // 2, GameConfig.SCREEN_HEIGHT // 2)
         self.enemy_manager = EnemyManager()
         self.background_manager = BackgroundManager()
+        self.camera = Camera(render_scale=1.0)   # 描画コマンドを倍率付きで実行しないので等倍固定
+        self.compositor = LayerCompositor()
         
         # ゲーム状態
         self.score = 0
         self.game_timer = 0
         
-        # フォント
-        try:
-            self.font = pygame.font.Font(None, 36)
-            self.small_font = pygame.font.Font(None, 24)
-        except:
-            self.font = pygame.font.SysFont('arial', 36)
-            self.small_font = pygame.font.SysFont('arial', 24)
+        # フォント（共有フォント登録所から取得）
+        self.font = get_font((), 36)
+        self.small_font = get_font((), 24)
     
     def enter(self):
         """シーン開始時の処理"""
@@ -145,30 +150,26 @@ class GameScene(Scene):
     
     def render(self, screen: pygame.Surface):
         """シーンの描画処理"""
-        # カメラシェイクオフセットを取得
+        # カメラシェイクオフセットを適用（振動中は常駐バッファへ描画される）
         camera_offset = self.background_manager.get_camera_offset()
-        
-        # 一時的な画面を作成（カメラシェイク用）
-        if camera_offset.x != 0 or camera_offset.y != 0:
-            temp_screen = pygame.Surface((GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT))
-            render_target = temp_screen
-        else:
-            render_target = screen
+        render_target = self.camera.begin(screen, (camera_offset.x, camera_offset.y))
         
         # 背景の描画
-        self.background_manager.render(render_target)
+        self.compositor.draw('background', render_target, self.background_manager.render)
         
         # ゲームオブジェクトの描画
-        self.enemy_manager.render(render_target)
-        self.player.render(render_target)
+        self.compositor.draw('dynamic_entities', render_target, self._render_entities)
         
         # カメラシェイクがある場合、オフセットして描画
-        if camera_offset.x != 0 or camera_offset.y != 0:
-            screen.fill((0, 0, 0))  # 背景をクリア
-            screen.blit(temp_screen, (camera_offset.x, camera_offset.y))
+        self.camera.end(screen)
         
         # UIの描画（シェイクの影響を受けない）
-        self._render_ui(screen)
+        self.compositor.draw('hud', screen, self._render_ui)
+    
+    def _render_entities(self, screen: pygame.Surface):
+        """敵とプレイヤーの描画"""
+        self.enemy_manager.render(screen)
+        self.player.render(screen)
     
     def _render_ui(self, screen: pygame.Surface):
         """UIの描画 - 元のUI.pdeの機能を再現"""
@@ -178,7 +179,7 @@ class GameScene(Scene):
         screen.blit(ui_panel, (0, 0))
         
         # スコア
-        score_text = self.font.render(f"Score: {self.score:06d}", True, Colors.YELLOW)
+        score_text = render_text(self.font, f"Score: {self.score:06d}", Colors.YELLOW)
         screen.blit(score_text, (10, 10))
         
         # HP表示（ハート + 数値）
@@ -191,19 +192,19 @@ class GameScene(Scene):
             SceneType.STAGE_3: "Boss 2"
         }.get(self.scene_type, "Unknown")
         
-        stage_text = self.font.render(stage_name, True, Colors.CYAN)
+        stage_text = render_text(self.font, stage_name, Colors.CYAN)
         screen.blit(stage_text, (GameConfig.SCREEN_WIDTH - 150, 10))
         
         # 敵の残り数
         active_enemies = self.enemy_manager.get_active_enemies()
         enemy_count = len(active_enemies)
-        enemy_text = self.small_font.render(f"Enemies: {enemy_count}", True, Colors.WHITE)
+        enemy_text = render_text(self.small_font, f"Enemies: {enemy_count}", Colors.WHITE)
         screen.blit(enemy_text, (GameConfig.SCREEN_WIDTH - 150, 45))
         
         # 無敵時間の表示
         if self.player.is_invincible:
             inv_time = int(self.player.invincibility_timer)
-            inv_text = self.small_font.render(f"Invincible: {inv_time}", True, Colors.GREEN)
+            inv_text = render_text(self.small_font, f"Invincible: {inv_time}", Colors.GREEN)
             screen.blit(inv_text, (10, GameConfig.SCREEN_HEIGHT - 30))
         
         # デバッグ情報（オプション）
@@ -216,7 +217,7 @@ class GameScene(Scene):
         hp_y = 45
         
         # HPラベル
-        hp_label = self.small_font.render("HP:", True, Colors.WHITE)
+        hp_label = render_text(self.small_font, "HP:", Colors.WHITE)
         screen.blit(hp_label, (hp_x, hp_y))
         
         # ハートアイコン
@@ -231,7 +232,7 @@ class GameScene(Scene):
                 self._render_heart(screen, heart_x, hp_y, Colors.GRAY)
         
         # HP数値
-        hp_text = self.small_font.render(f"{self.player.hp}/{self.player.max_hp}", True, Colors.WHITE)
+        hp_text = render_text(self.small_font, f"{self.player.hp}/{self.player.max_hp}", Colors.WHITE)
         screen.blit(hp_text, (heart_start_x + self.player.max_hp * 25 + 10, hp_y))
     
     def _render_debug_info(self, screen: pygame.Surface):
@@ -239,25 +240,27 @@ class GameScene(Scene):
         debug_y = 100
         
         # プレイヤー情報
-        pos_text = self.small_font.render(
+        pos_text = render_text(
+            self.small_font,
             f"Player: ({int(self.player.position.x)}, {int(self.player.position.y)})", 
-            True, Colors.YELLOW
+            Colors.YELLOW
         )
         screen.blit(pos_text, (10, debug_y))
         
         # 物理情報
         physics = self.player.original_physics
         debug_y += 20
-        physics_text = self.small_font.render(
+        physics_text = render_text(
+            self.small_font,
             f"Energy: {physics.physics.energy:.1f}, SlingCnt: {physics.sling_cnt}", 
-            True, Colors.YELLOW
+            Colors.YELLOW
         )
         screen.blit(physics_text, (10, debug_y))
         
         # プロジェクタイル数
         debug_y += 20
         proj_count = len(self.player.projectile_manager.get_projectiles())
-        proj_text = self.small_font.render(f"Projectiles: {proj_count}", True, Colors.YELLOW)
+        proj_text = render_text(self.small_font, f"Projectiles: {proj_count}", Colors.YELLOW)
         screen.blit(proj_text, (10, debug_y))
     
     def _render_heart(self, screen: pygame.Surface, x: int, y: int, color: tuple = Colors.RED):
@@ -288,6 +291,14 @@ class GameScene(Scene):
 class TitleScene(Scene):
     """タイトルシーン"""
     
+    # 装飾的な星の位置
+    STAR_POSITIONS = (
+        (100, 100), (200, 80), (300, 120), (500, 90), (600, 110),
+        (150, 200), (400, 180), (550, 220), (700, 190), (800, 210),
+        (80, 300), (250, 320), (450, 280), (650, 310), (780, 290),
+        (120, 400), (350, 420), (520, 380), (680, 410), (810, 390)
+    )
+    
     def __init__(self):
         super().__init__(SceneType.TITLE)
         # 日本語対応フォントの設定
@@ -305,91 +316,106 @@ class TitleScene(Scene):
         self.start_button_pos = Vector2(GameConfig.SCREEN_WIDTH // 2, GameConfig.SCREEN_HEIGHT // 2 + 80)
         self.start_button_radius = 50
         self.start_button_hit = False
+        
+        # 静的レイヤー（シーン開始時に焼き込み）
+        self._static_background: Optional[pygame.Surface] = None
+        self._star_segments = []
+        
+        # Surfaceへ直接描画する場合の記録用
+        self.render_commands = RenderCommandBuffer()
     
-    def _setup_japanese_fonts(self):
-        """日本語対応フォントのセットアップ"""
-        # 日本語フォントの候補リスト（Windows向け）
-        japanese_fonts = [
-            'meiryoui',          # Meiryo UI
-            'meiryo',            # Meiryo
-            'msgothic',          # MS Gothic
-            'msmincho',          # MS Mincho  
-            'yumidkaiti',        # YuMincho
-            'notosanscjk',       # Noto Sans CJK
-            'hiragino sans',     # macOS
+    def enter(self):
+        """シーン開始時の処理 - 変化しない背景レイヤーを焼き込む"""
+        super().enter()
+        self._bake_static_layers()
+    
+    def _bake_static_layers(self):
+        """グラデーション背景を1枚のSurfaceに、星の十字形を線分リストに事前計算"""
+        background = pygame.Surface((GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT))
+        if pygame.display.get_surface() is not None:
+            background = background.convert()
+        self._draw_gradient_background(background)
+        self._static_background = background
+        
+        # 星の形（小さい十字形）は固定なので線分の端点だけ保持し、色だけ毎フレーム計算する
+        size = 2
+        self._star_segments = [
+            ((x-size, y), (x+size, y), (x, y-size), (x, y+size))
+            for x, y in self.STAR_POSITIONS
         ]
         
+        # スタートボタンのグロー（取りうる全アルファ値を事前に作成）
+        glow_min, glow_max = -1 * 0.3 + 0.7, 1 * 0.3 + 0.7
+        for i in range(3, 0, -1):
+            glow_radius = self.start_button_radius + i * 8
+            for glow_alpha in range(int(50 * glow_min / (i + 1)), int(50 * glow_max / (i + 1)) + 1):
+                self._get_glow_sprite(glow_radius, glow_alpha)
+    
+    @staticmethod
+    def _get_glow_sprite(glow_radius: int, glow_alpha: int) -> pygame.Surface:
+        """
+        グロー1層分の描画済みSurfaceを取得
+        アルファは整数に切り捨てられるため、(半径, アルファ)ごとに保持すれば毎フレーム作り直す必要がない
+        """
+        from utils.sprite_cache import sprite_cache, SpriteCache
+        
+        def build():
+            glow_surface = SpriteCache.create_surface(glow_radius * 2, glow_radius * 2)
+            pygame.draw.circle(glow_surface, (0, 255, 0, glow_alpha), (glow_radius, glow_radius), glow_radius)
+            return glow_surface
+        
+        return sprite_cache.get(('title_glow', glow_radius, glow_alpha), build)
+    
+    def _setup_japanese_fonts(self):
+        """日本語対応フォントのセットアップ（解決は登録所が一度だけ行う）"""
         # タイトル用フォント（大きいサイズ）
-        self.title_font = None
-        for font_name in japanese_fonts:
-            try:
-                self.title_font = pygame.font.SysFont(font_name, 72)
-                break
-            except:
-                continue
-        
-        # フォールバック
-        if self.title_font is None:
-            try:
-                self.title_font = pygame.font.Font(None, 72)
-            except:
-                self.title_font = pygame.font.SysFont('arial', 72)
+        self.title_font = get_font(JAPANESE_FONTS, 72)
         
         # 通常テキスト用フォント
-        self.font = None
-        for font_name in japanese_fonts:
-            try:
-                self.font = pygame.font.SysFont(font_name, 36)
-                break
-            except:
-                continue
-                
-        # フォールバック
-        if self.font is None:
-            try:
-                self.font = pygame.font.Font(None, 36)
-            except:
-                self.font = pygame.font.SysFont('arial', 36)
+        self.font = get_font(JAPANESE_FONTS, 36)
         
         # 小さいテキスト用フォント
-        self.small_font = None
-        for font_name in japanese_fonts:
-            try:
-                self.small_font = pygame.font.SysFont(font_name, 28)
-                break
-            except:
-                continue
-                
-        if self.small_font is None:
-            try:
-                self.small_font = pygame.font.Font(None, 28)
-            except:
-                self.small_font = pygame.font.SysFont('arial', 28)
+        self.small_font = get_font(JAPANESE_FONTS, 28)
+        
+        # スタートボタン用フォント（ボタン内に収まるより小さいサイズ）
+        self.button_font = get_font(('meiryoui', 'meiryo', 'msgothic', 'arial'), 24)
     
     def render(self, screen: pygame.Surface):
-        """タイトル画面の描画"""
-        # グラデーション背景の描画
-        self._draw_gradient_background(screen)
+        """タイトル画面をSurfaceへ直接描画（描画コマンドを記録してその場で実行する）"""
+        commands = self.render_commands
+        commands.begin()
+        self.record_commands(commands)
+        commands.execute(screen)
+    
+    def record_commands(self, commands):
+        """タイトル画面の描画コマンドを記録（RenderCommandBuffer）"""
+        # グラデーション背景の描画（焼き込み済みSurfaceを1回blit）
+        if self._static_background is None:
+            self._bake_static_layers()
+        commands.blit(self._static_background, (0, 0))
         
         # 装飾的な星を描画
-        self._draw_background_stars(screen)
+        self._draw_background_stars(commands)
         
         # タイトルテキスト（パルス効果付き）
-        self._draw_title(screen)
+        self._draw_title(commands)
         
         # サブタイトル
-        subtitle_text = self.small_font.render("～ Slingshot Shooting Game ～", True, Colors.CYAN)
+        subtitle_text = render_text(self.small_font, "～ Slingshot Shooting Game ～", Colors.CYAN)
         subtitle_rect = subtitle_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, 170))
-        screen.blit(subtitle_text, subtitle_rect)
+        commands.blit(subtitle_text, subtitle_rect)
         
         # 説明文（より整理された形で）
-        self._draw_instructions(screen)
+        self._draw_instructions(commands)
         
         # スタートボタンを描画（グロー効果付き）
-        self._draw_start_button(screen)
+        self._draw_start_button(commands)
         
         # プレイヤーを描画
-        self.player.render(screen)
+        self.player.record_commands(commands)
+        
+        # 毎フレーム変化する部分（星・タイトル・ボタン・プレイヤー）を転送対象として報告
+        display_presenter.mark_all(self.player.get_render_rects())
     
     def _draw_gradient_background(self, screen: pygame.Surface):
         """グラデーション背景を描画"""
@@ -407,40 +433,33 @@ class TitleScene(Scene):
             color = (r, g, b)
             pygame.draw.line(screen, color, (0, y), (GameConfig.SCREEN_WIDTH, y))
     
-    def _draw_background_stars(self, screen: pygame.Surface):
+    def _draw_background_stars(self, commands):
         """背景の装飾的な星を描画"""
         import math
         
-        # アニメーションに基づいた星の位置計算
-        star_positions = [
-            (100, 100), (200, 80), (300, 120), (500, 90), (600, 110),
-            (150, 200), (400, 180), (550, 220), (700, 190), (800, 210),
-            (80, 300), (250, 320), (450, 280), (650, 310), (780, 290),
-            (120, 400), (350, 420), (520, 380), (680, 410), (810, 390)
-        ]
-        
-        for i, (x, y) in enumerate(star_positions):
+        for i, (h_start, h_end, v_start, v_end) in enumerate(self._star_segments):
             # 星の明滅効果
             pulse = math.sin(self.animation_time * 0.05 + i * 0.5) * 0.3 + 0.7
-            alpha = int(255 * pulse * 0.6)
             
             # 星の色（白からやや黄色）
             star_color = (255, int(255 * pulse), int(200 * pulse))
             
             # 星を描画（小さい十字形）
-            size = 2
-            pygame.draw.line(screen, star_color, (x-size, y), (x+size, y), 1)
-            pygame.draw.line(screen, star_color, (x, y-size), (x, y+size), 1)
+            commands.line(star_color, h_start, h_end, 1)
+            commands.line(star_color, v_start, v_end, 1)
+            display_presenter.mark((h_start[0], v_start[1], h_end[0] - h_start[0] + 1, v_end[1] - v_start[1] + 1))
     
-    def _draw_title(self, screen: pygame.Surface):
+    def _draw_title(self, commands):
         """パルス効果付きのタイトル描画"""
         import math
         
-        # パルス効果の計算
+        # パルス効果の計算（低品質時は拡大縮小しない）
         pulse = math.sin(self.animation_time * 0.03) * 0.1 + 1.0
+        if not quality_governor.title_effects:
+            pulse = 1.0
         
         # タイトルテキストを作成
-        title_text = self.title_font.render("ひっぱりシューティング", True, Colors.YELLOW)
+        title_text = render_text(self.title_font, "ひっぱりシューティング", Colors.YELLOW)
         
         # パルス効果を適用（スケーリング）
         if pulse != 1.0:
@@ -450,31 +469,32 @@ class TitleScene(Scene):
         
         # 中央に配置（位置を上に移動）
         title_rect = title_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, 100))
-        screen.blit(title_text, title_rect)
+        commands.blit(title_text, title_rect)
         
         # タイトルの影効果
-        shadow_text = self.title_font.render("ひっぱりシューティング", True, (100, 100, 0))
+        shadow_text = render_text(self.title_font, "ひっぱりシューティング", (100, 100, 0))
         if pulse != 1.0:
             shadow_text = pygame.transform.scale(shadow_text, new_size)
         shadow_rect = shadow_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2 + 3, 103))
-        screen.blit(shadow_text, shadow_rect)
+        commands.blit(shadow_text, shadow_rect)
         
         # メインテキストを再描画
-        screen.blit(title_text, title_rect)
+        commands.blit(title_text, title_rect)
+        display_presenter.mark(title_rect.union(shadow_rect))
     
-    def _draw_instructions(self, screen: pygame.Surface):
+    def _draw_instructions(self, commands):
         """整理された説明文を描画"""
         # メインの説明
         main_instruction = "スリングショットでスタートボタンを撃とう！"
-        main_text = self.font.render(main_instruction, True, Colors.WHITE)
+        main_text = render_text(self.font, main_instruction, Colors.WHITE)
         main_rect = main_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, 230))
-        screen.blit(main_text, main_rect)
+        commands.blit(main_text, main_rect)
         
         # 操作説明のヘッダー
         control_header = "操作方法"
-        header_text = self.small_font.render(control_header, True, Colors.CYAN)
+        header_text = render_text(self.small_font, control_header, Colors.CYAN)
         header_rect = header_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, 280))
-        screen.blit(header_text, header_rect)
+        commands.blit(header_text, header_rect)
         
         # 操作説明の詳細
         controls = [
@@ -484,12 +504,12 @@ class TitleScene(Scene):
         
         y_offset = 310
         for control in controls:
-            text = self.small_font.render(control, True, Colors.WHITE)
+            text = render_text(self.small_font, control, Colors.WHITE)
             text_rect = text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, y_offset))
-            screen.blit(text, text_rect)
+            commands.blit(text, text_rect)
             y_offset += 30
     
-    def _draw_start_button(self, screen: pygame.Surface):
+    def _draw_start_button(self, commands):
         """グロー効果付きのスタートボタン描画"""
         import math
         
@@ -499,43 +519,35 @@ class TitleScene(Scene):
         button_x = int(self.start_button_pos.x)
         button_y = int(self.start_button_pos.y)
         
-        # グローエフェクト（複数の円で表現）
-        for i in range(3, 0, -1):
+        # グローエフェクト（複数の円で表現、低品質時は省略）
+        for i in range(3 if quality_governor.title_effects else 0, 0, -1):
             glow_radius = self.start_button_radius + i * 8
             glow_alpha = int(50 * glow / (i + 1))
-            glow_color = (0, 255, 0, glow_alpha)
             
-            # 透明サーフェスを作成してグローを描画
-            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, glow_color, (glow_radius, glow_radius), glow_radius)
-            screen.blit(glow_surface, (button_x - glow_radius, button_y - glow_radius))
+            # 描画済みのグローを使い回す
+            glow_surface = self._get_glow_sprite(glow_radius, glow_alpha)
+            commands.blit(glow_surface, (button_x - glow_radius, button_y - glow_radius))
         
         # メインボタンの描画
         button_color = (int(0 + 100 * glow), int(255), int(0 + 100 * glow))
-        pygame.draw.circle(screen, button_color, (button_x, button_y), self.start_button_radius)
+        commands.circle(button_color, (button_x, button_y), self.start_button_radius)
         
         # ボタンの枠（強調）
-        pygame.draw.circle(screen, Colors.WHITE, (button_x, button_y), self.start_button_radius, 4)
+        commands.circle(Colors.WHITE, (button_x, button_y), self.start_button_radius, 4)
         
         # 内側の装飾
         inner_radius = self.start_button_radius - 8
-        pygame.draw.circle(screen, (255, 255, 255, 100), (button_x, button_y), inner_radius, 2)
+        commands.circle((255, 255, 255, 100), (button_x, button_y), inner_radius, 2)
         
         # スタートボタンのラベル（フォントサイズを小さくしてボタン内に収める）
-        # ボタン内に収まるようより小さいフォントを使用
-        button_font = None
-        for font_name in ['meiryoui', 'meiryo', 'msgothic', 'arial']:
-            try:
-                button_font = pygame.font.SysFont(font_name, 24)
-                break
-            except:
-                continue
-        if button_font is None:
-            button_font = pygame.font.Font(None, 24)
-            
-        start_text = button_font.render("スタート", True, Colors.BLACK)
+        start_text = render_text(self.button_font, "スタート", Colors.BLACK)
         start_rect = start_text.get_rect(center=(self.start_button_pos.x, self.start_button_pos.y))
-        screen.blit(start_text, start_rect)
+        commands.blit(start_text, start_rect)
+        
+        # グローの最外周までを報告
+        outer_radius = self.start_button_radius + 3 * 8
+        display_presenter.mark((button_x - outer_radius, button_y - outer_radius,
+                                outer_radius * 2, outer_radius * 2))
     
     def update(self, dt: float, mouse_pos: Vector2, mouse_pressed: bool, keys_pressed: set):
         """タイトルシーンの更新"""
@@ -576,24 +588,20 @@ class GameOverScene(Scene):
     
     def __init__(self):
         super().__init__(SceneType.GAME_OVER)
-        try:
-            self.title_font = pygame.font.Font(None, 72)
-            self.font = pygame.font.Font(None, 36)
-        except:
-            self.title_font = pygame.font.SysFont('arial', 72)
-            self.font = pygame.font.SysFont('arial', 36)
+        self.title_font = get_font((), 72)
+        self.font = get_font((), 36)
     
     def render(self, screen: pygame.Surface):
         """ゲームオーバー画面の描画"""
         screen.fill((60, 30, 30))
         
         # ゲームオーバー
-        game_over_text = self.title_font.render("GAME OVER", True, Colors.RED)
+        game_over_text = render_text(self.title_font, "GAME OVER", Colors.RED)
         game_over_rect = game_over_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, 200))
         screen.blit(game_over_text, game_over_rect)
         
         # リトライ指示
-        retry_text = self.font.render("クリックしてリトライ", True, Colors.WHITE)
+        retry_text = render_text(self.font, "クリックしてリトライ", Colors.WHITE)
         retry_rect = retry_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, 400))
         screen.blit(retry_text, retry_rect)
     
@@ -607,29 +615,25 @@ class GameClearScene(Scene):
     
     def __init__(self):
         super().__init__(SceneType.GAME_CLEAR)
-        try:
-            self.title_font = pygame.font.Font(None, 72)
-            self.font = pygame.font.Font(None, 36)
-        except:
-            self.title_font = pygame.font.SysFont('arial', 72)
-            self.font = pygame.font.SysFont('arial', 36)
+        self.title_font = get_font((), 72)
+        self.font = get_font((), 36)
     
     def render(self, screen: pygame.Surface):
         """ゲームクリア画面の描画"""
         screen.fill((30, 60, 30))
         
         # ゲームクリア
-        clear_text = self.title_font.render("GAME CLEAR!", True, Colors.GREEN)
+        clear_text = render_text(self.title_font, "GAME CLEAR!", Colors.GREEN)
         clear_rect = clear_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, 200))
         screen.blit(clear_text, clear_rect)
         
         # お疲れさまメッセージ
-        thanks_text = self.font.render("お疲れさまでした！", True, Colors.WHITE)
+        thanks_text = render_text(self.font, "お疲れさまでした！", Colors.WHITE)
         thanks_rect = thanks_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, 300))
         screen.blit(thanks_text, thanks_rect)
         
         # リトライ指示
-        retry_text = self.font.render("クリックしてタイトルに戻る", True, Colors.WHITE)
+        retry_text = render_text(self.font, "クリックしてタイトルに戻る", Colors.WHITE)
         retry_rect = retry_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, 400))
         screen.blit(retry_text, retry_rect)
     
@@ -6,22 +6,39 @@ import math
 from typing import List, Optional
 from utils.math_utils import Vector2
 from config.settings import Colors, GameConfig
+from utils.text_cache import render_text
+from utils.font_registry import get_font
 
 
 class DamageText:
-    """ダメージテキスト表示クラス"""
+    """ダメージテキスト表示クラス（プールで使い回すためreset()で再初期化できる）"""
     
-    def __init__(self, x: float, y: float, damage: int):
+    def __init__(self, x: float = 0, y: float = 0, damage: int = 0,
+                 font: Optional[pygame.font.Font] = None):
         self.position = Vector2(x, y)
-        self.damage = damage
-        self.timer = 0
         self.max_time = 120  # 2秒間表示
-        self.active = True
         
         # 浮上アニメーション
         self.velocity = Vector2(0, -1.5)  # 上に浮上
+        
+        # 生成時に一度だけ描画するテキスト（フェードはSurfaceのアルファで行う）
+        self.surface: Optional[pygame.Surface] = None
+        self._surface_key = None
+        
+        self.reset(x, y, damage, font)
+    
+    def reset(self, x: float, y: float, damage: int, font: Optional[pygame.font.Font] = None):
+        """ダメージテキストを再初期化（テキストは同じ内容なら前回のSurfaceを再利用）"""
+        self.position.x = x
+        self.position.y = y
+        self.damage = damage
+        self.timer = 0
+        self.active = True
         self.fade_alpha = 255
         
+        if font is not None:
+            self._prepare_surface(font)
+        
     def update(self, dt: float):
         """ダメージテキストの更新"""
         if not self.active:
@@ -30,7 +47,8 @@ class DamageText:
         self.timer += dt * 60
         
         # 位置の更新
-        self.position += self.velocity * dt * 60
+        self.position.x += self.velocity.x * dt * 60
+        self.position.y += self.velocity.y * dt * 60
         
         # フェードアウト
         fade_ratio = self.timer / self.max_time
@@ -44,35 +62,49 @@ class DamageText:
         """ダメージテキストの描画"""
         if not self.active or self.fade_alpha <= 0:
             return
-            
+        
+        if self.surface is None:
+            self._prepare_surface(font)
+        
+        # アルファブレンディング適用（Surface単位のアルファ）
+        self.surface.set_alpha(self.fade_alpha)
+        
+        # 描画（中心合わせ）
+        width, height = self.surface.get_size()
+        screen.blit(self.surface, (int(self.position.x) - width // 2, int(self.position.y) - height // 2))
+    
+    def _prepare_surface(self, font: pygame.font.Font):
+        """テキストSurfaceを用意（共有キャッシュのSurfaceはアルファを変えられないため複製して保持）"""
         # ダメージの色決定（大ダメージほど赤く）
         if self.damage >= 10:
-            color = (255, 50, 50, self.fade_alpha)  # 赤
+            color = (255, 50, 50)  # 赤
         elif self.damage >= 5:
-            color = (255, 150, 50, self.fade_alpha)  # オレンジ
+            color = (255, 150, 50)  # オレンジ
         else:
-            color = (255, 255, 100, self.fade_alpha)  # 黄
-            
-        # テキスト作成
-        damage_text = font.render(str(self.damage), True, color[:3])
-        
-        # アルファブレンディング適用
-        temp_surface = pygame.Surface(damage_text.get_size(), pygame.SRCALPHA)
-        temp_surface.set_alpha(self.fade_alpha)
-        temp_surface.blit(damage_text, (0, 0))
+            color = (255, 255, 100)  # 黄
         
-        # 描画
-        text_rect = temp_surface.get_rect(center=(int(self.position.x), int(self.position.y)))
-        screen.blit(temp_surface, text_rect)
+        key = (font, str(self.damage), color)
+        if key != self._surface_key:
+            self.surface = render_text(font, key[1], color).copy()
+            self._surface_key = key
 
 
 class DamageDisplayManager:
-    """ダメージ表示管理クラス - 元のhit_demageシステム"""
+    """
+    ダメージ表示管理クラス - 元のhit_demageシステム
+    DamageTextは固定容量のプールに事前確保し、先頭active_count個を有効なものとして扱う
+    消えたものは末尾の有効要素と入れ替えて詰める（swap-remove）ため、ヒットが集中しても確保が発生しない
+    """
     
-    def __init__(self):
-        self.damage_texts: List[DamageText] = []
-        self.font = pygame.font.Font(None, 24)
-        self.big_font = pygame.font.Font(None, 36)
+    CAPACITY = 64   # 同時に表示できるダメージ表示の最大数
+    
+    def __init__(self, capacity: int = CAPACITY):
+        self.damage_texts: List[DamageText] = [DamageText() for _ in range(capacity)]
+        self.active_count = 0
+        for damage_text in self.damage_texts:
+            damage_text.active = False
+        self.font = get_font((), 24)
+        self.big_font = get_font((), 36)
         
         # 元のhit_place_x, hit_place_y, hit_demage相当
         self.hit_place_x = 0
@@ -85,24 +117,42 @@ class DamageDisplayManager:
         self.hit_place_y = y
         self.hit_damage = damage
         
+        if self.active_count < len(self.damage_texts):
+            damage_text = self.damage_texts[self.active_count]
+            self.active_count += 1
+        else:
+            # 満杯の場合は最も古い表示を上書き
+            damage_text = max(self.damage_texts, key=lambda text: text.timer)
+        
         # ダメージテキスト作成
-        damage_text = DamageText(x, y - 20, damage)  # 少し上にずらして表示
-        self.damage_texts.append(damage_text)
+        font = self.big_font if damage >= 10 else self.font
+        damage_text.reset(x, y - 20, damage, font)  # 少し上にずらして表示
         
     def update(self, dt: float):
         """ダメージ表示の更新"""
-        # アクティブなダメージテキストの更新
-        for damage_text in self.damage_texts[:]:
+        texts = self.damage_texts
+        i = 0
+        while i < self.active_count:
+            damage_text = texts[i]
             damage_text.update(dt)
-            if not damage_text.active:
-                self.damage_texts.remove(damage_text)
+            if damage_text.active:
+                i += 1
+            else:
+                # 末尾の有効要素と入れ替えて詰める（入れ替えた要素は同じiで更新する）
+                last = self.active_count - 1
+                texts[i], texts[last] = texts[last], texts[i]
+                self.active_count = last
     
     def render(self, screen: pygame.Surface):
         """ダメージ表示の描画"""
-        for damage_text in self.damage_texts:
+        texts = self.damage_texts
+        for i in range(self.active_count):
+            damage_text = texts[i]
             font = self.big_font if damage_text.damage >= 10 else self.font
             damage_text.render(screen, font)
     
     def clear(self):
         """全てのダメージ表示をクリア"""
-        self.damage_texts.clear()
\ No newline at end of file
+        for i in range(self.active_count):
+            self.damage_texts[i].active = False
+        self.active_count = 0
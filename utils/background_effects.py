@@ -6,6 +6,7 @@
 import pygame
 import math
 import random
+from typing import Optional
 from config.settings import GameConfig, Colors
 from utils.math_utils import Vector2
 
@@ -44,12 +45,16 @@ class HSBBackground(BackgroundEffect):
         self.S_bg = [[0 for _ in range(self.height_cells)] for _ in range(self.width_cells)]
         self.B_bg = [[0 for _ in range(self.height_cells)] for _ in range(self.width_cells)]
         
+        # 焼き込み済み背景Surface（グリッド再生成時に破棄）
+        self._baked: Optional[pygame.Surface] = None
+        
         # ランダム値の初期化（元のsetup関数相当）
         self._initialize_random_values()
     
     def _initialize_random_values(self):
         """ランダム値の初期化 - 元のgenerate_scene1bg()を再現"""
         import random
+        self._baked = None
         for i in range(self.width_cells):
             for j in range(self.height_cells):
                 # 元: H_rnd[i][j]=30+(int)random(5)-25;
@@ -60,19 +65,27 @@ class HSBBackground(BackgroundEffect):
                 self.B_rnd[i][j] = 75 + random.randint(0, 4) + 20
     
     def render(self, screen: pygame.Surface):
-        """HSB背景の描画 - 元のscene3bg()を完全再現"""
-        for i in range(self.width_cells):
-            for j in range(self.height_cells):
-                # 元: fill(H_rnd[i][j],S_rnd[i][j],B_rnd[i][j]);
-                h = self.H_rnd[i][j]
-                s = self.S_rnd[i][j]
-                b = self.B_rnd[i][j]
-                
-                rgb = self._hsb_to_rgb(h, s, b)
-                
-                # 元: rect(br*i,br*j,br,br);
-                rect = pygame.Rect(i * self.br, j * self.br, self.br, self.br)
-                pygame.draw.rect(screen, rgb, rect)
+        """HSB背景の描画 - 元のscene3bg()を完全再現（焼き込み済みSurfaceを1回blit）"""
+        if self._baked is None:
+            self._baked = self._bake()
+        screen.blit(self._baked, (0, 0))
+    
+    def _bake(self) -> pygame.Surface:
+        """全ブロックを1枚のSurfaceへ焼き込む"""
+        from core.presenter import display_presenter
+        display_presenter.mark_full('background')
+        
+        surface = pygame.Surface((GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        
+        # 元: fill(H_rnd[i][j],S_rnd[i][j],B_rnd[i][j]); rect(br*i,br*j,br,br);
+        # 全セルを一括変換（彩度・明度は剰余を取らないhsb_to_rgb準拠の規則）
+        from utils.color_utils import ProcessingColorConverter
+        ProcessingColorConverter.blit_hsb_grid(surface, self.H_rnd, self.S_rnd, self.B_rnd,
+                                               self.br, wrap=False)
+        
+        return surface
     
     def _hsb_to_rgb(self, h: float, s: float, b: float) -> tuple:
         """HSBからRGBへの変換 - Processing HSB(360,100,100)モード準拠"""
@@ -0,0 +1,94 @@
+"""
+カメラ（画面振動）管理
+元のtranslate(3*t,3*t)相当の平行移動を、使い回しのワールドバッファで実現する
+内部解像度を下げている間は、縮小したワールドバッファへ描いて画面へ拡大する
+"""
+import pygame
+from typing import Optional, Tuple
+from config.settings import GameConfig
+
+
+class Camera:
+    """
+    ワールド描画用のビューポート
+    オフセットが0のフレームは画面へ直接描画し、振動中のみ常駐バッファへ描画してから
+    オフセット付きで1回blitする（毎フレームのSurface生成は行わない）
+    内部解像度の倍率（render_scale）が1.0以外のフレームは round(幅*scale) x round(高さ*scale) のバッファへ描画し、
+    end()で画面サイズへ拡大する（描画コマンドはscale倍して実行すること）
+    """
+    
+    def __init__(self, width: int = GameConfig.SCREEN_WIDTH, height: int = GameConfig.SCREEN_HEIGHT,
+                 render_scale: float = GameConfig.RENDER_SCALE, smooth: bool = GameConfig.RENDER_SMOOTH):
+        self.width = width
+        self.height = height
+        self.offset: Tuple[int, int] = (0, 0)
+        self.render_scale = render_scale   # 次のbegin()から使う倍率（実行中に変更可）
+        self.smooth = smooth               # 拡大時にsmoothscaleを使うか（Falseなら最近傍）
+        self.scale = 1.0                   # 今フレームの倍率
+        self._buffer: Optional[pygame.Surface] = None
+    
+    @property
+    def shaking(self) -> bool:
+        """オフセットが有効か"""
+        return self.offset != (0, 0)
+    
+    @property
+    def scaled(self) -> bool:
+        """内部解像度のバッファへ描画しているか"""
+        return self.scale != 1.0
+    
+    def begin(self, screen: pygame.Surface, offset) -> pygame.Surface:
+        """
+        ワールド描画の開始（倍率はrender_scaleをこのフレームの間固定する）
+        
+        Args:
+            screen: 最終的な描画先
+            offset: 平行移動量 (x, y)
+        
+        Returns:
+            ワールドを描画するSurface（オフセットなし・等倍ならscreenそのもの）
+        """
+        self.offset = (int(offset[0]), int(offset[1]))
+        self.scale = scale = self.render_scale
+        if not self.shaking and not self.scaled:
+            return screen
+        
+        buffer = self._get_buffer((round(self.width * scale), round(self.height * scale)))
+        buffer.fill((0, 0, 0))   # 元: background(0);
+        return buffer
+    
+    def end(self, screen: pygame.Surface):
+        """ワールド描画の終了（振動中はバッファをオフセット付きで、縮小中は拡大して画面へ転送）"""
+        if self.scaled:
+            # 画面全体へ拡大してから振動分だけずらす（ずらす処理は画面上でその場で行う）
+            if self.smooth:
+                pygame.transform.smoothscale(self._buffer, (self.width, self.height), screen)
+            else:
+                pygame.transform.scale(self._buffer, (self.width, self.height), screen)
+            if not self.shaking:
+                return
+            screen.scroll(*self.offset)
+        elif not self.shaking:
+            return
+        else:
+            screen.blit(self._buffer, self.offset)
+        
+        # ずらしたことで露出した画面端の帯を黒で塗る
+        ox, oy = self.offset
+        if ox > 0:
+            screen.fill((0, 0, 0), (0, 0, ox, self.height))
+        elif ox < 0:
+            screen.fill((0, 0, 0), (self.width + ox, 0, -ox, self.height))
+        if oy > 0:
+            screen.fill((0, 0, 0), (0, 0, self.width, oy))
+        elif oy < 0:
+            screen.fill((0, 0, 0), (0, self.height + oy, self.width, -oy))
+    
+    def _get_buffer(self, size: Tuple[int, int]) -> pygame.Surface:
+        """常駐ワールドバッファを取得（初回と倍率が変わった時のみ作成）"""
+        if self._buffer is None or self._buffer.get_size() != size:
+            buffer = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                buffer = buffer.convert()
+            self._buffer = buffer
+        return self._buffer
@@ -3,6 +3,8 @@
 ProcessingのHSB色空間をPygameのRGBに変換
 """
 import colorsys
+import numpy as np
+import pygame
 
 
 class ProcessingColorConverter:
@@ -35,6 +37,65 @@ class ProcessingColorConverter:
         # 0-255の範囲に変換
         return (int(r * 255), int(g * 255), int(b * 255))
     
+    @staticmethod
+    def hsb_grid_to_rgb(H, S, B, h_max: float = 360, s_max: float = 100, b_max: float = 100,
+                        wrap: bool = True) -> np.ndarray:
+        """
+        HSBグリッド全体を一括でRGB配列に変換（hsb_to_rgbのベクトル化版）
+        
+        Args:
+            H, S, B: [i][j]形式のグリッド（リストのリストまたは配列）
+            wrap: True  -> 元のscene_bg準拠（h%360, s%100, b%100）
+                  False -> hsb_to_rgb準拠（h%h_max, 彩度・明度は上限でクランプ）
+        
+        Returns:
+            np.ndarray: (w, h, 3) のuint8配列（pygame.surfarrayと同じ[x][y]並び）
+        """
+        h = np.mod(np.asarray(H, dtype=np.float64), h_max) / h_max
+        if wrap:
+            s = np.mod(np.asarray(S, dtype=np.float64), s_max) / s_max
+            v = np.mod(np.asarray(B, dtype=np.float64), b_max) / b_max
+        else:
+            s = np.minimum(np.asarray(S, dtype=np.float64) / s_max, 1.0)
+            v = np.minimum(np.asarray(B, dtype=np.float64) / b_max, 1.0)
+        
+        # colorsys.hsv_to_rgbと同じ区分計算
+        h6 = h * 6.0
+        sector = np.floor(h6)
+        f = h6 - sector
+        sector = sector.astype(np.int64) % 6
+        p = v * (1.0 - s)
+        q = v * (1.0 - s * f)
+        t = v * (1.0 - s * (1.0 - f))
+        
+        r = np.choose(sector, (v, q, p, p, t, v))
+        g = np.choose(sector, (t, v, v, q, p, p))
+        b = np.choose(sector, (p, p, t, v, v, q))
+        
+        # int(x * 255)と同じ切り捨て
+        rgb = np.stack((r, g, b), axis=-1) * 255
+        return np.clip(np.trunc(rgb), 0, 255).astype(np.uint8)
+    
+    @staticmethod
+    def hsb_grid_to_surface(H, S, B, br: float = 10, wrap: bool = True) -> pygame.Surface:
+        """
+        HSBグリッドをブロックサイズbrのSurfaceに変換
+        セル解像度のSurfaceをsurfarrayで作成し、整数倍の最近傍拡大でブロック化する
+        """
+        rgb = ProcessingColorConverter.hsb_grid_to_rgb(H, S, B, wrap=wrap)
+        cells = pygame.surfarray.make_surface(rgb)
+        block = int(br)
+        return pygame.transform.scale(cells, (rgb.shape[0] * block, rgb.shape[1] * block))
+    
+    @staticmethod
+    def blit_hsb_grid(surface: pygame.Surface, H, S, B, br: float = 10, wrap: bool = True):
+        """
+        HSBグリッドをsurfaceへ描画
+        元: fill(H_rnd[i][j],S_rnd[i][j],B_rnd[i][j]); rect(br*i,br*j,br,br); の全セル一括版
+        """
+        blocks = ProcessingColorConverter.hsb_grid_to_surface(H, S, B, br, wrap)
+        surface.blit(blocks, (0, 0))
+    
     @staticmethod
     def processing_color(h: float, s: float = None, b: float = None) -> tuple:
         """
@@ -0,0 +1,116 @@
+"""
+フォント管理
+(フォント候補リスト, サイズ) ごとにフォントファイルを一度だけ解決し、
+同じFontオブジェクトを全シーンで共有する。解決結果はディスクにキャッシュして次回起動時に再利用する
+"""
+import json
+import os
+import pygame
+from typing import Dict, Optional, Sequence, Tuple
+from config.settings import GameConfig
+
+
+# 日本語フォントの候補リスト（Windows / macOS / Linux）
+JAPANESE_FONTS = (
+    'meiryoui',          # Meiryo UI
+    'meiryo',            # Meiryo
+    'msgothic',          # MS Gothic
+    'msmincho',          # MS Mincho
+    'yumidkaiti',        # YuMincho
+    'notosanscjk',       # Noto Sans CJK
+    'hiragino sans',     # macOS
+)
+
+
+class FontRegistry:
+    """
+    共有フォントの登録所
+    pygame.font.SysFontは呼び出しごとにシステムフォント一覧を走査するため、
+    ファイルパスの解決結果とFontオブジェクトをキャッシュする
+    """
+    
+    def __init__(self, cache_path: Optional[str] = GameConfig.FONT_CACHE_PATH):
+        self.cache_path = cache_path
+        self._fonts: Dict[Tuple[Tuple[str, ...], int], pygame.font.Font] = {}
+        self._paths: Optional[Dict[str, str]] = None   # 候補リスト → フォントファイル（""はデフォルトフォント）
+    
+    def get_font(self, candidates: Sequence[str], size: int) -> pygame.font.Font:
+        """
+        共有Fontを取得
+        
+        Args:
+            candidates: フォント名の候補（先頭から順に探す）。空ならpygameのデフォルトフォント
+            size: フォントサイズ
+        """
+        key = (tuple(candidates), size)
+        font = self._fonts.get(key)
+        if font is None:
+            path = self.resolve_path(key[0])
+            try:
+                font = pygame.font.Font(path or None, size)
+            except (OSError, RuntimeError):
+                # キャッシュされたファイルが読めない場合はデフォルトフォント
+                font = pygame.font.Font(None, size)
+            self._fonts[key] = font
+        return font
+    
+    def resolve_path(self, candidates: Tuple[str, ...]) -> str:
+        """候補リストに対応するフォントファイルを解決（見つからなければ""）"""
+        if not candidates:
+            return ''
+        
+        paths = self._load_paths()
+        cache_key = '|'.join(candidates)
+        
+        path = paths.get(cache_key)
+        if path is not None and (path == '' or os.path.isfile(path)):
+            return path
+        
+        path = ''
+        for name in candidates:
+            match = pygame.font.match_font(name)
+            if match:
+                path = match
+                break
+        
+        paths[cache_key] = path
+        self._save_paths()
+        return path
+    
+    def clear(self):
+        """共有Fontを破棄（ディスクキャッシュは保持）"""
+        self._fonts.clear()
+    
+    def _load_paths(self) -> Dict[str, str]:
+        """ディスクキャッシュの読み込み（初回のみ）"""
+        if self._paths is None:
+            self._paths = {}
+            if self.cache_path and os.path.isfile(self.cache_path):
+                try:
+                    with open(self.cache_path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    if isinstance(data, dict):
+                        self._paths = {str(k): str(v) for k, v in data.items()}
+                except (OSError, ValueError):
+                    self._paths = {}
+        return self._paths
+    
+    def _save_paths(self):
+        """ディスクキャッシュへ書き込み（失敗してもゲームは続行）"""
+        if not self.cache_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self._paths, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"Font cache save failed: {e}")
+
+
+# ゲーム全体で共有するフォント登録所
+font_registry = FontRegistry()
+
+
+def get_font(candidates: Sequence[str], size: int) -> pygame.font.Font:
+    """共有フォント登録所からFontを取得"""
+    return font_registry.get_font(candidates, size)
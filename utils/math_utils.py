@@ -7,7 +7,13 @@ from typing import Tuple
 
 
 class Vector2:
-    """2次元ベクトルクラス"""
+    """
+    2次元ベクトルクラス
+    +, -, * は新しいVector2を返し、+=, -=, *= は自身を書き換える（毎フレームの一時オブジェクトを減らすため）
+    同じVector2を複数の物体で共有している場合、+=等は共有先にも反映される点に注意
+    """
+    
+    __slots__ = ('x', 'y')
     
     def __init__(self, x: float = 0, y: float = 0):
         self.x = x
@@ -25,6 +31,33 @@ class Vector2:
     def __truediv__(self, scalar: float):
         return Vector2(self.x / scalar, self.y / scalar)
     
+    def __iadd__(self, other):
+        self.x += other.x
+        self.y += other.y
+        return self
+    
+    def __isub__(self, other):
+        self.x -= other.x
+        self.y -= other.y
+        return self
+    
+    def __imul__(self, scalar: float):
+        self.x *= scalar
+        self.y *= scalar
+        return self
+    
+    def set(self, x: float, y: float):
+        """成分を書き換える（新しいVector2を作らずに再利用する場合用）"""
+        self.x = x
+        self.y = y
+        return self
+    
+    def add_scaled(self, other, scalar: float):
+        """self += other * scalar を一時オブジェクトなしで行う"""
+        self.x += other.x * scalar
+        self.y += other.y * scalar
+        return self
+    
     def __repr__(self):
         return f"Vector2({self.x}, {self.y})"
     
@@ -51,6 +84,18 @@ class Vector2:
         dy = self.y - other.y
         return math.sqrt(dx * dx + dy * dy)
     
+    def distance_sq(self, other) -> float:
+        """他のベクトルとの距離の二乗（比較だけなら平方根を省ける）"""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
+    
+    def distance_sq_xy(self, x: float, y: float) -> float:
+        """座標 (x, y) との距離の二乗（Vector2を作らずに使える）"""
+        dx = self.x - x
+        dy = self.y - y
+        return dx * dx + dy * dy
+    
     def angle_to(self, other) -> float:
         """他のベクトルへの角度"""
         return math.atan2(other.y - self.y, other.x - self.x)
@@ -61,6 +61,7 @@ class SlinghotPhysics:
         # 差分（diff）関連
         self.diff_x = 0
         self.diff_y = 0
+        self._diff = Vector2()   # calculate_position_updateの戻り値（使い回し）
         
     def calculate_liner_equation(self, player_pos: Vector2, hand_pos: Vector2):
         """一次方程式を求める（元のliner_equation関数）"""
@@ -155,7 +156,7 @@ class SlinghotPhysics:
         self.diff_x += self.velocity_x
         self.diff_y += self.velocity_y
         
-        return Vector2(self.diff_x, self.diff_y)
+        return self._diff.set(self.diff_x, self.diff_y)
     
     def get_velocity_b(self):
         """発射時の速度計算（元のmouseReleased関数から）"""
@@ -227,6 +228,11 @@ class OriginalPlayerPhysics:
         # 物理計算エンジン
         self.physics = SlinghotPhysics()
         
+        # 物理計算に渡す手の位置（毎フレーム使い回す）
+        self._hand_pos = Vector2()
+        self._hand_left = Vector2()
+        self._hand_right = Vector2()
+        
         # 発射関連
         self.a_before = 0
         self.a_after = 0
@@ -296,10 +302,8 @@ class OriginalPlayerPhysics:
             self.position.y = 0 + self.ellipse_round / 2
         
         # 手の位置計算（シンプルな実装）
-        hand_left_pos = Vector2(self.handX_left, self.handY_left)
-        hand_right_pos = Vector2(self.handX_right, self.handY_right)
-        string_dist = math.sqrt((hand_left_pos.x - hand_right_pos.x)**2 + 
-                               (hand_left_pos.y - hand_right_pos.y)**2)
+        string_dist = math.sqrt((self.handX_left - self.handX_right)**2 + 
+                               (self.handY_left - self.handY_right)**2)
         
         if string_dist <= 200 or self.physics.string_dist < 200 and self.sling_cnt < self.sling_cnt_mx:
             # 元のProcessingコードを正確に再現（hand_diff配列の計算）
@@ -361,9 +365,9 @@ class OriginalPlayerPhysics:
                 print(f"sling_cnt: {self.sling_cnt}, sling_cnt_mx: {self.sling_cnt_mx}, ready_for_shoot: {self.ready_for_shoot}")
         
         # 物理計算の実行
-        hand_pos = Vector2(self.handX, self.handY)
-        hand_left = Vector2(self.handX_left, self.handY_left)
-        hand_right = Vector2(self.handX_right, self.handY_right)
+        hand_pos = self._hand_pos.set(self.handX, self.handY)
+        hand_left = self._hand_left.set(self.handX_left, self.handY_left)
+        hand_right = self._hand_right.set(self.handX_right, self.handY_right)
         
         self.physics.full_calculation_cycle(
             self.position, hand_pos, hand_left, hand_right,
@@ -0,0 +1,337 @@
+"""
+描画コマンドバッファ
+pygame.drawやblitを直接呼ばずにコマンドとして記録し、まとめて実行する
+前フレームと同じコマンド列なら実行自体を省略でき（キャッシュレイヤーのみ）、フレームごとの描画呼び出し数も計測できる
+実行時に倍率を指定すると、画面座標で記録したコマンドを内部解像度の描画先へ縮小して描く
+"""
+import weakref
+import pygame
+from typing import Dict, List, Optional
+from utils.text_cache import render_text
+
+
+# その場で書き換えたSurfaceの版数（id → 版数）。blitコマンドは記録時の版数を持つため、
+# 同じSurfaceでも書き換え後は前フレームと異なるコマンドとして扱われる
+_surface_versions: Dict[int, int] = {}
+
+
+def touch_surface(surface: pygame.Surface):
+    """
+    Surfaceをその場で書き換えたことを通知（焼き込み背景・炎の形など、同じSurfaceを描き直す側が呼ぶ）
+    コマンド列の比較（changed）と縮小版キャッシュが、書き換え前の内容を使い回さないようにする
+    """
+    key = id(surface)
+    if key not in _surface_versions:
+        # Surfaceが破棄されたら版数も消す（同じidが別のSurfaceに再利用されるため）
+        weakref.finalize(surface, _surface_versions.pop, key, None)
+        _surface_versions[key] = 0
+    _surface_versions[key] += 1
+
+
+class RenderStats:
+    """フレーム単位の描画呼び出し数の集計"""
+    
+    def __init__(self):
+        self.draw_calls = 0        # 今フレームのpygame描画呼び出し数
+        self.commands = 0          # 今フレームに実行したコマンド数
+        self.skipped = 0           # 今フレームに省略したバッファ数（前フレームと同一）
+        self.last_draw_calls = 0
+        self.last_commands = 0
+        self.last_skipped = 0
+        self.frames = 0
+    
+    def begin_frame(self):
+        """フレームの区切り（前フレームの集計を確定）"""
+        self.last_draw_calls = self.draw_calls
+        self.last_commands = self.commands
+        self.last_skipped = self.skipped
+        self.draw_calls = 0
+        self.commands = 0
+        self.skipped = 0
+        self.frames += 1
+    
+    def get_stats(self) -> dict:
+        """統計情報を取得（直近の確定フレーム）"""
+        return {
+            'draw_calls': self.last_draw_calls,
+            'commands': self.last_commands,
+            'skipped': self.last_skipped,
+            'frames': self.frames,
+        }
+
+
+# ゲーム全体で共有する描画統計
+render_stats = RenderStats()
+
+
+class ScaledSurfaceCache:
+    """
+    blit元Surfaceの倍率別の縮小版
+    元のSurfaceが破棄されれば縮小版も消える（弱参照キー）
+    その場で書き換えたSurfaceは、touch_surface()で進めた版数が変わった時に作り直す
+    """
+    
+    def __init__(self):
+        self._scaled = weakref.WeakKeyDictionary()   # 元Surface → (倍率, 版数, 縮小版)
+        self.builds = 0
+    
+    def get(self, source: pygame.Surface, scale: float, version: int = 0) -> pygame.Surface:
+        """倍率scaleの縮小版を取得（カラーキー・アルファは元から引き継ぐ）"""
+        entry = self._scaled.get(source)
+        if entry is None or entry[0] != scale or entry[1] != version:
+            width, height = source.get_size()
+            size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            # カラーキーの縁が混ざらないよう最近傍で縮小
+            entry = (scale, version, pygame.transform.scale(source, size))
+            self._scaled[source] = entry
+            self.builds += 1
+        scaled = entry[2]
+        # ダメージ表示のように毎フレームアルファを変えるSurfaceに追従する
+        alpha = source.get_alpha()
+        if scaled.get_alpha() != alpha:
+            scaled.set_alpha(alpha)
+        return scaled
+    
+    def __len__(self) -> int:
+        return len(self._scaled)
+
+
+# ゲーム全体で共有する縮小版キャッシュ
+scaled_surfaces = ScaledSurfaceCache()
+
+
+class RenderCommandBuffer:
+    """
+    1フレーム分の描画コマンド列
+    記録用のメソッドはpygame.draw / Surface.blitと同じ引数を取るため、
+    screenの代わりにこのバッファを渡せばそのまま記録できる
+    コマンドは記録順に実行する（重なりの前後関係を保つため、種類・色ごとの並べ替えはしない）。
+    連続するblitは1回のSurface.blitsにまとめる
+    前フレームとの比較（changed/skip）を使うのはキャッシュレイヤー（動かない敵）だけで、それ以外のレイヤーは毎フレーム実行する
+    blit元は同一性で比較するため、同じSurfaceをその場で書き換えた場合はtouch_surface()を呼ぶこと
+    （アルファ値の変更は比較に含まれない）
+    """
+    
+    def __init__(self):
+        self.commands: List[tuple] = []
+        self._previous: List[tuple] = []
+        self._executed = False
+        self.last_draw_calls = 0
+    
+    def begin(self):
+        """新しいフレームの記録を開始（前フレームのコマンド列は比較用に保持）"""
+        self._previous, self.commands = self.commands, self._previous
+        self.commands.clear()
+    
+    @property
+    def changed(self) -> bool:
+        """前フレームとコマンド列が異なるか（一度も実行していなければTrue）"""
+        return not self._executed or self.commands != self._previous
+    
+    # --- 記録（pygame.draw / Surface互換） ---
+    
+    def circle(self, color, center, radius, width: int = 0):
+        self.commands.append(('circle', tuple(color), tuple(center), radius, width))
+    
+    def ellipse(self, color, rect, width: int = 0):
+        self.commands.append(('ellipse', tuple(color), tuple(rect), width))
+    
+    def line(self, color, start_pos, end_pos, width: int = 1):
+        self.commands.append(('line', tuple(color), tuple(start_pos), tuple(end_pos), width))
+    
+    def polygon(self, color, points, width: int = 0):
+        self.commands.append(('polygon', tuple(color), tuple(tuple(p) for p in points), width))
+    
+    def rect(self, color, rect, width: int = 0):
+        self.commands.append(('rect', tuple(color), tuple(rect), width))
+    
+    def fill(self, color, rect=None):
+        self.commands.append(('fill', tuple(color), None if rect is None else tuple(rect)))
+    
+    def blit(self, source: pygame.Surface, dest, area=None):
+        self.commands.append(('blit', source, tuple(dest), None if area is None else tuple(area),
+                              _surface_versions.get(id(source), 0)))
+    
+    def blits(self, blit_sequence, doreturn: bool = True):
+        # 敵弾のように数百件まとめて渡されるため、1件ずつblit()を呼ばずに直接追加する
+        append = self.commands.append
+        version = _surface_versions.get
+        for item in blit_sequence:
+            area = item[2] if len(item) > 2 else None
+            append(('blit', item[0], tuple(item[1]), None if area is None else tuple(area),
+                    version(id(item[0]), 0)))
+    
+    def text(self, font: pygame.font.Font, text: str, color, dest):
+        """テキスト描画（実行時に共有テキストキャッシュから取得）"""
+        self.commands.append(('text', font, text, tuple(color), tuple(dest)))
+    
+    # --- 実行 ---
+    
+    def execute(self, target: pygame.Surface, scale: float = 1.0, origin=(0, 0)) -> int:
+        """
+        記録したコマンドを描画先へ実行
+        
+        Args:
+            target: 描画先
+            scale: 画面座標から描画先座標への倍率（内部解像度で描く場合は1.0未満）
+            origin: 描画先の左上に対応する座標（倍率適用後。範囲だけのSurfaceへ描く場合に使う）
+        
+        Returns:
+            pygameの描画呼び出し数
+        """
+        draw_calls = 0
+        pending_blits = []
+        if scale == 1.0 and not any(origin):
+            commands = self.commands
+        else:
+            commands = [_transform_command(command, scale, origin) for command in self.commands]
+        
+        for command in commands:
+            kind = command[0]
+            if kind == 'blit' or kind == 'text':
+                if kind == 'blit':
+                    _, source, dest, area, _ = command
+                else:
+                    _, font, text, color, dest = command
+                    source, area = render_text(font, text, color), None
+                pending_blits.append((source, dest) if area is None else (source, dest, area))
+                continue
+            
+            # 連続したblitをまとめて転送してから図形を描く
+            if pending_blits:
+                target.blits(pending_blits, doreturn=False)
+                draw_calls += 1
+                pending_blits = []
+            
+            if kind == 'circle':
+                _, color, center, radius, width = command
+                pygame.draw.circle(target, color, center, radius, width)
+            elif kind == 'ellipse':
+                _, color, rect, width = command
+                pygame.draw.ellipse(target, color, rect, width)
+            elif kind == 'line':
+                _, color, start_pos, end_pos, width = command
+                pygame.draw.line(target, color, start_pos, end_pos, width)
+            elif kind == 'polygon':
+                _, color, points, width = command
+                pygame.draw.polygon(target, color, points, width)
+            elif kind == 'rect':
+                _, color, rect, width = command
+                pygame.draw.rect(target, color, rect, width)
+            elif kind == 'fill':
+                _, color, rect = command
+                target.fill(color, rect)
+            draw_calls += 1
+        
+        if pending_blits:
+            target.blits(pending_blits, doreturn=False)
+            draw_calls += 1
+        
+        self._executed = True
+        self.last_draw_calls = draw_calls
+        render_stats.draw_calls += draw_calls
+        render_stats.commands += len(self.commands)
+        return draw_calls
+    
+    def bounds(self, scale: float = 1.0) -> Optional[pygame.Rect]:
+        """
+        記録したコマンドが描く範囲（倍率適用後）。描画先全体を塗るfillがあればNone
+        キャッシュレイヤーのSurfaceを描く範囲だけの大きさにするために使う
+        """
+        rects = []
+        for command in self.commands:
+            kind = command[0]
+            if kind == 'blit':
+                _, source, dest, area, _ = command
+                rects.append(pygame.Rect(dest, area[2:] if area is not None else source.get_size()))
+            elif kind == 'text':
+                _, font, text, color, dest = command
+                rects.append(pygame.Rect(dest, render_text(font, text, color).get_size()))
+            elif kind == 'circle':
+                _, _, (x, y), radius, _ = command
+                rects.append(pygame.Rect(x - radius, y - radius, radius * 2 + 1, radius * 2 + 1))
+            elif kind == 'ellipse' or kind == 'rect':
+                rects.append(pygame.Rect(command[2]))
+            elif kind == 'line' or kind == 'polygon':
+                points = command[2:4] if kind == 'line' else command[2]
+                width = command[-1]
+                xs = [point[0] for point in points]
+                ys = [point[1] for point in points]
+                rects.append(pygame.Rect(min(xs), min(ys), max(xs) - min(xs) + 1,
+                                         max(ys) - min(ys) + 1).inflate(width, width))
+            elif kind == 'fill':
+                if command[2] is None:
+                    return None
+                rects.append(pygame.Rect(command[2]))
+        if not rects:
+            return pygame.Rect(0, 0, 0, 0)
+        rect = rects[0].unionall(rects[1:])
+        if scale != 1.0:
+            rect = pygame.Rect(_scale_rect(tuple(rect), scale))
+        # 座標の丸め分の余白
+        return rect.inflate(2, 2)
+    
+    def skip(self):
+        """前フレームと同一のため実行を省略したことを記録"""
+        render_stats.skipped += 1
+    
+    def __len__(self) -> int:
+        return len(self.commands)
+
+
+def _transform_command(command: tuple, scale: float, origin) -> tuple:
+    """
+    画面座標のコマンドを倍率scaleの描画先向けに変換し、originだけずらす
+    （blit元は倍率が1.0以外なら縮小版に差し替える）
+    """
+    ox, oy = origin
+    kind = command[0]
+    if kind == 'blit' or kind == 'text':
+        if kind == 'blit':
+            _, source, dest, area, version = command
+        else:
+            _, font, text, color, dest = command
+            source, area, version = render_text(font, text, color), None, 0
+        if scale == 1.0:
+            return ('blit', source, (dest[0] - ox, dest[1] - oy), area, version)
+        if area is not None:
+            area = _scale_rect(area, scale)
+        return ('blit', scaled_surfaces.get(source, scale, version),
+                (round(dest[0] * scale) - ox, round(dest[1] * scale) - oy), area, version)
+    if kind == 'circle':
+        _, color, center, radius, width = command
+        return (kind, color, (center[0] * scale - ox, center[1] * scale - oy),
+                max(1, round(radius * scale)) if radius > 0 else 0, _scale_width(width, scale))
+    if kind == 'ellipse' or kind == 'rect':
+        _, color, rect, width = command
+        return (kind, color, _move_rect(rect, scale, ox, oy), _scale_width(width, scale))
+    if kind == 'line':
+        _, color, start_pos, end_pos, width = command
+        return (kind, color, (start_pos[0] * scale - ox, start_pos[1] * scale - oy),
+                (end_pos[0] * scale - ox, end_pos[1] * scale - oy), _scale_width(width, scale))
+    if kind == 'polygon':
+        _, color, points, width = command
+        return (kind, color, tuple((x * scale - ox, y * scale - oy) for x, y in points),
+                _scale_width(width, scale))
+    if kind == 'fill':
+        _, color, rect = command
+        return (kind, color, None if rect is None else _move_rect(rect, scale, ox, oy))
+    return command
+
+
+def _move_rect(rect: tuple, scale: float, dx: int, dy: int) -> tuple:
+    """矩形を倍率scaleで変換して(-dx, -dy)だけずらす（等倍なら丸めずにそのままずらす）"""
+    x, y, width, height = rect if scale == 1.0 else _scale_rect(rect, scale)
+    return (x - dx, y - dy, width, height)
+
+
+def _scale_rect(rect: tuple, scale: float) -> tuple:
+    """矩形を倍率scaleで変換（隣り合う矩形の間に隙間ができないよう、幅ではなく両端を丸める）"""
+    x, y, width, height = rect
+    left, top = round(x * scale), round(y * scale)
+    return (left, top, round((x + width) * scale) - left, round((y + height) * scale) - top)
+
+
+def _scale_width(width: int, scale: float) -> int:
+    """線幅を倍率scaleで変換（0は塗りつぶしのまま、枠線は1px以上残す）"""
+    return max(1, round(width * scale)) if width > 0 else 0
@@ -0,0 +1,165 @@
+"""
+空間ハッシュ（一様グリッド）による衝突判定の候補絞り込み
+画面を一定サイズのセルに分け、物体を外接矩形が重なるセルに登録しておき、
+問い合わせ範囲と同じセルにいる物体だけを距離判定（狭域判定）の候補にする
+"""
+import numpy as np
+from typing import Dict, Hashable, Iterable, Set, Tuple
+from config.settings import GameConfig
+
+
+class CollisionStats:
+    """フレーム単位の衝突判定の集計（広域判定の候補数と狭域判定のヒット数）"""
+    
+    def __init__(self):
+        self.queries = 0          # 今フレームの問い合わせ回数
+        self.brute_force = 0      # そのうち物体数が少なく総当たりで答えた回数
+        self.candidates = 0       # 広域判定で残った候補数
+        self.hits = 0             # 狭域判定（距離判定）で当たった数
+        self.last_queries = 0
+        self.last_brute_force = 0
+        self.last_candidates = 0
+        self.last_hits = 0
+    
+    def begin_frame(self):
+        """フレームの区切り（前フレームの集計を確定）"""
+        self.last_queries = self.queries
+        self.last_brute_force = self.brute_force
+        self.last_candidates = self.candidates
+        self.last_hits = self.hits
+        self.queries = 0
+        self.brute_force = 0
+        self.candidates = 0
+        self.hits = 0
+    
+    def get_stats(self) -> dict:
+        """統計情報を取得（直近の確定フレーム）"""
+        return {
+            'queries': self.last_queries,
+            'brute_force': self.last_brute_force,
+            'candidates': self.last_candidates,
+            'hits': self.last_hits,
+        }
+    
+    def get_summary(self) -> str:
+        """デバッグ表示用の要約"""
+        return (f"Collision: {self.last_queries} queries ({self.last_brute_force} brute force), "
+                f"{self.last_candidates} candidates, {self.last_hits} hits")
+
+
+# ゲーム全体で共有する衝突判定の統計
+collision_stats = CollisionStats()
+
+
+class SpatialHash:
+    """
+    一様グリッドの空間ハッシュ
+    物体はキーで管理し、毎フレームupdate()/sync()で位置を渡すと、所属セルが変わった物体だけを登録し直す
+    登録数がbrute_force_limit以下の間は、セルを引かずに全物体を候補として返す（総当たり）
+    画面外の物体・問い合わせは端のセルに寄せる（寄せても重なり判定の結果は変わらない）
+    """
+    
+    def __init__(self, cell_size: int = GameConfig.COLLISION_CELL_SIZE,
+                 width: int = GameConfig.SCREEN_WIDTH, height: int = GameConfig.SCREEN_HEIGHT,
+                 brute_force_limit: int = GameConfig.COLLISION_BRUTE_FORCE_LIMIT):
+        self.cell_size = cell_size
+        self.columns = (width + cell_size - 1) // cell_size
+        self.rows = (height + cell_size - 1) // cell_size
+        self.brute_force_limit = brute_force_limit
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self._entries: Dict[Hashable, Tuple[int, int, int, int]] = {}   # キー → 登録中のセル範囲
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def cell_range(self, x: float, y: float, radius: float) -> Tuple[int, int, int, int]:
+        """円の外接矩形が重なるセル範囲 (x0, y0, x1, y1)（画面外は端のセルに寄せる）"""
+        size = self.cell_size
+        return (min(max(int((x - radius) // size), 0), self.columns - 1),
+                min(max(int((y - radius) // size), 0), self.rows - 1),
+                min(max(int((x + radius) // size), 0), self.columns - 1),
+                min(max(int((y + radius) // size), 0), self.rows - 1))
+    
+    def update(self, key: Hashable, x: float, y: float, radius: float = 0):
+        """物体の位置を登録・更新（所属セルが変わらなければ何もしない）"""
+        cells = self.cell_range(x, y, radius)
+        previous = self._entries.get(key)
+        if previous == cells:
+            return
+        if previous is not None:
+            self._unlink(key, previous)
+        self._entries[key] = cells
+        x0, y0, x1, y1 = cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self._cells.setdefault((cx, cy), set()).add(key)
+    
+    def remove(self, key: Hashable):
+        """物体の登録を解除"""
+        cells = self._entries.pop(key, None)
+        if cells is not None:
+            self._unlink(key, cells)
+    
+    def sync(self, items: Iterable[Tuple[Hashable, float, float, float]]):
+        """
+        今フレームの物体一覧で登録内容を更新（一覧にない物体は登録解除）
+        
+        Args:
+            items: (キー, x, y, 半径) の列
+        """
+        present = set()
+        for key, x, y, radius in items:
+            self.update(key, x, y, radius)
+            present.add(key)
+        for key in [key for key in self._entries if key not in present]:
+            self.remove(key)
+    
+    def clear(self):
+        """全登録を解除"""
+        self._cells.clear()
+        self._entries.clear()
+    
+    def query(self, x: float, y: float, radius: float) -> Set[Hashable]:
+        """円 (x, y, radius) と同じセルに登録されている物体のキー（狭域判定の候補）"""
+        collision_stats.queries += 1
+        if len(self._entries) <= self.brute_force_limit:
+            collision_stats.brute_force += 1
+            candidates = set(self._entries)
+        else:
+            candidates = set()
+            x0, y0, x1, y1 = self.cell_range(x, y, radius)
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    keys = self._cells.get((cx, cy))
+                    if keys:
+                        candidates |= keys
+        collision_stats.candidates += len(candidates)
+        return candidates
+    
+    def query_points(self, xs: np.ndarray, ys: np.ndarray, x: float, y: float, radius: float) -> np.ndarray:
+        """
+        配列で渡した点のうち、円 (x, y, radius) と同じセルにある点のマスク（敵弾のように毎フレーム全点が動く場合用）
+        点のセル番号を配列演算でまとめて求めるため、登録・解除は行わない
+        """
+        collision_stats.queries += 1
+        if len(xs) <= self.brute_force_limit:
+            collision_stats.brute_force += 1
+            mask = np.ones(len(xs), dtype=bool)
+        else:
+            x0, y0, x1, y1 = self.cell_range(x, y, radius)
+            cx = np.clip(xs // self.cell_size, 0, self.columns - 1)
+            cy = np.clip(ys // self.cell_size, 0, self.rows - 1)
+            mask = (cx >= x0) & (cx <= x1) & (cy >= y0) & (cy <= y1)
+        collision_stats.candidates += int(np.count_nonzero(mask))
+        return mask
+    
+    def _unlink(self, key: Hashable, cells: Tuple[int, int, int, int]):
+        """セル範囲からキーを外す（空になったセルは削除）"""
+        x0, y0, x1, y1 = cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                keys = self._cells.get((cx, cy))
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._cells[(cx, cy)]
@@ -0,0 +1,67 @@
+"""
+スプライトキャッシュ
+毎フレーム同じ形で描き直している図形を一度だけSurfaceへ描画して使い回す
+"""
+import pygame
+from typing import Callable, Hashable
+
+
+class SpriteCache:
+    """
+    キー → 描画済みSurface のキャッシュ
+    キーには描画結果を決める値（半径・色状態など）だけを含める
+    """
+    
+    def __init__(self):
+        self._sprites = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Hashable, builder: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """キャッシュ済みSurfaceを取得（未作成ならbuilderで作成して登録）"""
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            self.misses += 1
+            sprite = builder()
+            self._sprites[key] = sprite
+        else:
+            self.hits += 1
+        return sprite
+    
+    def discard(self, predicate: Callable[[Hashable], bool]):
+        """条件に一致するキーのSurfaceを破棄"""
+        for key in [key for key in self._sprites if predicate(key)]:
+            del self._sprites[key]
+    
+    def clear(self):
+        """全Surfaceを破棄"""
+        self._sprites.clear()
+    
+    def __len__(self) -> int:
+        return len(self._sprites)
+    
+    @staticmethod
+    def create_surface(width: int, height: int) -> pygame.Surface:
+        """透過付きの空Surfaceを作成（画面があれば表示形式に変換）"""
+        surface = pygame.Surface((max(1, width), max(1, height)), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        surface.fill((0, 0, 0, 0))
+        return surface
+    
+    @staticmethod
+    def create_keyed_surface(width: int, height: int, colorkey=(255, 0, 255)) -> pygame.Surface:
+        """
+        カラーキー透過の空Surfaceを作成（不透明な単色図形向け、RLEで高速にblitできる）
+        colorkeyの色は図形に使わないこと
+        """
+        surface = pygame.Surface((max(1, width), max(1, height)))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(colorkey)
+        surface.set_colorkey(colorkey, pygame.RLEACCEL)
+        return surface
+
+
+# ゲーム全体で共有するスプライトキャッシュ
+sprite_cache = SpriteCache()
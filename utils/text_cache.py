@@ -0,0 +1,96 @@
+"""
+テキスト描画キャッシュ
+font.renderの結果を (font, text, color, antialias) 単位で保持し、
+文字列が変わった時だけグリフをラスタライズする
+"""
+import pygame
+from collections import OrderedDict
+
+
+class TextCache:
+    """
+    LRU方式のテキストSurfaceキャッシュ
+    返すSurfaceは共有されるため、呼び出し側で書き換えないこと
+    """
+    
+    def __init__(self, max_entries: int = 256, max_bytes: int = 4 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._surfaces = OrderedDict()
+        self.bytes = 0        # 保持しているSurfaceのピクセルバイト数
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.uncached = 0     # キャッシュを通さずに描画した回数（毎フレーム変わる文字列）
+    
+    def render(self, font: pygame.font.Font, text: str, color, antialias: bool = True,
+               cache: bool = True) -> pygame.Surface:
+        """
+        font.render(text, antialias, color) のキャッシュ付き版
+        cache=Falseなら保持せずに描画する（数値が毎フレーム変わるデバッグ表示などで、使い捨ての
+        Surfaceが安定した文字列を追い出さないようにするため）
+        """
+        if not cache:
+            self.uncached += 1
+            return font.render(text, antialias, color)
+        
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        self.bytes += self._surface_bytes(surface)
+        
+        # 件数・容量の上限を超えたら最も古く使われたものから破棄（直近の1件は残す）
+        while len(self._surfaces) > 1 and (len(self._surfaces) > self.max_entries
+                                           or self.bytes > self.max_bytes):
+            _, evicted = self._surfaces.popitem(last=False)
+            self.bytes -= self._surface_bytes(evicted)
+            self.evictions += 1
+        
+        return surface
+    
+    @property
+    def hit_rate(self) -> float:
+        """ヒット率（0.0 - 1.0）"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+    
+    def get_stats(self) -> dict:
+        """統計情報を取得"""
+        return {
+            'entries': len(self._surfaces),
+            'bytes': self.bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'uncached': self.uncached,
+            'hit_rate': self.hit_rate,
+        }
+    
+    def clear(self):
+        """全エントリを破棄（統計は保持）"""
+        self._surfaces.clear()
+        self.bytes = 0
+    
+    def __len__(self) -> int:
+        return len(self._surfaces)
+    
+    @staticmethod
+    def _surface_bytes(surface: pygame.Surface) -> int:
+        return surface.get_height() * surface.get_pitch()
+
+
+# ゲーム全体で共有するテキストキャッシュ
+text_cache = TextCache()
+
+
+def render_text(font: pygame.font.Font, text: str, color, antialias: bool = True,
+                cache: bool = True) -> pygame.Surface:
+    """共有キャッシュ経由でテキストを描画したSurfaceを取得（cache=Falseなら毎回描画して保持しない）"""
+    return text_cache.render(font, text, color, antialias, cache)
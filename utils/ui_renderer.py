@@ -3,7 +3,171 @@ UI描画システム - 元のUI.pdeを完全再現
 オリジナルのハート描画、ブロック描画システムを忠実に再現
 """
 import pygame
+from typing import Optional
 from config.settings import GameConfig, Colors
+from utils.text_cache import render_text
+
+
+class BakedBackground:
+    """
+    HSBブロック背景の焼き込みキャッシュ
+    (H_rnd, S_rnd, B_rnd)グリッドを一度だけSurfaceへ変換し、毎フレームは1回のblitで描画する
+    グリッドが差し替えられた時（generate_animated_background等）のみ再構築する
+    """
+    
+    def __init__(self, br: float = 10):
+        self.br = br
+        self.surface: Optional[pygame.Surface] = None
+        self.source = None   # 焼き込み元のグリッド (H_rnd, S_rnd, B_rnd)
+        self.version = 0     # 再構築のたびに増加
+    
+    def is_stale(self, grids: tuple) -> bool:
+        """グリッドが焼き込み済みのものと異なるか"""
+        return self.surface is None or self.source is not grids
+    
+    def rebuild(self, grids: tuple):
+        """グリッドからSurfaceを再構築"""
+        from core.presenter import display_presenter
+        display_presenter.mark_full('background')
+        
+        if self.surface is None:
+            self.surface = self._create_surface()
+        
+        H_rnd, S_rnd, B_rnd = grids
+        UIRenderer().scene_bg(self.surface, H_rnd, S_rnd, B_rnd)
+        
+        self.source = grids
+        self.version += 1
+        self._invalidate_scaled()
+    
+    def render(self, screen: pygame.Surface, grids: tuple):
+        """焼き込み済み背景を描画（必要なら再構築）"""
+        if self.is_stale(grids):
+            self.rebuild(grids)
+        screen.blit(self.surface, (0, 0))
+    
+    def repaint_cells(self, grids: tuple, cell_rects: list):
+        """
+        指定セル範囲のみ再描画（グリッドがその場で書き換えられた場合）
+        cell_rects: [(x0, y0, x1, y1), ...] セル単位の半開区間
+        """
+        if self.is_stale(grids):
+            self.rebuild(grids)
+            return
+        
+        from utils.color_utils import ProcessingColorConverter
+        from core.presenter import display_presenter
+        H_rnd, S_rnd, B_rnd = grids
+        for x0, y0, x1, y1 in cell_rects:
+            if x1 <= x0 or y1 <= y0:
+                continue
+            blocks = ProcessingColorConverter.hsb_grid_to_surface(
+                H_rnd[x0:x1, y0:y1], S_rnd[x0:x1, y0:y1], B_rnd[x0:x1, y0:y1], self.br)
+            # 背景は画面原点に描画するので、Surface上の矩形がそのまま画面上の変化範囲
+            display_presenter.mark(self.surface.blit(blocks, (x0 * self.br, y0 * self.br)))
+        self.version += 1
+        self._invalidate_scaled()
+    
+    def invalidate(self):
+        """次回描画時に再構築させる"""
+        self.source = None
+    
+    def _invalidate_scaled(self):
+        """Surfaceをその場で書き換えたことを通知（コマンドの比較と内部解像度用の縮小版のため）"""
+        from utils.render_commands import touch_surface
+        touch_surface(self.surface)
+    
+    @staticmethod
+    def _create_surface() -> pygame.Surface:
+        """画面と同じピクセル形式の不透明Surfaceを作成"""
+        surface = pygame.Surface((GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
+
+class BushAnimation:
+    """
+    シーン1の茂みアニメーション（元のdraw_bush関数）の差分更新版
+    全グリッドを複製せず、前回茂みが塗ったセルだけをH_bg/S_bg/B_bgから復元し、
+    今回の茂みセルだけを再抽選する。変更したセル範囲はBakedBackground.repaint_cellsに渡す
+    """
+    
+    BUSH = 20   # 元: int bush=20;
+    RADIUS = 9  # 元: float r=9;
+    
+    def __init__(self, base_bg_data: tuple):
+        import numpy as np
+        H_bg, S_bg, B_bg = base_bg_data
+        self.base = (np.array(H_bg, dtype=np.int32),
+                     np.array(S_bg, dtype=np.int32),
+                     np.array(B_bg, dtype=np.int32))
+        # 作業用グリッド（このタプル自体は差し替えず、中身のみ更新する）
+        self.grids = tuple(grid.copy() for grid in self.base)
+        self.bush_rects = []   # 前回の各茂みのセル範囲 (x0, y0, x1, y1)
+    
+    def update(self) -> list:
+        """
+        茂みを1回揺らす
+        
+        Returns:
+            list: 再描画が必要なセル範囲 [(x0, y0, x1, y1), ...]
+        """
+        import numpy as np
+        H_rnd, S_rnd, B_rnd = self.grids
+        H_bg, S_bg, B_bg = self.base
+        w_br, h_br = H_rnd.shape
+        r = self.RADIUS
+        
+        # 前回の茂みセルをベースに復元（元: H_rnd[i][j]=H_bg[i][j];）
+        for x0, y0, x1, y1 in self.bush_rects:
+            H_rnd[x0:x1, y0:y1] = H_bg[x0:x1, y0:y1]
+            S_rnd[x0:x1, y0:y1] = S_bg[x0:x1, y0:y1]
+            B_rnd[x0:x1, y0:y1] = B_bg[x0:x1, y0:y1]
+        
+        offsets = np.arange(-r, r)
+        new_rects = []
+        for i in range(self.BUSH):
+            # 元: bush_posx[i]=i%5*30+15+(int)random(2)-1;
+            bush_posx = (i % 5) * 30 + 15 + int(np.random.random() * 2) - 1
+            bush_posy = (i // 5) * 30 + 10 + int(np.random.random() * 2) - 1
+            if 4 < i < 10:
+                bush_posx = (i % 5) * 30 + 15 - 15 + int(np.random.random() * 2) - 1
+            
+            x0 = max(bush_posx - r, 0)
+            y0 = max(bush_posy - r, 0)
+            x1 = min(bush_posx + r, w_br)
+            y1 = min(bush_posy + r, h_br)
+            if x1 <= x0 or y1 <= y0:
+                new_rects.append((0, 0, 0, 0))
+                continue
+            
+            # 元: if(dist(xr+random(2)-1,yr+random(2)-1,bush_posx[i],bush_posy[i])<r)
+            dx = offsets[x0 - bush_posx + r:x1 - bush_posx + r, None] + np.random.random((x1 - x0, y1 - y0)) * 2 - 1
+            dy = offsets[None, y0 - bush_posy + r:y1 - bush_posy + r] + np.random.random((x1 - x0, y1 - y0)) * 2 - 1
+            inside = dx * dx + dy * dy < r * r
+            
+            # 茂みの色（緑系）で上書き
+            count = int(inside.sum())
+            H_rnd[x0:x1, y0:y1][inside] = 120 + np.random.randint(0, 5, count) - 25
+            S_rnd[x0:x1, y0:y1][inside] = np.random.randint(0, 5, count) + 5 + 10
+            B_rnd[x0:x1, y0:y1][inside] = 70 + np.random.randint(0, 5, count) + 10
+            new_rects.append((x0, y0, x1, y1))
+        
+        # 前回と今回の範囲の和を再描画対象とする
+        dirty = []
+        for i, (x0, y0, x1, y1) in enumerate(new_rects):
+            if i < len(self.bush_rects):
+                px0, py0, px1, py1 = self.bush_rects[i]
+                if px1 > px0 and py1 > py0:
+                    if x1 > x0 and y1 > y0:
+                        x0, y0, x1, y1 = min(x0, px0), min(y0, py0), max(x1, px1), max(y1, py1)
+                    else:
+                        x0, y0, x1, y1 = px0, py0, px1, py1
+            dirty.append((x0, y0, x1, y1))
+        
+        self.bush_rects = new_rects
+        return dirty
 
 
 class UIRenderer:
@@ -17,13 +181,32 @@ class UIRenderer:
         """
         プレイヤーハート描画（元のdraw_player_heart関数を完全再現）
         オリジナル: void draw_player_heart(int n)
+        31個のrectは描画済みスプライトにまとめ、毎フレームは1回のblitで済ませる
         """
         # 元のコード: float r=15; float xr=r; float x=10+n*(7*r+10); float y=10;
         r = 15
-        xr = r
         x = 10 + n * (7 * r + 10)
         y = 10
         
+        screen.blit(self._get_heart_sprite(), (x, y))
+    
+    @staticmethod
+    def _get_heart_sprite() -> pygame.Surface:
+        """ハート1個分の描画済みスプライトを取得（左上が元の(x, y)）"""
+        from utils.sprite_cache import sprite_cache
+        return sprite_cache.get(('player_heart',), UIRenderer._build_heart_sprite)
+    
+    @staticmethod
+    def _build_heart_sprite() -> pygame.Surface:
+        """ハートのrect群を原点基準でスプライトへ描画"""
+        from utils.sprite_cache import SpriteCache
+        
+        r = 15
+        xr = r
+        x = 0
+        y = 0
+        sprite = SpriteCache.create_keyed_surface(r * 7, r * 7)
+        
         # HSB色設定（元: colorMode(HSB,360,100,100); fill(0,70,100);）
         # HSB(0,70,100) → 赤色
         color = Colors.RED  # 赤色でハートを描画
@@ -72,7 +255,8 @@ class UIRenderer:
         
         # 全てのrectを描画
         for rect_x, rect_y, rect_w, rect_h in rects + right_rects:
-            pygame.draw.rect(screen, color, (rect_x, rect_y, rect_w, rect_h))
+            pygame.draw.rect(sprite, color, (rect_x, rect_y, rect_w, rect_h))
+        return sprite
     
     def player_HP(self, screen: pygame.Surface, player_hp: int, scene: list):
         """
@@ -94,14 +278,44 @@ class UIRenderer:
         HP_range = range_val * HP / MAX_HP
         
         # 元: stroke(1); fill(0,255,0); rect(x,y-range/5,HP_range,100/5);
-        green_rect = pygame.Rect(x, y - range_val/5, HP_range, 100/5)
-        pygame.draw.rect(screen, (0, 255, 0), green_rect)
-        pygame.draw.rect(screen, (0, 0, 0), green_rect, 1)  # stroke(1)
-        
         # 元: fill(255,0,0); rect(x+HP_range,y-range/5,range-HP_range,100/5);
-        red_rect = pygame.Rect(x + HP_range, y - range_val/5, range_val - HP_range, 100/5)
-        pygame.draw.rect(screen, (255, 0, 0), red_rect)
-        pygame.draw.rect(screen, (0, 0, 0), red_rect, 1)  # stroke(1)
+        self.draw_bar(screen, (
+            ((x, y - range_val/5, HP_range, 100/5), (0, 255, 0), True),
+            ((x + HP_range, y - range_val/5, range_val - HP_range, 100/5), (255, 0, 0), True),
+        ))
+    
+    @staticmethod
+    def draw_bar(screen: pygame.Surface, segments: tuple):
+        """
+        バー（塗りつぶし矩形の組）をキャッシュ済みスプライトで描画
+        segments: ((rect, color, stroke), ...) 画面座標。strokeがTrueなら黒の1px枠（元: stroke(1)）
+        矩形を整数化した後の相対配置でスプライトを共有するため、pygame.draw.rectと同じ画素になる
+        """
+        from utils.sprite_cache import sprite_cache
+        
+        rects = [pygame.Rect(rect) for rect, _, _ in segments]
+        origin_x = min(rect.x for rect in rects)
+        origin_y = min(rect.y for rect in rects)
+        layout = tuple(
+            (rect.x - origin_x, rect.y - origin_y, rect.w, rect.h, tuple(color), stroke)
+            for rect, (_, color, stroke) in zip(rects, segments)
+        )
+        sprite = sprite_cache.get(('bar', layout), lambda: UIRenderer._build_bar_sprite(layout))
+        screen.blit(sprite, (origin_x, origin_y))
+    
+    @staticmethod
+    def _build_bar_sprite(layout: tuple) -> pygame.Surface:
+        """相対配置の矩形群を元と同じ順序で描画したスプライトを作成"""
+        from utils.sprite_cache import SpriteCache
+        
+        width = max(x + w for x, _, w, _, _, _ in layout) + 1
+        height = max(y + h for _, y, _, h, _, _ in layout) + 1
+        sprite = SpriteCache.create_keyed_surface(width, height)
+        for x, y, w, h, color, stroke in layout:
+            pygame.draw.rect(sprite, color, (x, y, w, h))
+            if stroke:
+                pygame.draw.rect(sprite, (0, 0, 0), (x, y, w, h), 1)
+        return sprite
     
     def show_enemy_HP(self, screen: pygame.Surface, enemy_x: float, enemy_y: float, 
                      max_hp: float, current_hp: float, range_val: float, scene: list):
@@ -123,7 +337,7 @@ class UIRenderer:
         元: void show_demage(float x,float y,float d)
         """
         # 元: textSize(30); fill(255,0,0); text(-abs((int)d),x+100,y+20);
-        damage_text = font.render(str(-abs(int(d))), True, (255, 0, 0))
+        damage_text = render_text(font, str(-abs(int(d))), (255, 0, 0))
         screen.blit(damage_text, (x + 100, y + 20))
         
         # hit_timerの管理は呼び出し側で行う（元: hit_timer++; if(hit_timer>90){ hit=false; hit_timer=0; }）
@@ -274,15 +488,13 @@ class UIRenderer:
         w_br = int(GameConfig.SCREEN_WIDTH / self.br) + 1
         h_br = int(GameConfig.SCREEN_HEIGHT / self.br) + 1
         
-        for i in range(min(len(H_rnd), w_br)):
-            for j in range(min(len(H_rnd[i]), h_br)):
-                # 元: fill(H_rnd[i][j],S_rnd[i][j],B_rnd[i][j]); rect(br*i,br*j,br,br);
-                h = H_rnd[i][j] % 360
-                s = S_rnd[i][j] % 100
-                b = B_rnd[i][j] % 100
-                
-                rgb_color = self._hsb_to_rgb(h, s, b)
-                pygame.draw.rect(screen, rgb_color, (self.br * i, self.br * j, self.br, self.br))
+        # 元: fill(H_rnd[i][j],S_rnd[i][j],B_rnd[i][j]); rect(br*i,br*j,br,br);
+        # 全セルを一括変換（h%360, s%100, b%100 の規則は_hsb_to_rgb経由の描画と同一）
+        from utils.color_utils import ProcessingColorConverter
+        H = [row[:h_br] for row in H_rnd[:w_br]]
+        S = [row[:h_br] for row in S_rnd[:w_br]]
+        B = [row[:h_br] for row in B_rnd[:w_br]]
+        ProcessingColorConverter.blit_hsb_grid(screen, H, S, B, self.br)
     
     def draw_bush_animated(self, H_bg: list, S_bg: list, B_bg: list) -> tuple:
         """